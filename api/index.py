@@ -1,14 +1,22 @@
 import os
 import json
-import requests
+import time
+import asyncio
+import hashlib
+import functools
+import logging
+from datetime import datetime
 from typing import Optional, Dict
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
 from dotenv import load_dotenv
 
+# flask_utils 가 import 시점에 환경변수를 읽으므로 먼저 로드
+load_dotenv()
+
 from flask_utils import *
 
-load_dotenv()
+log = get_logger("api")
 
 # static 설정을 명시
 # app = Flask(__name__, static_folder="static", static_url_path="/static")
@@ -23,45 +31,52 @@ app = Flask(
 # Notion 설정 (환경변수)
 # =========================
 NOTION_API_KEY = os.getenv("NOTION_API_KEY")
-NOTION_NOTIFICATION_DB = os.getenv("NOTION_NOTIFICATION_DB")
-NOTION_ANON_DB = os.getenv("NOTION_ANON_DB")
-NOTION_BASE = "https://api.notion.com/v1"
-NOTION_VERSION = "2022-06-28"  # 안정적인 버전 고정
 
-def _simplify_page(page: dict) -> dict:
+# 게시판 이름 → DB id (검색 결과 / 필터에 쓰는 이름). 게시판 정의는 board_registry (BOARDS_CONFIG)
+BOARDS = board_registry.db_map()
+
+# 로컬 SQLite 복제본 (BOARD_REPLICA_PATH 설정 시에만 동작, 게시판별 sync_interval 주기)
+if board_replica:
+    board_replica.start(board_registry.sync_intervals())
+
+def _rich_text_plain(arr) -> str:
+    return "".join([r.get("plain_text", "") for r in arr or []])
+
+# writer 프로퍼티 타입별 추출기 (row마다 if/elif 분기 대신 한 번 조회)
+_WRITER_EXTRACTORS = {
+    "people": lambda p: ", ".join([x.get("name", "") for x in p.get("people", [])]),
+    "multi_select": lambda p: ", ".join([x.get("name", "") for x in p.get("multi_select", [])]),
+    "rich_text": lambda p: _rich_text_plain(p.get("rich_text")),
+    "select": lambda p: (p.get("select") or {}).get("name", ""),
+}
+
+def _simplify_page(page: dict, schema: Dict[str, str] = DEFAULT_SCHEMA) -> dict:
     """
-    notificationDB 스키마에 맞춰 title / writer / date를 추출.
+    게시판 schema(Board.schema)의 property 이름에 맞춰 title / writer / date를 추출.
     - title: title 프로퍼티의 plain_text
     - writer: people / multi_select / rich_text / select 등 대응
     - date: date.start (ISO 형태 문자열)
+    - 응답에서 필드를 줄이려면 project_items (lean / fields=) 사용
     """
     props = page.get("properties", {})
 
     # --- title ---
     title = ""
-    t_prop = props.get("title")
+    t_prop = props.get(schema["title"])
     if isinstance(t_prop, dict) and isinstance(t_prop.get("title"), list):
-        title = "".join([r.get("plain_text", "") for r in t_prop["title"]])
+        title = _rich_text_plain(t_prop["title"])
 
     # --- writer ---
     writer = ""
-    w_prop = props.get("writer")
+    w_prop = props.get(schema["writer"])
     if isinstance(w_prop, dict):
-        ptype = w_prop.get("type")
-        if ptype == "people":
-            writer = ", ".join([p.get("name", "") for p in w_prop.get("people", [])])
-        elif ptype == "multi_select":
-            writer = ", ".join([p.get("name", "") for p in w_prop.get("multi_select", [])])
-        elif ptype == "rich_text":
-            writer = "".join([r.get("plain_text", "") for r in w_prop.get("rich_text", [])])
-        elif ptype == "select":
-            sel = w_prop.get("select")
-            if sel:
-                writer = sel.get("name", "")
+        extract = _WRITER_EXTRACTORS.get(w_prop.get("type"))
+        if extract:
+            writer = extract(w_prop)
 
     # --- date ---
     date = ""
-    d_prop = props.get("date")
+    d_prop = props.get(schema["date"])
     if isinstance(d_prop, dict) and isinstance(d_prop.get("date"), dict):
         date = d_prop["date"].get("start") or ""
 
@@ -77,42 +92,83 @@ def _simplify_page(page: dict) -> dict:
     }
 
 
+# route별 요청 시간 / 오류 수 (/metrics)
+install_request_metrics(app)
+
+# 요청 단위 access 로그 (LOG_LEVEL=DEBUG 일 때만 hook 등록 → 평소엔 비용 없음)
+if log.is_enabled(logging.DEBUG):
+    @app.before_request
+    def _access_log_start():
+        request.environ["app.started"] = time.perf_counter()
+
+    @app.after_request
+    def _access_log(resp):
+        started = request.environ.get("app.started", time.perf_counter())
+        log.debug(
+            "request",
+            method=request.method,
+            path=request.path,
+            status=resp.status_code,
+            ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+        return resp
+
+
+# =========================
+# 정적 자산 (python -m flask_utils.assets 로 빌드)
+# =========================
+@app.context_processor
+def _asset_helpers():
+    return {"asset_url": asset_url, "import_map_tag": import_map_tag}
+
+
+@app.route("/static/dist/<path:filename>")
+def static_dist(filename):
+    return send_asset(filename)
+
+
+# SPA 진입 HTML은 요청별 context가 없으므로 렌더 결과(bytes / gzip / ETag)를 캐시
+shell_cache = ShellCache(render_template, app.jinja_loader.searchpath[0])
+with app.app_context():
+    shell_cache.warm("login.html", "index.html")
+
+
 # =========================
 # 기본 라우트
 # =========================
 @app.route("/")
 def home():
-    print("\n[ROUTE] '/' → login.html 렌더")
-    print(f"  request.path={request.path}, method={request.method}")
-    return render_template("login.html")
+    return shell_cache.respond("login.html")
 
 
 @app.route("/login.html")
 def login_html():
-    print("\n[ROUTE] '/login.html' 렌더")
-    print(f"  request.path={request.path}, method={request.method}")
-    return render_template("login.html")
+    return shell_cache.respond("login.html")
 
 
 @app.route("/login", methods=["POST"])
 def login():
-    print("\n[ROUTE] '/login' POST 요청")
     payload = request.get_json(force=True)
-    print("  payload:", payload)
 
     user_id = (payload.get("id") or "").strip()
     user_pw = (payload.get("pw") or "").strip()
-    print(f"  입력 ID={user_id}, PW={user_pw}")
-
     if not user_id or not user_pw:
-        print("  → 실패: ID/PW 빈값")
+        log.info("로그인 실패", reason="empty")
         return jsonify({"success": False, "reason": "ID/PW required"})
 
-    parsed, raw = query_user_by_credentials(user_id, user_pw)
-    print("  query_user_by_credentials 결과:", parsed)
-
-    if parsed and parsed["ID"] == user_id and parsed["PW"] == user_pw:
-        print("  → 로그인 성공, main 페이지로 이동")
+    # 로컬 사용자 인덱스(스냅샷)에서 먼저 검증 → 색인에 없는 ID일 때만 Notion 조회
+    # (비밀번호를 Notion에서 바꾼 경우 다음 백그라운드 갱신 전까지는 이전 비밀번호로 검증)
+    user_index.ensure_fresh()
+    parsed = user_index.authenticate(user_id, user_pw)
+    if parsed is None and not user_index.knows(user_id):
+        parsed, raw = query_user_by_credentials(user_id, user_pw)
+        if parsed and parsed["ID"] == user_id and parsed["PW"] == user_pw:
+            user_index.add(raw["results"][0])
+        else:
+            parsed = None
+
+    if parsed:
+        log.info("로그인 성공", user_id=user_id)
         return jsonify({
             "success": True,
             "user_name": parsed["user_name"],
@@ -120,229 +176,710 @@ def login():
             "page_id":  parsed["page_id"]
         })
 
-    print("  → 로그인 실패 (401)")
+    log.info("로그인 실패", reason="mismatch", user_id=user_id)
     return jsonify({"success": False, "reason": "mismatch"}), 401
 
 
 @app.route("/main")
 def main_page():
-    print("\n[ROUTE] '/main' 요청 → index.html 렌더")
-    print(f"  request.path={request.path}, method={request.method}")
-    return render_template("index.html")
+    return shell_cache.respond("index.html")
 
 
 @app.route("/health")
 def health():
-    print("\n[ROUTE] '/health' OK")
     return jsonify(ok=True)
 
+
+@app.route("/cacheStats")
+def cache_stats():
+    """게시판별 목록 캐시의 hit/miss 카운터 (TTL / 크기 튜닝용) + SPA HTML 렌더 횟수 + 게시글 카운터 / 검색 색인 크기"""
+    return jsonify(
+        boards=board_registry.stats(),
+        board_owners=board_registry.owner_count(),
+        shell=shell_cache.stats(),
+        counters=post_counters.stats(),
+        search=search_index.stats(),
+    )
+
+
+@app.route("/notionStats")
+def notion_stats():
+    """Notion 아웃바운드 스케줄러(대기열 / 대기 시간 / 재시도), single-flight, 백그라운드 쓰기 작업 / 변경 피드 통계"""
+    return jsonify(
+        scheduler=notion_scheduler.stats(),
+        singleflight=notion_client.singleflight.stats(),
+        likes=like_aggregator.stats(),
+        comment_db_provisioner=comment_db_provisioner.stats(),
+        idempotency=idempotency_store.stats(),
+        write_journal=write_journal.stats() if write_journal else None,
+        change_feed=change_feed.stats(),
+    )
+
+
+@app.route("/metrics")
+def metrics():
+    """route / Notion endpoint별 지연 히스토그램과 오류 카운터 (Prometheus text format)"""
+    return Response(metrics_registry.render(), mimetype="text/plain; version=0.0.4")
+
 # ==========================
 # 노션 라우트 관련
 # ==========================
 
-@app.route("/getNotificationDB", methods=["POST"])
-def get_notification_db():
+def _client_query():
     """
-    Notion Notification DB를 조회하여 반환.
-    - Body에 Notion Query(JSON)를 그대로 전달하면 필터/정렬/페이징을 지원.
-      예: {"page_size": 10,
-           "sorts":[{"timestamp":"last_edited_time","direction":"descending"}]}
-    - Body가 없으면 기본 쿼리로 전체 조회(페이징은 Notion 기본값).
+    목록 라우트의 Notion 쿼리 추출.
+    - POST: JSON body 그대로
+    - GET: page_size / start_cursor 쿼리스트링, sorts / filter 는 JSON 문자열
+    잘못된 JSON이거나 JSON 객체가 아니면 None
+    """
+    if request.method == "POST":
+        body = request.get_json(silent=True) or {}
+        return body if isinstance(body, dict) else None
+
+    args = request.args
+    query = {}
+    if args.get("page_size"):
+        query["page_size"] = args.get("page_size", type=int)
+    if args.get("start_cursor"):
+        query["start_cursor"] = args["start_cursor"]
+    for key in ("sorts", "filter"):
+        if args.get(key):
+            try:
+                query[key] = json.loads(args[key])
+            except ValueError:
+                return None
+    return query
+
+
+def _projection(client_query: dict = None):
+    """
+    응답 필드 projection 파라미터 추출 (?lean=1 / ?fields=like,text).
+    POST body의 "lean" / "fields"는 Notion으로 넘기지 않도록 제거.
+    반환: None(전체) | tuple(lean + 지정 property)
     """
-    if not NOTION_NOTIFICATION_DB:
-        return jsonify(success=False, reason="NOTION_NOTIFICATION_DB is not set"), 500
+    lean, fields = request.args.get("lean"), request.args.get("fields")
+    if client_query is not None and request.method == "POST":
+        lean = client_query.pop("lean", lean)
+        fields = client_query.pop("fields", fields)
+    return parse_projection(lean, fields)
 
-    client_query = request.get_json(silent=True) or {}
-    data, err = notion_query_database(NOTION_NOTIFICATION_DB, client_query)
 
+def _conditional_json(etag: str, build_body):
+    """
+    ETag 기반 조건부 응답.
+    If-None-Match가 일치하면 body를 만들지(직렬화하지) 않고 304 반환.
+    """
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+    else:
+        resp = jsonify(build_body())
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
+
+
+def _fetch_listing(board: Board, client_query: dict, priority: int = PRIORITY_INTERACTIVE):
+    """로컬 복제본 / Notion에서 목록 한 페이지 조회 → ({has_more, next_cursor, items} | None, error | None)"""
+    data = None
+    if board_replica and board_replica.is_ready(board.db_id):
+        data = board_replica.query_board(board.db_id, client_query)
+    if data is None:
+        data, err = notion_query_database(board.db_id, client_query, priority=priority)
+        if err:
+            return None, err
+
+    board_registry.remember(board, [p["id"] for p in data.get("results", [])])
+    return {
+        "has_more": data.get("has_more", False),
+        "next_cursor": data.get("next_cursor"),
+        "items": [_simplify_page(p, board.schema) for p in data.get("results", [])],
+    }, None
+
+
+def _prefetch_listing(board: Board, client_query: dict, listing: dict, depth: int):
+    """
+    다음 커서 페이지를 background 레인으로 미리 조회해 게시판 캐시에 저장 (depth장까지 이어서).
+    이미 캐시에 있거나 캐시할 수 없는 쿼리면 중단
+    """
+    if depth <= 0 or not (listing["has_more"] and listing["next_cursor"]):
+        return
+    next_query = {**client_query, "start_cursor": listing["next_cursor"]}
+    query_key = normalize_query(next_query)
+    if query_key is None or board.cache.contains((board.db_id, query_key)):
+        return
+
+    def prefetch():
+        generation = board.cache.generation
+        next_listing, err = _fetch_listing(board, next_query, priority=PRIORITY_BACKGROUND)
+        if err:
+            log.debug("목록 선조회 실패", board=board.name, error=err)
+            return
+        if board.cache.set((board.db_id, query_key), next_listing, generation=generation):
+            _prefetch_listing(board, client_query, next_listing, depth - 1)
+
+    notion_executor.submit(prefetch)
+
+
+def _query_board(board: Board, client_query: dict):
+    """
+    게시판 DB 목록 조회 (게시판별 read-through 캐시).
+    - 정규화된 쿼리 바디를 키로 board.cache 조회 → miss면 로컬 복제본 / Notion 조회 후 저장
+      (조회 도중 쓰기로 캐시가 비워졌으면 저장하지 않음 → 쓰기 이전 목록이 TTL 동안 남지 않음)
+    - board.prefetch_depth > 0이면 miss 후 다음 페이지들을 미리 캐시에 채움
+    반환: ({has_more, next_cursor, items} | None, error | None)
+    """
+    query_key = normalize_query(client_query)
+    cache_key = (board.db_id, query_key)
+    if query_key is not None:
+        cached = board.cache.get(cache_key)
+        if cached is not None:
+            return _listing_view(cached), None
+
+    generation = board.cache.generation
+    listing, err = _fetch_listing(board, client_query)
     if err:
-        # Notion 에러를 그대로 detail에 전달
-        return jsonify(success=False, reason="notion_query_failed", detail=err), 502
+        return None, err
+    if query_key is not None and board.cache.set(cache_key, listing, generation=generation):
+        _prefetch_listing(board, client_query, listing, board.prefetch_depth)
+    return _listing_view(listing), None
 
-    results = data.get("results", [])
-    simplified = [_simplify_page(p) for p in results]
 
-    return jsonify(
-        success=True,
-        has_more=data.get("has_more", False),
-        next_cursor=data.get("next_cursor"),
-        items=simplified
-    ), 200
+def _listing_view(listing: dict) -> dict:
+    """
+    캐시된 목록 → 응답용 목록.
+    - 삭제 요청이 저널에 대기 중인 게시글은 미리 제외
+    - item마다 댓글 / 좋아요 카운터("counts") 병합 (Notion 추가 호출 X)
+    """
+    items = listing["items"]
+    archived = _pending_archives()
+    if archived:
+        items = [it for it in items if it["id"] not in archived]
+    return {**listing, "items": post_counters.merge(items)}
+
+
+def _invalidate_boards(*written_ids: str, archived_id: str = None):
+    """
+    게시글/댓글 쓰기 성공 후 호출.
+    - written_ids(쓴 게시판 DB / 게시글 / 댓글 DB / 댓글 row id)와 archived_id가 속한 게시판의 목록 캐시만 즉시 비우기
+      (소속을 모르는 id가 있으면 모든 게시판)
+    - archive된 게시글 / 댓글을 카운터 / 검색 색인에서 제외 + 변경 피드로 알림
+    - 로컬 복제본에 archive 반영 + 다음 동기화 앞당기기
+    """
+    board_registry.clear_caches([i for i in written_ids + (archived_id,) if i])
+    if archived_id:
+        post_counters.row_archived(archived_id)
+        search_index.remove(archived_id)
+        change_feed.publish({"type": "archived", "action": "archived", "id": archived_id})
+    if board_replica:
+        if archived_id:
+            board_replica.mark_archived(archived_id)
+        board_replica.request_sync()
+
+
+def _replica_record(db_id: str, page: dict):
+    """
+    방금 쓴 게시글 / 댓글 row(Notion 응답)를 복제본에 바로 저장 (다음 동기화를 기다리지 않음).
+    row의 게시판 소속도 기억 (이후 이 row를 삭제 / 좋아요할 때 그 게시판 캐시만 비움)
+    """
+    board_registry.remember(board_registry.owner(db_id), [page.get("id")])
+    if board_replica:
+        board_replica.record_page(db_id, page)
+
+
+def _on_comment_db_ready(page_id: str, db_id: str):
+    """백그라운드에서 댓글 DB가 생기면 목록 캐시 / 복제본(게시글 본문 → 새 댓글 DB 로드)도 갱신"""
+    board_registry.remember(board_registry.owner(page_id), [db_id])
+    if board_replica:
+        board_replica.touch(page_ids=[page_id])
+    _invalidate_boards(page_id)
+
+
+comment_db_provisioner.on_ready = _on_comment_db_ready
 
-@app.route("/getAnonDB", methods=["POST"])
-def get_anon_db():
+
+def _on_likes_patched(page: dict):
+    """좋아요 PATCH 응답(row)을 복제본에 바로 반영"""
+    _replica_record((page.get("parent") or {}).get("database_id"), page)
+
+
+like_aggregator.on_patched = _on_likes_patched
+
+
+def _on_write_applied(entry: dict, result: dict):
+    """쓰기 저널 항목이 Notion에 반영된 뒤 (동기 쓰기 라우트의 성공 후 처리와 동일)"""
+    if entry["kind"] == "archive":
+        _invalidate_boards(archived_id=entry["target"])
+        return
+    # target: add_comment는 댓글 DB, create_post는 게시판 DB
+    _invalidate_boards(entry["target"])
+    if entry["kind"] == "add_comment":
+        _replica_record(entry["target"], result)
+        post_counters.comment_added(entry["target"], result)
+        search_index.add_comment(entry["target"], _search_comment(result))
+        change_feed.comment_changed(entry["target"], result, "created")
+    if entry["kind"] == "create_post":
+        children = entry["body"].get("children") or []
+        body = children[0]["paragraph"]["rich_text"][0]["text"]["content"] if children else ""
+        _replica_record(entry["target"], result)
+        _index_post(result, body)
+        _publish_post(result)
+        comment_db_provisioner.enqueue(result["id"])
+
+
+# 로컬 쓰기 저널 (WRITE_JOURNAL_PATH 설정 시에만 동작, 재시작 시 남은 쓰기부터 반영)
+if write_journal:
+    write_journal.on_applied = _on_write_applied
+    write_journal.start()
+
+
+def _queue_write(kind: str, target: str, method: str, path: str, body: dict, dedupe_key: str = None, **extra):
+    """
+    쓰기 저널이 켜져 있으면 기록만 하고 (응답 body, 202) 반환 → Notion 반영은 백그라운드에서 target별 순서대로.
+    꺼져 있으면 None → 호출한 라우트가 기존처럼 Notion에 동기 호출
+    """
+    if not write_journal:
+        return None
+    write_id, _ = write_journal.append(kind, target, method, path, body, dedupe_key)
+    return {"success": True, "queued": True, "write_id": write_id, **extra}, 202
+
+
+def _pending_archives() -> set:
+    """저널에 대기 중인 삭제(archive) 대상 id"""
+    if not write_journal:
+        return set()
+    return {e["target"] for e in write_journal.pending("archive")}
+
+
+def _pending_comment_row(entry: dict) -> dict:
     """
-    Notion Anon DB를 조회하여 반환.
+    저널에 대기 중인 addComment → 댓글 row 형태.
+    id는 temp- 접두사 (프론트엔드가 임시 댓글의 좋아요 / 삭제 버튼을 막는 규칙과 동일)
+    """
+    props = entry["body"]["properties"]
+    plain = lambda arr: [{**r, "plain_text": r["text"]["content"]} for r in arr]
+    created = datetime.fromtimestamp(entry["created_at"]).astimezone().isoformat()
+    return {
+        "id": f"temp-{entry['id']}",
+        "created_time": created,
+        "last_edited_time": created,
+        "archived": False,
+        "properties": {
+            "subWriter": {"type": "title", "title": plain(props["subWriter"]["title"])},
+            "text": {"type": "rich_text", "rich_text": plain(props["text"]["rich_text"])},
+            "like": {"type": "multi_select", "multi_select": []},
+        },
+    }
+
+
+def _board_list(board: Board):
+    """
+    /get{route}DB: 게시판 DB를 조회하여 반환.
     - Body에 Notion Query(JSON)를 그대로 전달하면 필터/정렬/페이징을 지원.
       예: {"page_size": 10,
            "sorts":[{"timestamp":"last_edited_time","direction":"descending"}]}
     - Body가 없으면 기본 쿼리로 전체 조회(페이징은 Notion 기본값).
+    - GET: ?page_size=&start_cursor=&sorts=<JSON>&filter=<JSON> (브라우저 / CDN 캐시용)
+    - lean=1 / fields=like,text: id/title/writer/date/last_edited_time + 지정 property만 반환
+    - item.counts: {comments, likes, comment_likes, last_activity} (카운터 인덱스, 아직 모르면 null)
+    - ETag 응답, If-None-Match 일치 시 304
     """
-    if not NOTION_ANON_DB:
-        return jsonify(success=False, reason="NOTION_ANON_DB is not set"), 500
+    if not board.db_id:
+        return jsonify(success=False, reason=f"{board.db_id_env} is not set"), 500
 
-    client_query = request.get_json(silent=True) or {}
-    data, err = notion_query_database(NOTION_ANON_DB, client_query)
+    client_query = _client_query()
+    if client_query is None:
+        return jsonify(success=False, reason="invalid query"), 400
+    projection = _projection(client_query)
+    # counts는 재색인이 채움 → 아직 시작하지 않았으면 여기서 시작 (상세 조회 없이도 다음 목록부터 채워짐)
+    _start_reindex()
+    listing, err = _query_board(board, client_query)
 
     if err:
         # Notion 에러를 그대로 detail에 전달
         return jsonify(success=False, reason="notion_query_failed", detail=err), 502
 
-    results = data.get("results", [])
-    simplified = [_simplify_page(p) for p in results]
+    return _conditional_json(
+        listing_etag(listing, projection),
+        lambda: {"success": True, **listing, "items": project_items(listing["items"], projection)},
+    )
 
-    return jsonify(
-        success=True,
-        has_more=data.get("has_more", False),
-        next_cursor=data.get("next_cursor"),
-        items=simplified
-    ), 200
+def _stream_board(board: Board, client_query: dict, projection=None):
+    """
+    게시판 전체를 NDJSON으로 스트리밍.
+    - 서버에서 next_cursor를 따라가며 단순화된 item을 한 줄씩 바로 내보냄
+    - 현재 페이지를 쓰는 동안 다음 커서 페이지를 워커 풀에서 미리 조회
+    - 마지막 줄: {"success": true, "done": true, "count": N} (실패 시 success=false 줄)
+    """
+    def generate():
+        count = 0
+        future = notion_executor.submit(_query_board, board, client_query)
+        while future is not None:
+            listing, err = future.result()
+            if err:
+                failure = {"success": False, "reason": "notion_query_failed", "detail": err}
+                yield json.dumps(failure) + "\n"
+                return
+
+            future = None
+            if listing["has_more"] and listing["next_cursor"]:
+                next_query = {**client_query, "start_cursor": listing["next_cursor"]}
+                future = notion_executor.submit(_query_board, board, next_query)
+
+            for item in project_items(listing["items"], projection):
+                yield json.dumps(item, ensure_ascii=False) + "\n"
+            count += len(listing["items"])
+
+        yield json.dumps({"success": True, "done": True, "count": count}) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+def _board_stream(board: Board):
+    """
+    /stream{route}DB: 게시판 DB 전체를 NDJSON 스트림으로 반환.
+    - Body는 /get{route}DB 와 동일 (page_size는 서버 → Notion 한 번에 가져올 개수, lean / fields 지원)
+    """
+    if not board.db_id:
+        return jsonify(success=False, reason=f"{board.db_id_env} is not set"), 500
 
-@app.route("/getNotificationPage/<page_id>", methods=["GET"])
-def get_notification_page(page_id):
+    client_query = request.get_json(silent=True) or {}
+    if not isinstance(client_query, dict):
+        return jsonify(success=False, reason="invalid query"), 400
+    projection = _projection(client_query)
+    client_query.setdefault("page_size", 100)
+    return _stream_board(board, client_query, projection)
+
+@app.route("/dashboard", methods=["GET"])
+def dashboard():
     """
-    ✅ Notion Notification Page 전체 구조 조회
-    - 메타데이터 + 본문 블록 + 하위 댓글용 DB 내용까지 포함
+    메인 화면용: 게시판별({board 이름: [...]}) 최근 수정 상위 N개(?limit=, 기본 3)를 한 번에 반환.
+    - 모든 게시판을 워커 풀에서 동시에 조회 (목록 캐시 / 복제본 공유)
+    - parseCommunityDB가 쓰는 title / writer / date만 포함
+    - ETag + Cache-Control: no-cache → 브라우저가 If-None-Match로 재검증 (변경 없으면 304)
     """
-    if not NOTION_API_KEY:
-        return jsonify(success=False, reason="NOTION_API_KEY not set"), 500
+    limit = min(max(request.args.get("limit", 3, type=int), 1), 20)
+    query = {
+        "page_size": limit,
+        "sorts": [{"timestamp": "last_edited_time", "direction": "descending"}],
+    }
+    futures = [
+        (board.name, notion_executor.submit(_query_board, board, query))
+        for board in board_registry
+        if board.db_id
+    ]
 
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
+    body = {"success": True}
+    for name, future in futures:
+        listing, err = future.result()
+        if err:
+            return jsonify(success=False, reason="notion_query_failed", board=name, detail=err), 502
+        body[name] = [
+            {"title": it["title"], "writer": it["writer"], "date": it["date"]}
+            for it in listing["items"]
+        ]
+
+    payload = json.dumps(body, ensure_ascii=False, sort_keys=True)
+    resp = Response(payload, mimetype="application/json")
+    resp.set_etag(hashlib.sha1(payload.encode("utf-8")).hexdigest())
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
+
+@app.route("/search", methods=["GET"])
+def search():
+    """
+    게시판 게시글(제목 / 본문)과 댓글 검색 (로컬 색인, Notion 호출 X).
+    - ?q=검색어 (필수, 공백으로 나눈 단어를 모두 포함하는 문서만)
+    - ?board=게시판 이름(notification|anon|...), ?kind=post|comment, ?limit= (기본 20, 최대 50)
+    - results[]: id / kind / board / post_id / title / writer / date / score / field / snippet / highlights
+      highlights: snippet 안에서 일치한 [start, end) 구간
+    """
+    q = (request.args.get("q") or "").strip()
+    board = request.args.get("board") or None
+    kind = request.args.get("kind") or None
+    if not q:
+        return jsonify(success=False, reason="missing q"), 400
+    if board is not None and board not in BOARDS:
+        return jsonify(success=False, reason="unknown board"), 400
+    if kind not in (None, "post", "comment"):
+        return jsonify(success=False, reason="unknown kind"), 400
+    limit = min(max(request.args.get("limit", 20, type=int), 1), 50)
+
+    # 재색인을 아직 시작하지 않았으면 여기서 시작 (끝나기 전까지는 상세 조회로 색인된 게시글만 검색됨)
+    _start_reindex()
+    started = time.perf_counter()
+    found = search_index.search(q, board=board, kind=kind, limit=limit)
+    took_ms = round((time.perf_counter() - started) * 1000, 3)
+    return jsonify(success=True, query=q, took_ms=took_ms, indexing=search_index.reindexes == 0, **found)
+
+
+@app.route("/events", methods=["GET"])
+def events():
+    """
+    게시글 / 댓글 / 좋아요 변경 SSE 스트림 (EventSource).
+    - event: post | comment | likes | archived | reset(놓친 이벤트가 너무 많음 → 전체 새로고침)
+    - data: {action, board, id, post_id, ...}
+    - Notion 조회는 프로세스당 poller 1개가 하고, 모든 연결은 같은 이벤트를 나눠 받음
+    - Last-Event-ID로 재접속하면 놓친 이벤트부터 / ?timeout=초 로 연결 유지 시간 단축 가능
+    """
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    max_seconds = min(request.args.get("timeout", FEED_STREAM_MAX_SECONDS, type=float), FEED_STREAM_MAX_SECONDS)
+    resp = Response(
+        stream_with_context(change_feed.stream(last_event_id, max_seconds)),
+        mimetype="text/event-stream",
+    )
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
+
+
+def extract_text(block):
+    """블록의 rich_text를 plain_text 문자열로 합쳐서 반환"""
+    block_type = block.get("type")
+    block_content = block.get(block_type, {})
+    texts = block_content.get("rich_text", [])
+    return "".join([t.get("plain_text", "") for t in texts])
+
+
+def _simplify_block(block: dict) -> dict:
+    """본문 블록 단순화 (하위 블록은 children으로 재귀)"""
+    simplified = {"id": block["id"], "type": block["type"], "text": extract_text(block)}
+    if block.get("children"):
+        simplified["children"] = [_simplify_block(c) for c in block["children"]]
+    return simplified
+
+
+def _with_pending_likes(page: dict) -> dict:
+    """아직 Notion에 반영되지 않은 좋아요 토글을 댓글 row에 덮어씀"""
+    names = like_aggregator.current(page.get("id"))
+    if names is None or "like" not in page.get("properties", {}):
+        return page
+    props = dict(page["properties"])
+    props["like"] = {**props["like"], "multi_select": [{"name": n} for n in names]}
+    return {**page, "properties": props}
+
+
+def _build_page_detail(page: dict, blocks: list, comment_dbs: list, truncated: bool = False) -> dict:
+    """
+    원본 페이지 / 블록 트리 / [(db_id, db_name, rows)] → 상세 응답 형태로 단순화.
+    쓰기 저널에 대기 중인 댓글 추가 / 삭제는 댓글 목록에 미리 반영.
+    이미 받아 온 원본으로 게시글 카운터 / 검색 색인 / 변경 피드 감시 목록도 갱신
+    """
+    _observe_post(page, blocks, comment_dbs)
+    if write_journal:
+        archived = _pending_archives()
+        added = write_journal.pending("add_comment")
+        comment_dbs = [
+            (
+                db_id, db_name,
+                [_pending_comment_row(e) for e in reversed(added) if e["target"] == db_id]
+                + [r for r in rows if r.get("id") not in archived],
+            )
+            for db_id, db_name, rows in comment_dbs
+        ]
+    board = board_registry.for_page(page)
+    return {
+        "page": _simplify_page(page, board.schema if board else DEFAULT_SCHEMA),
+        "blocks": [_simplify_block(b) for b in blocks],
+        "blocks_truncated": truncated,
+        "comment_dbs": [
+            {
+                "db_id": db_id,
+                "db_name": db_name,
+                "items": [_simplify_page(_with_pending_likes(p)) for p in rows],
+            }
+            for db_id, db_name, rows in comment_dbs
+        ],
+        # 새 글의 commentSubDB가 아직 생성 중이면 True (댓글 / 좋아요 입력은 잠시 후 가능)
+        "comment_db_pending": not comment_dbs,
     }
 
-    # 1️⃣ 기본 페이지 정보
-    page_url = f"{NOTION_BASE}/pages/{page_id}"
-    page_resp = requests.get(page_url, headers=headers)
-    if page_resp.status_code != 200:
-        return jsonify(success=False, detail=page_resp.text), page_resp.status_code
 
-    page_data = page_resp.json()
-    simplified_page = _simplify_page(page_data)
+def _project_detail(detail: dict, projection) -> dict:
+    """상세 응답의 게시글 / 댓글 row에 projection 적용"""
+    if projection is None:
+        return detail
+    return {
+        **detail,
+        "page": project_items([detail["page"]], projection)[0],
+        "comment_dbs": [
+            {**db, "items": project_items(db["items"], projection)} for db in detail["comment_dbs"]
+        ],
+    }
+
 
-    # 2️⃣ 1차 블록(children)
-    blocks_url = f"{NOTION_BASE}/blocks/{page_id}/children?page_size=100"
-    blocks_resp = requests.get(blocks_url, headers=headers)
-    if blocks_resp.status_code != 200:
-        return jsonify(success=False, detail=blocks_resp.text), blocks_resp.status_code
+# =========================
+# 검색 색인 (flask_utils/search.py)
+# =========================
+def _board_name(page: dict) -> Optional[str]:
+    """게시글의 parent DB → 게시판 이름"""
+    board = board_registry.for_page(page)
+    return board.name if board else None
 
-    blocks_data = blocks_resp.json().get("results", [])
 
-    # --- 텍스트 추출 함수 ---
-    def extract_text(block):
-        block_type = block.get("type")
-        block_content = block.get(block_type, {})
-        texts = block_content.get("rich_text", [])
-        return "".join([t.get("plain_text", "") for t in texts])
+def _blocks_text(blocks: list) -> str:
+    """본문 블록 트리 → extract_text 결과를 줄 단위로 합친 텍스트"""
+    lines = []
+    for b in blocks:
+        lines.append(extract_text(b))
+        if b.get("children"):
+            lines.append(_blocks_text(b["children"]))
+    return "\n".join(line for line in lines if line)
 
-    # 3️⃣ 댓글 DB 탐색
-    comment_dbs = []
-    for b in blocks_data:
-        if b.get("type") == "child_database":
-            db_id = b.get("id")
-            db_name = b.get("child_database", {}).get("title", "")
-            print(f"[댓글 DB 감지] {db_name} ({db_id})")
-
-            db_query_url = f"{NOTION_BASE}/databases/{db_id}/query"
-            db_resp = requests.post(db_query_url, headers=headers, json={})
-            if db_resp.status_code == 200:
-                db_results = db_resp.json().get("results", [])
-                db_simplified = [_simplify_page(p) for p in db_results]
-                comment_dbs.append({
-                    "db_id": db_id,
-                    "db_name": db_name,
-                    "items": db_simplified
-                })
-            else:
-                print(f"[댓글 DB 오류] {db_resp.text}")
 
-    # 4️⃣ 본문 블록 단순화
-    simplified_blocks = [
-        {"id": b["id"], "type": b["type"], "text": extract_text(b)}
-        for b in blocks_data
-    ]
+def _search_comment(row: dict) -> dict:
+    props = row.get("properties", {})
+    return {
+        "id": row["id"],
+        "text": _rich_text_plain((props.get("text") or {}).get("rich_text")),
+        "writer": _rich_text_plain((props.get("subWriter") or {}).get("title")),
+        "date": (row.get("created_time") or "")[:10],
+    }
+
+
+def _index_post(page: dict, body: str, comments: list = (), comment_db_ids: list = (), signature=None):
+    board = board_registry.for_page(page)
+    if board is None:
+        return
+    simple = _simplify_page(page, board.schema)
+    search_index.sync_post(
+        {"id": page["id"], "board": board.name, "title": simple["title"], "body": body,
+         "writer": simple["writer"], "date": simple["date"]},
+        comments, comment_db_ids, signature,
+    )
 
-    return jsonify(
-        success=True,
-        page=simplified_page,
-        blocks=simplified_blocks,
-        comment_dbs=comment_dbs,
-    ), 200
 
-@app.route("/getAnonPage/<page_id>", methods=["GET"])
-def get_anon_page(page_id):
+def _publish_post(page: dict):
+    """이 서버에서 만든 게시글 → 변경 피드 (poller가 같은 버전을 다시 보내지 않음)"""
+    board = _board_name(page)
+    if board:
+        change_feed.publish(post_event(page, board, "created"), page)
+
+
+def _search_sync(page: dict, blocks: list, comment_dbs: list):
     """
-    ✅ Notion Anon Page 전체 구조 조회
-    - 메타데이터 + 본문 블록 + 하위 댓글용 DB 내용까지 포함
+    원본 게시글 / 본문 블록 / [(db_id, db_name, rows)] → 검색 색인 교체.
+    (상세 조회 / 백그라운드 재색인 공용, 원본 버전이 같으면 search_index가 건너뜀)
     """
-    if not NOTION_API_KEY:
-        return jsonify(success=False, reason="NOTION_API_KEY not set"), 500
+    rows = [r for _, _, db_rows in comment_dbs for r in db_rows if not r.get("archived")]
+    comments = [c for c in map(_search_comment, rows) if c["writer"] != LIKE_ROW_WRITER]
+    signature = (page.get("last_edited_time"), tuple((r["id"], r.get("last_edited_time")) for r in rows))
+    _index_post(page, _blocks_text(blocks), comments, [db_id for db_id, _, _ in comment_dbs], signature)
 
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
-    }
+
+def _observe_post(page: dict, blocks: list, comment_dbs: list):
+    """
+    원본 게시글 / 본문 / 댓글을 받아 올 때마다 (상세 조회 / 백그라운드 재색인) 로컬 인덱스 갱신.
+    - 게시글 카운터, 검색 색인, 변경 피드의 댓글 DB 감시 목록
+    """
+    board_registry.remember(
+        board_registry.for_page(page),
+        [page.get("id")] + [i for db_id, _, rows in comment_dbs for i in [db_id] + [r["id"] for r in rows]],
+    )
+    post_counters.observe(page.get("id"), [(db_id, rows) for db_id, _, rows in comment_dbs])
+    _search_sync(page, blocks, comment_dbs)
+    board = _board_name(page)
+    if board:
+        for db_id, _, _ in comment_dbs:
+            change_feed.watch_comment_db(db_id, page["id"], board)
+
+
+def _start_reindex():
+    """재색인 스레드 시작 (이미 시작했으면 무시)"""
+    search_index.start(BOARDS, _observe_post)
+
+
+# SEARCH_REINDEX_INTERVAL마다 전체 재색인 (그 사이에는 상세 조회 / 쓰기 라우트로 증분).
+# 게시글 카운터도 재색인이 읽은 댓글로 다시 계산하고, 끝나면 삭제된 게시글을 정리 (별도 크롤링 X).
+# SEARCH_REINDEX_ON_START가 꺼져 있으면(서버리스 기본) 첫 목록 / /search 요청 때 시작
+search_index.on_reindexed = post_counters.retain
+if SEARCH_REINDEX_ON_START:
+    _start_reindex()
+# 변경 피드: 첫 /events 구독 때 poller 시작
+change_feed.watch_boards(BOARDS)
+
+
+def _with_comment_db(page_id: str, detail: dict) -> dict:
+    """commentSubDB가 없는 게시글(생성 직후 / 프로비저닝 실패)은 백그라운드 생성을 다시 요청"""
+    if detail["comment_db_pending"]:
+        comment_db_provisioner.enqueue(page_id)
+    return detail
+
+
+async def _load_page_detail(page_id: str):
+    """
+    페이지 상세(메타데이터 + 본문 블록 트리 + 댓글 DB)를 조회.
+    - 로컬 복제본에 있으면 그대로 사용
+    - 페이지 메타데이터 조회와 본문 블록 트리 로딩을 동시에 진행
+    - 최상위 블록을 받는 즉시 child_database마다 댓글 DB 쿼리를 한 번에 발송
+    - Notion 호출은 모두 비동기 (워커 스레드를 점유하지 않고 동시에 대기)
+    반환: (응답 dict | None, (detail, status) | None)
+    """
+    if board_replica:
+        local = board_replica.page_detail(page_id)
+        if local is not None:
+            # 조회된 게시글의 댓글 DB는 다음 사이클에 증분 동기화 (댓글 DB 전체를 매번 훑지 않음)
+            board_replica.touch(comment_db_ids=[db_id for db_id, _, _ in local["comment_dbs"]])
+            return _with_comment_db(page_id, _build_page_detail(
+                local["page"], local["blocks"], local["comment_dbs"], local["truncated"]
+            )), None
 
     # 1️⃣ 기본 페이지 정보
-    page_url = f"{NOTION_BASE}/pages/{page_id}"
-    page_resp = requests.get(page_url, headers=headers)
-    if page_resp.status_code != 200:
-        return jsonify(success=False, detail=page_resp.text), page_resp.status_code
+    page_task = asyncio.ensure_future(notion_client.aget(f"pages/{page_id}"))
 
-    page_data = page_resp.json()
-    simplified_page = _simplify_page(page_data)
+    # 3️⃣ 댓글 DB 탐색 → 최상위 블록이 오면 모든 쿼리를 한 번에 발송
+    pending = []
 
-    # 2️⃣ 1차 블록(children)
-    blocks_url = f"{NOTION_BASE}/blocks/{page_id}/children?page_size=100"
-    blocks_resp = requests.get(blocks_url, headers=headers)
-    if blocks_resp.status_code != 200:
-        return jsonify(success=False, detail=blocks_resp.text), blocks_resp.status_code
+    def submit_comment_queries(roots):
+        for b in roots:
+            if b.get("type") == "child_database":
+                db_id = b.get("id")
+                db_name = b.get("child_database", {}).get("title", "")
+                log.debug("댓글 DB 감지", page_id=page_id, db_id=db_id, title=db_name)
+                pending.append((db_id, db_name, asyncio.ensure_future(anotion_query_all(db_id))))
 
-    blocks_data = blocks_resp.json().get("results", [])
+    try:
+        # 2️⃣ 본문 블록 트리 (커서 + has_children 재귀)
+        blocks_data, truncated, blocks_err = await aload_block_tree(page_id, on_roots=submit_comment_queries)
+        page_resp = await page_task
+        comment_results = await asyncio.gather(*[task for _, _, task in pending])
+    finally:
+        for task in [page_task] + [task for _, _, task in pending]:
+            task.cancel()
 
-    # --- 텍스트 추출 함수 ---
-    def extract_text(block):
-        block_type = block.get("type")
-        block_content = block.get(block_type, {})
-        texts = block_content.get("rich_text", [])
-        return "".join([t.get("plain_text", "") for t in texts])
+    if page_resp.status_code != 200:
+        return None, (page_resp.text, page_resp.status_code)
+    if blocks_err is not None:
+        return None, (blocks_err.text, blocks_err.status_code)
 
-    # 3️⃣ 댓글 DB 탐색
     comment_dbs = []
-    for b in blocks_data:
-        if b.get("type") == "child_database":
-            db_id = b.get("id")
-            db_name = b.get("child_database", {}).get("title", "")
-            print(f"[댓글 DB 감지] {db_name} ({db_id})")
-
-            db_query_url = f"{NOTION_BASE}/databases/{db_id}/query"
-            db_resp = requests.post(db_query_url, headers=headers, json={})
-            if db_resp.status_code == 200:
-                db_results = db_resp.json().get("results", [])
-                db_simplified = [_simplify_page(p) for p in db_results]
-                comment_dbs.append({
-                    "db_id": db_id,
-                    "db_name": db_name,
-                    "items": db_simplified
-                })
-            else:
-                print(f"[댓글 DB 오류] {db_resp.text}")
+    for (db_id, db_name, _), (rows, err) in zip(pending, comment_results):
+        if err is None:
+            comment_dbs.append((db_id, db_name, rows))
+        else:
+            log.warning("댓글 DB 조회 실패", page_id=page_id, db_id=db_id, error=err)
 
     # 4️⃣ 본문 블록 단순화
-    simplified_blocks = [
-        {"id": b["id"], "type": b["type"], "text": extract_text(b)}
-        for b in blocks_data
-    ]
+    return _with_comment_db(page_id, _build_page_detail(page_resp.json(), blocks_data, comment_dbs, truncated)), None
 
-    return jsonify(
-        success=True,
-        page=simplified_page,
-        blocks=simplified_blocks,
-        comment_dbs=comment_dbs,
-    ), 200
+
+async def _board_page(board: Board, page_id: str):
+    """
+    ✅ /get{route}Page/<page_id>: 게시글 전체 구조 조회
+    - 메타데이터 + 본문 블록 + 하위 댓글용 DB 내용까지 포함
+    - 게시글 / 댓글 row의 last_edited_time 기반 ETag, If-None-Match 일치 시 304
+    - lean=1 / fields=like,text: 게시글과 댓글 row에 projection 적용
+    """
+    if not NOTION_API_KEY:
+        return jsonify(success=False, reason="NOTION_API_KEY not set"), 500
+
+    projection = _projection()
+    detail, err = await _load_page_detail(page_id)
+    if err:
+        return jsonify(success=False, detail=err[0]), err[1]
+
+    return _conditional_json(
+        page_detail_etag(detail, projection),
+        lambda: dict(success=True, **_project_detail(detail, projection)),
+    )
 
 @app.route("/togglePostLike", methods=["POST"])
 def toggle_post_like():
@@ -354,44 +891,14 @@ def toggle_post_like():
     if not (db_id and row_id and user):
         return jsonify(success=False, reason="missing fields"), 400
 
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
-    }
-
-    # 먼저 해당 row 가져오기
-    page_url = f"{NOTION_BASE}/pages/{row_id}"
-    page_resp = requests.get(page_url, headers=headers)
-    if page_resp.status_code != 200:
-        return jsonify(success=False, detail=page_resp.text), 500
-
-    page_data = page_resp.json()
-    like_list = page_data["properties"]["like"]["multi_select"]
+    # 기본은 row를 읽고 바로 PATCH (LIKE_WRITE_BEHIND=1이면 로컬 상태에 토글 → debounce 후 반영)
+    names, failed = like_aggregator.toggle(row_id, user)
+    if failed is not None:
+        return jsonify(success=False, detail=failed.text), 500
+    post_counters.likes_changed(row_id, len(names), comment_db_id=db_id)
+    change_feed.likes_changed(row_id, len(names), comment_db_id=db_id)
 
-    # toggle
-    names = [x["name"] for x in like_list]
-    if user in names:
-        # 제거
-        new_list = [x for x in like_list if x["name"] != user]
-    else:
-        # 추가
-        new_list = like_list + [{"name": user}]
-
-    # 업데이트
-    update_payload = {
-        "properties": {
-            "like": {
-                "multi_select": new_list
-            }
-        }
-    }
-    update_resp = notion_update_page(row_id, update_payload)
-
-    if update_resp.status_code != 200:
-        return jsonify(success=False, detail=update_resp.text), 500
-
-    return jsonify(success=True, likes=new_list), 200
+    return jsonify(success=True, likes=[{"name": n} for n in names]), 200
 
 @app.route("/toggleCommentLike", methods=["POST"])
 def toggle_comment_like():
@@ -402,41 +909,14 @@ def toggle_comment_like():
     if not (row_id and user):
         return jsonify(success=False, reason="missing fields"), 400
 
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
-    }
-
-    # row 조회
-    page_url = f"{NOTION_BASE}/pages/{row_id}"
-    page_resp = requests.get(page_url, headers=headers)
-    if page_resp.status_code != 200:
-        return jsonify(success=False, detail=page_resp.text), 500
-
-    page_data = page_resp.json()
-    like_list = page_data["properties"]["like"]["multi_select"]
-    names = [x["name"] for x in like_list]
+    # 기본은 row를 읽고 바로 PATCH (LIKE_WRITE_BEHIND=1이면 로컬 상태에 토글 → debounce 후 반영)
+    names, failed = like_aggregator.toggle(row_id, user)
+    if failed is not None:
+        return jsonify(success=False, detail=failed.text), 500
+    post_counters.likes_changed(row_id, len(names))
+    change_feed.likes_changed(row_id, len(names))
 
-    # toggle
-    if user in names:
-        new_list = [x for x in like_list if x["name"] != user]
-    else:
-        new_list = like_list + [{"name": user}]
-
-    update_payload = {
-        "properties": {
-            "like": {
-                "multi_select": new_list
-            }
-        }
-    }
-
-    update_resp = notion_update_page(row_id, update_payload)
-    if update_resp.status_code != 200:
-        return jsonify(success=False, detail=update_resp.text), 500
-
-    return jsonify(success=True, likes=new_list), 200
+    return jsonify(success=True, likes=[{"name": n} for n in names]), 200
 
 @app.route("/deleteComment", methods=["POST"])
 def delete_comment():
@@ -450,11 +930,16 @@ def delete_comment():
         "archived": True
     }
 
+    queued = _queue_write("archive", row_id, "PATCH", f"pages/{row_id}", update_payload)
+    if queued:
+        return jsonify(queued[0]), queued[1]
+
     resp = notion_update_page(row_id, update_payload)
 
     if resp.status_code != 200:
         return jsonify(success=False, detail=resp.text), 500
 
+    _invalidate_boards(archived_id=row_id)
     return jsonify(success=True), 200
 
 @app.route("/addComment", methods=["POST"])
@@ -467,11 +952,6 @@ def add_comment():
     if not (db_id and writer and content):
         return jsonify(success=False, reason="missing fields"), 400
 
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
-    }
 
     create_payload = {
         "parent": {"database_id": db_id},
@@ -488,29 +968,37 @@ def add_comment():
         }
     }
 
-    url = f"{NOTION_BASE}/pages"
-    resp = requests.post(url, headers=headers, json=create_payload)
+    # 댓글 DB 단위로 순서 보장 (created는 반영 후에야 알 수 있으므로 null)
+    queued = _queue_write("add_comment", db_id, "POST", "pages", create_payload, created=None)
+    if queued:
+        return jsonify(queued[0]), queued[1]
+
+    resp = notion_client.post("pages", json=create_payload)
 
     if resp.status_code != 200:
         return jsonify(success=False, detail=resp.text), 500
 
-    return jsonify(success=True, created=resp.json()), 200
+    created = resp.json()
+    _replica_record(db_id, created)
+    post_counters.comment_added(db_id, created)
+    search_index.add_comment(db_id, _search_comment(created))
+    change_feed.comment_changed(db_id, created, "created")
+    _invalidate_boards(db_id)
+    return jsonify(success=True, created=created), 200
 
-@app.route("/deleteNotification/<page_id>", methods=["POST"])
-def delete_notification(page_id):
+def _board_delete(board: Board, page_id: str):
+    """/delete{route}/<page_id>: 게시글 삭제"""
     try:
-        url = f"{NOTION_BASE}/pages/{page_id}"
-        headers = {
-            "Authorization": f"Bearer {NOTION_API_KEY}",
-            "Notion-Version": NOTION_VERSION,
-            "Content-Type": "application/json"
-        }
-
         # Notion은 "삭제"가 아닌 archiving 방식 사용
         payload = {"archived": True}
 
-        res = requests.patch(url, headers=headers, data=json.dumps(payload))
+        queued = _queue_write("archive", page_id, "PATCH", f"pages/{page_id}", payload)
+        if queued:
+            return jsonify(queued[0]), queued[1]
+
+        res = notion_client.patch(f"pages/{page_id}", json=payload)
         if res.status_code == 200:
+            _invalidate_boards(archived_id=page_id)
             return jsonify({"success": True})
 
         return jsonify({
@@ -522,248 +1010,118 @@ def delete_notification(page_id):
     except Exception as e:
         return jsonify({"success": False, "reason": str(e)}), 500
 
-@app.route("/createNotification", methods=["POST"])
-def create_notification():
-    try:
-        data = request.json
-        title = data.get("title")
-        body = data.get("body")
-        writer = data.get("writer")
-
-        if not title or not writer:
-            return jsonify({"success": False, "reason": "missing fields"}), 400
-
-        # 오늘 날짜
-        from datetime import datetime
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        headers = {
-            "Authorization": f"Bearer {NOTION_API_KEY}",
-            "Notion-Version": NOTION_VERSION,
-            "Content-Type": "application/json"
-        }
-
-        # ------------------------------------------------------------
-        # 1) 공지 페이지 생성
-        # ------------------------------------------------------------
-        create_page_payload = {
-            "parent": {"database_id": NOTION_NOTIFICATION_DB},
-            "properties": {
-                "title": { "title": [{"text": {"content": title}}] },
-                "writer": {
-                    "select": {"name": writer}
-                },
-                "date": { "date": {"start": today} }
-            }
-        }
-
-        page_res = requests.post(
-            f"{NOTION_BASE}/pages",
-            headers=headers,
-            json=create_page_payload
+def _board_create(board: Board):
+    """
+    /create{route}: 게시글 생성 (Notion 동기 호출 1번).
+    - properties는 게시판 schema의 property 이름 / writer 타입에 맞춤
+    - 본문 paragraph는 페이지 생성 요청의 children으로 함께 전송
+    - commentSubDB는 comment_db_provisioner가 요청 경로 밖에서 생성
+    - Idempotency-Key 헤더가 같은 재요청은 첫 응답을 그대로 반환 (중복 게시글 X).
+      메모리에 첫 응답이 없으면(재시작 / 다른 인스턴스) 최근 IDEMPOTENCY_TTL 안에 같은 제목 / 작성자 / 날짜로
+      만들어진 글을 먼저 찾아 그 글로 응답
+    - 쓰기 저널이 켜져 있으면 기록 후 바로 202 (page_id는 반영 후 목록 / 상세에서 확인)
+    """
+    if not board.db_id:
+        return jsonify({"success": False, "reason": f"{board.db_id_env} is not set"}), 500
+
+    data = request.get_json(force=True) or {}
+    title = data.get("title")
+    body = data.get("body")
+    writer = data.get("writer")
+
+    if not title or not writer:
+        return jsonify({"success": False, "reason": "missing fields"}), 400
+
+    header_key = request.headers.get("Idempotency-Key")
+    scope = f"create{board.route}"
+    today = datetime.now().strftime("%Y-%m-%d")
+    create_page_payload = {
+        "parent": {"database_id": board.db_id},
+        "properties": board.post_properties(title, writer, today),
+    }
+    if body:
+        create_page_payload["children"] = [{
+            "object": "block",
+            "type": "paragraph",
+            "paragraph": {"rich_text": [{"type": "text", "text": {"content": body}}]},
+        }]
+
+    def created(page: dict):
+        page_id = page["id"]
+        idempotency_store.claim(page_id)
+        _replica_record(board.db_id, page)
+        _index_post(page, body or "")
+        _invalidate_boards(board.db_id)
+        # 이미 댓글 DB가 있으면 provisioner가 확인만 하고 끝냄
+        comment_db_provisioner.enqueue(page_id)
+        return {"success": True, "page_id": page_id, "comment_db_id": None, "comment_db_pending": True}, 200
+
+    def create():
+        # 저널 모드: Idempotency-Key를 저널에도 기록 → 재시작 후 재요청도 같은 write_id
+        queued = _queue_write(
+            "create_post", board.db_id, "POST", "pages", create_page_payload,
+            dedupe_key=f"{scope}:{header_key}" if header_key else None,
+            page_id=None, comment_db_id=None, comment_db_pending=True,
         )
-        page_json = page_res.json()
+        if queued:
+            return queued
 
+        page_res = notion_client.post("pages", json=create_page_payload)
         if page_res.status_code != 200:
-            return jsonify({"success": False, "detail": page_json}), 400
-
-        page_id = page_json["id"]
-
-        # ------------------------------------------------------------
-        # 2) (페이지 아래) 댓글 DB 생성
-        # ------------------------------------------------------------
-        create_db_payload = {
-            "parent": {"page_id": page_id},
-            "title": [{"type": "text", "text": {"content": "commentSubDB"}}],
-            "properties": {
-                "subWriter": {"title": {}},
-                "text": {"rich_text": {}},
-                "like": {"multi_select": {}}
-            }
-        }
+            return {"success": False, "detail": page_res.json()}, 400
 
-        db_res = requests.post(
-            f"{NOTION_BASE}/databases",
-            headers=headers,
-            json=create_db_payload
-        )
-        db_json = db_res.json()
-
-        if db_res.status_code != 200:
-            return jsonify({"success": False, "detail": db_json}), 400
-
-        # 댓글 DB 아이디
-        comment_db_id = db_json["id"]
-
-        # ------------------------------------------------------------
-        # 3) 공지 본문 paragraph block 추가
-        # ------------------------------------------------------------
-        block_payload = {
-            "children": [
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {"type": "text", "text": {"content": body}}
-                        ]
-                    }
-                }
-            ]
-        }
+        page = page_res.json()
+        _publish_post(page)
+        return created(page)
 
-        block_res = requests.patch(
-            f"{NOTION_BASE}/blocks/{page_id}/children",
-            headers=headers,
-            json=block_payload
+    def recover():
+        # 이전 시도(다른 인스턴스 / 재시작 전)가 이미 만든 글 확인. 다른 key의 결과로 확인된 글은 제외
+        page, failed = find_created_page(
+            notion_client, create_page_payload, time.time() - idempotency_store.ttl,
+            skip=idempotency_store.claimed,
         )
-        block_json = block_res.json()
-
-        if block_res.status_code != 200:
-            return jsonify({"success": False, "detail": block_json}), 400
-
-        # ------------------------------------------------------------
-        # 완료
-        # ------------------------------------------------------------
-        return jsonify({"success": True, "page_id": page_id, "comment_db_id": comment_db_id}), 200
+        if failed is not None:
+            # 확인하지 못한 채 다시 만들면 중복될 수 있음 → 실패 응답 (결과는 보관되지 않으므로 재시도 가능)
+            return {"success": False, "reason": "could not check for an earlier create", "detail": failed.text}, 503
+        if page is None:
+            return None
+        log.info("이전 요청에서 생성된 게시글 확인, 다시 만들지 않음", board=board.name, page_id=page["id"])
+        return created(page)
 
-    except Exception as e:
-        return jsonify({"success": False, "reason": str(e)}), 500
-
-@app.route("/deleteAnon/<page_id>", methods=["POST"])
-def delete_anon(page_id):
     try:
-        url = f"{NOTION_BASE}/pages/{page_id}"
-        headers = {
-            "Authorization": f"Bearer {NOTION_API_KEY}",
-            "Notion-Version": NOTION_VERSION,
-            "Content-Type": "application/json"
-        }
-
-        # Notion은 "삭제"가 아닌 archiving 방식 사용
-        payload = {"archived": True}
-
-        res = requests.patch(url, headers=headers, data=json.dumps(payload))
-        if res.status_code == 200:
-            return jsonify({"success": True})
-
-        return jsonify({
-            "success": False,
-            "reason": "notion_error",
-            "detail": res.json()
-        }), 400
-
+        result, status, replayed = idempotency_store.run(
+            (scope, header_key) if header_key else None, create,
+            # 저널 모드는 저널의 dedupe_key가 재시작 후에도 남아 있으므로 조회 불필요
+            recover=recover if write_journal is None else None,
+        )
     except Exception as e:
         return jsonify({"success": False, "reason": str(e)}), 500
 
-@app.route("/createAnon", methods=["POST"])
-def create_anon():
-    try:
-        data = request.json
-        title = data.get("title")
-        body = data.get("body")
-        writer = data.get("writer")
-
-        if not title or not writer:
-            return jsonify({"success": False, "reason": "missing fields"}), 400
-
-        # 오늘 날짜
-        from datetime import datetime
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        headers = {
-            "Authorization": f"Bearer {NOTION_API_KEY}",
-            "Notion-Version": NOTION_VERSION,
-            "Content-Type": "application/json"
-        }
+    resp = jsonify(result)
+    if replayed:
+        resp.headers["Idempotent-Replayed"] = "true"
+    return resp, status
 
-        # ------------------------------------------------------------
-        # 1) 공지 페이지 생성
-        # ------------------------------------------------------------
-        create_page_payload = {
-            "parent": {"database_id": NOTION_ANON_DB},
-            "properties": {
-                "title": { "title": [{"text": {"content": title}}] },
-                "writer": {
-                    "select": {"name": writer}
-                },
-                "date": { "date": {"start": today} }
-            }
-        }
 
-        page_res = requests.post(
-            f"{NOTION_BASE}/pages",
-            headers=headers,
-            json=create_page_payload
-        )
-        page_json = page_res.json()
-
-        if page_res.status_code != 200:
-            return jsonify({"success": False, "detail": page_json}), 400
-
-        page_id = page_json["id"]
-
-        # ------------------------------------------------------------
-        # 2) (페이지 아래) 댓글 DB 생성
-        # ------------------------------------------------------------
-        create_db_payload = {
-            "parent": {"page_id": page_id},
-            "title": [{"type": "text", "text": {"content": "commentSubDB"}}],
-            "properties": {
-                "subWriter": {"title": {}},
-                "text": {"rich_text": {}},
-                "like": {"multi_select": {}}
-            }
-        }
-
-        db_res = requests.post(
-            f"{NOTION_BASE}/databases",
-            headers=headers,
-            json=create_db_payload
-        )
-        db_json = db_res.json()
-
-        if db_res.status_code != 200:
-            return jsonify({"success": False, "detail": db_json}), 400
-
-        # 댓글 DB 아이디
-        comment_db_id = db_json["id"]
-
-        # ------------------------------------------------------------
-        # 3) 공지 본문 paragraph block 추가
-        # ------------------------------------------------------------
-        block_payload = {
-            "children": [
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {"type": "text", "text": {"content": body}}
-                        ]
-                    }
-                }
-            ]
-        }
+# =========================
+# 게시판 라우트 (board_registry의 게시판마다 생성, endpoint 이름: get_{name}_db 등)
+# =========================
+_BOARD_ROUTES = (
+    ("/get{route}DB", "get_{name}_db", _board_list, ["GET", "POST"]),
+    ("/stream{route}DB", "stream_{name}_db", _board_stream, ["POST"]),
+    ("/get{route}Page/<page_id>", "get_{name}_page", _board_page, ["GET"]),
+    ("/create{route}", "create_{name}", _board_create, ["POST"]),
+    ("/delete{route}/<page_id>", "delete_{name}", _board_delete, ["POST"]),
+)
 
-        block_res = requests.patch(
-            f"{NOTION_BASE}/blocks/{page_id}/children",
-            headers=headers,
-            json=block_payload
+for _board in board_registry:
+    for _rule, _endpoint, _view, _methods in _BOARD_ROUTES:
+        app.add_url_rule(
+            _rule.format(route=_board.route),
+            endpoint=_endpoint.format(name=_board.name),
+            view_func=functools.partial(_view, _board),
+            methods=_methods,
         )
-        block_json = block_res.json()
-
-        if block_res.status_code != 200:
-            return jsonify({"success": False, "detail": block_json}), 400
-
-        # ------------------------------------------------------------
-        # 완료
-        # ------------------------------------------------------------
-        return jsonify({"success": True, "page_id": page_id, "comment_db_id": comment_db_id}), 200
-
-    except Exception as e:
-        return jsonify({"success": False, "reason": str(e)}), 500
-
 
 
 # =========================
@@ -771,19 +1129,13 @@ def create_anon():
 # =========================
 @app.route("/<path:subpath>")
 def catch_all(subpath):
-    print("\n[ROUTE] catch_all 실행됨")
-    print(f"  요청 subpath='{subpath}', request.path={request.path}")
-
     # 로그인 페이지는 SPA 제외
     if subpath == "login":
-        print("  → login 직접 렌더 (SPA 제외 대상)")
-        return render_template("login.html")
+        return shell_cache.respond("login.html")
 
     # 정적 파일은 그대로 서빙
     if subpath.startswith("static/"):
-        print("  → static 파일 서빙:", subpath)
         return app.send_static_file(subpath[len("static/"):])
 
     # 그 외는 모두 index.html 로 SPA 라우팅
-    print("  → SPA 라우팅: index.html 렌더")
-    return render_template("index.html")
\ No newline at end of file
+    return shell_cache.respond("index.html")
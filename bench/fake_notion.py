@@ -0,0 +1,395 @@
+"""
+로컬 Notion API 대역 (부하 테스트용, 실제 Notion 쿼터를 쓰지 않음).
+
+앱이 사용하는 범위만 구현:
+- GET/PATCH /v1/pages/<id>, POST /v1/pages
+- GET/PATCH /v1/blocks/<id>/children
+- POST /v1/databases/<id>/query (filter / sorts / start_cursor), POST /v1/databases, GET /v1/databases/<id>
+
+실행:
+    python -m bench.fake_notion --port 8765 --latency 0.08 --jitter 0.03 --rate-429 0.02
+앱 연결:
+    NOTION_BASE_URL=http://127.0.0.1:8765/v1 (+ 출력되는 NOTION_*_DB 환경변수)
+"""
+import argparse
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from flask import Flask, jsonify, request
+
+# 기본 시드 데이터에 쓰는 고정 DB id (uuid 형식)
+USERS_DB = "00000000-0000-4000-8000-000000000001"
+NOTIFICATION_DB = "00000000-0000-4000-8000-000000000002"
+ANON_DB = "00000000-0000-4000-8000-000000000003"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _rich_text(items):
+    """요청의 rich_text 입력 → 응답 형태 (plain_text 포함)"""
+    out = []
+    for item in items or []:
+        content = (item.get("text") or {}).get("content", item.get("plain_text", ""))
+        out.append({
+            "type": "text",
+            "text": {"content": content, "link": None},
+            "plain_text": content,
+            "href": None,
+        })
+    return out
+
+
+def _property_value(name: str, value: dict) -> dict:
+    """페이지 생성 / 수정 시 property 입력값 → 응답 형태"""
+    kind = next(k for k in value if k not in ("id", "type"))
+    data = value[kind]
+    if kind in ("title", "rich_text"):
+        data = _rich_text(data)
+    elif kind == "multi_select":
+        data = [{"id": o["name"], "name": o["name"], "color": "default"} for o in data or []]
+    elif kind == "select" and data:
+        data = {"id": data["name"], "name": data["name"], "color": "default"}
+    return {"id": name, "type": kind, kind: data}
+
+
+def _plain(prop: dict) -> str:
+    kind = prop.get("type")
+    value = prop.get(kind)
+    if kind in ("title", "rich_text"):
+        return "".join(t.get("plain_text", "") for t in value or [])
+    if kind == "select":
+        return (value or {}).get("name", "")
+    if kind == "date":
+        return (value or {}).get("start") or ""
+    return ""
+
+
+class FakeNotionStore:
+    """메모리 위의 pages / databases / blocks"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.pages = {}
+        self.databases = {}
+        self.children = {}
+        self._clock = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    # ---- 생성 ----
+    def _stamp(self) -> str:
+        # 생성 / 수정마다 단조 증가 (last_edited_time 기반 증분 동기화가 동작하도록)
+        self._clock = max(self._clock + timedelta(milliseconds=1), datetime.now(timezone.utc))
+        return self._clock.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+    def create_database(self, parent_page_id, title, schema, db_id=None) -> dict:
+        with self.lock:
+            db_id = db_id or str(uuid.uuid4())
+            now = self._stamp()
+            db = {
+                "object": "database",
+                "id": db_id,
+                "created_time": now,
+                "last_edited_time": now,
+                "title": _rich_text(title),
+                "properties": {
+                    name: {"id": name, "name": name, "type": next(iter(spec)), **spec}
+                    for name, spec in (schema or {}).items()
+                },
+                "parent": {"type": "page_id", "page_id": parent_page_id} if parent_page_id
+                else {"type": "workspace", "workspace": True},
+                "archived": False,
+                "rows": [],
+            }
+            self.databases[db_id] = db
+            if parent_page_id:
+                self.children.setdefault(parent_page_id, []).append({
+                    "object": "block",
+                    "id": db_id,
+                    "type": "child_database",
+                    "has_children": False,
+                    "child_database": {"title": "".join(t["plain_text"] for t in db["title"])},
+                })
+            return db
+
+    def create_page(self, database_id, properties, children=None) -> dict:
+        with self.lock:
+            db = self.databases.get(database_id)
+            if db is None:
+                return None
+            now = self._stamp()
+            page = {
+                "object": "page",
+                "id": str(uuid.uuid4()),
+                "created_time": now,
+                "last_edited_time": now,
+                "archived": False,
+                "parent": {"type": "database_id", "database_id": database_id},
+                "properties": {n: _property_value(n, v) for n, v in (properties or {}).items()},
+                "url": "",
+            }
+            self.pages[page["id"]] = page
+            db["rows"].append(page["id"])
+            if children:
+                self.append_children(page["id"], children)
+            return page
+
+    def append_children(self, block_id, children) -> list:
+        with self.lock:
+            created = []
+            for child in children:
+                kind = child["type"]
+                body = dict(child.get(kind) or {})
+                if "rich_text" in body:
+                    body["rich_text"] = _rich_text(body["rich_text"])
+                created.append({
+                    "object": "block",
+                    "id": str(uuid.uuid4()),
+                    "type": kind,
+                    "has_children": False,
+                    kind: body,
+                })
+            self.children.setdefault(block_id, []).extend(created)
+            if block_id in self.pages:
+                self.pages[block_id]["last_edited_time"] = self._stamp()
+            return created
+
+    def update_page(self, page_id, payload) -> dict:
+        with self.lock:
+            page = self.pages.get(page_id)
+            if page is None:
+                return None
+            for name, value in (payload.get("properties") or {}).items():
+                page["properties"][name] = _property_value(name, value)
+            if "archived" in payload:
+                page["archived"] = bool(payload["archived"])
+            page["last_edited_time"] = self._stamp()
+            return page
+
+    # ---- 조회 ----
+    def query(self, db_id, body) -> list:
+        with self.lock:
+            db = self.databases.get(db_id)
+            if db is None:
+                return None
+            rows = [self.pages[pid] for pid in db["rows"] if not self.pages[pid]["archived"]]
+        flt = body.get("filter")
+        if flt:
+            rows = [p for p in rows if _matches(p, flt)]
+        sorts = body.get("sorts") or [{"timestamp": "created_time", "direction": "descending"}]
+        for s in reversed(sorts):
+            if "timestamp" in s:
+                key = lambda p, k=s["timestamp"]: p[k]
+            else:
+                key = lambda p, k=s.get("property"): _plain(p["properties"].get(k, {}))
+            rows.sort(key=key, reverse=s.get("direction") == "descending")
+        return rows
+
+
+def _matches(page: dict, flt: dict) -> bool:
+    if "and" in flt:
+        return all(_matches(page, f) for f in flt["and"])
+    if "or" in flt:
+        return any(_matches(page, f) for f in flt["or"])
+    if "timestamp" in flt:
+        value = page[flt["timestamp"]]
+        cond = flt.get(flt["timestamp"]) or {}
+        if "on_or_after" in cond:
+            return value >= cond["on_or_after"]
+        if "after" in cond:
+            return value > cond["after"]
+        if "before" in cond:
+            return value < cond["before"]
+        return True
+    prop = page["properties"].get(flt.get("property"), {})
+    for kind in ("title", "rich_text", "select", "date"):
+        if kind in flt:
+            cond = flt[kind]
+            text = _plain(prop)
+            if "equals" in cond:
+                return text == cond["equals"]
+            if "contains" in cond:
+                return cond["contains"] in text
+            return True
+    return True
+
+
+def _paginate(items, body_or_args):
+    page_size = max(1, min(int(body_or_args.get("page_size") or 100), 100))
+    offset = int(body_or_args.get("start_cursor") or 0)
+    chunk = items[offset:offset + page_size]
+    has_more = offset + page_size < len(items)
+    return {
+        "object": "list",
+        "results": chunk,
+        "has_more": has_more,
+        "next_cursor": str(offset + page_size) if has_more else None,
+    }
+
+
+def _error(status: int, code: str, message: str):
+    return jsonify({"object": "error", "status": status, "code": code, "message": message}), status
+
+
+def _public(obj: dict) -> dict:
+    return {k: v for k, v in obj.items() if k != "rows"}
+
+
+def create_fake_notion(store=None, latency=0.0, jitter=0.0, rate_429=0.0, retry_after=1.0, seed=None):
+    """
+    latency / jitter: 응답 지연(초) = latency ± uniform(jitter)
+    rate_429: 요청마다 이 확률로 429 + Retry-After(retry_after초) 반환
+    """
+    store = store or FakeNotionStore()
+    rng = random.Random(seed)
+    app = Flask("fake_notion")
+    app.config["store"] = store
+    stats = app.config["stats"] = {"requests": 0, "throttled": 0}
+
+    @app.before_request
+    def _inject():
+        stats["requests"] += 1
+        delay = latency + rng.uniform(-jitter, jitter) if jitter else latency
+        if delay > 0:
+            time.sleep(delay)
+        if rate_429 and rng.random() < rate_429:
+            stats["throttled"] += 1
+            resp, status = _error(429, "rate_limited", "Rate limited")
+            resp.headers["Retry-After"] = f"{retry_after:g}"
+            return resp, status
+
+    @app.get("/v1/pages/<page_id>")
+    def get_page(page_id):
+        page = store.pages.get(page_id)
+        if page is None:
+            return _error(404, "object_not_found", f"page {page_id}")
+        return jsonify(page)
+
+    @app.post("/v1/pages")
+    def create_page():
+        body = request.get_json(force=True)
+        db_id = (body.get("parent") or {}).get("database_id")
+        page = store.create_page(db_id, body.get("properties"), body.get("children"))
+        if page is None:
+            return _error(404, "object_not_found", f"database {db_id}")
+        return jsonify(page)
+
+    @app.patch("/v1/pages/<page_id>")
+    def patch_page(page_id):
+        page = store.update_page(page_id, request.get_json(force=True))
+        if page is None:
+            return _error(404, "object_not_found", f"page {page_id}")
+        return jsonify(page)
+
+    @app.get("/v1/blocks/<block_id>/children")
+    def get_children(block_id):
+        return jsonify(_paginate(store.children.get(block_id, []), request.args))
+
+    @app.patch("/v1/blocks/<block_id>/children")
+    def patch_children(block_id):
+        created = store.append_children(block_id, request.get_json(force=True).get("children") or [])
+        return jsonify({"object": "list", "results": created, "has_more": False, "next_cursor": None})
+
+    @app.post("/v1/databases/<db_id>/query")
+    def query_database(db_id):
+        body = request.get_json(silent=True) or {}
+        rows = store.query(db_id, body)
+        if rows is None:
+            return _error(404, "object_not_found", f"database {db_id}")
+        return jsonify(_paginate(rows, body))
+
+    @app.post("/v1/databases")
+    def create_database():
+        body = request.get_json(force=True)
+        parent = (body.get("parent") or {}).get("page_id")
+        if parent not in store.pages:
+            return _error(404, "object_not_found", f"page {parent}")
+        return jsonify(_public(store.create_database(parent, body.get("title"), body.get("properties"))))
+
+    @app.get("/v1/databases/<db_id>")
+    def get_database(db_id):
+        db = store.databases.get(db_id)
+        if db is None:
+            return _error(404, "object_not_found", f"database {db_id}")
+        return jsonify(_public(db))
+
+    return app
+
+
+COMMENT_SCHEMA = {"subWriter": {"title": {}}, "text": {"rich_text": {}}, "like": {"multi_select": {}}}
+BOARD_SCHEMA = {"title": {"title": {}}, "writer": {"select": {}}, "date": {"date": {}}}
+
+
+def seed_store(store: FakeNotionStore, posts: int = 30, comments: int = 5, users: int = 20, paragraphs: int = 8):
+    """
+    앱 스키마에 맞는 시드 데이터.
+    - 사용자 DB: user{i} / pw{i}
+    - 공지 / 익명 게시판: 게시글마다 본문 paragraph + commentSubDB(댓글 comments개)
+    """
+    store.create_database(None, [{"text": {"content": "users"}}], {
+        "user_name": {"title": {}}, "ID": {"rich_text": {}}, "PW": {"rich_text": {}}, "user_role": {"select": {}},
+    }, db_id=USERS_DB)
+    for i in range(users):
+        store.create_page(USERS_DB, {
+            "user_name": {"title": [{"text": {"content": f"사용자{i}"}}]},
+            "ID": {"rich_text": [{"text": {"content": f"user{i}"}}]},
+            "PW": {"rich_text": [{"text": {"content": f"pw{i}"}}]},
+            "user_role": {"select": {"name": "member"}},
+        })
+
+    for db_id, label in ((NOTIFICATION_DB, "공지"), (ANON_DB, "익명")):
+        store.create_database(None, [{"text": {"content": label}}], BOARD_SCHEMA, db_id=db_id)
+        for i in range(posts):
+            page = store.create_page(db_id, {
+                "title": {"title": [{"text": {"content": f"{label} 게시글 {i}"}}]},
+                "writer": {"select": {"name": "회장단"}},
+                "date": {"date": {"start": f"2025-01-{i % 28 + 1:02d}"}},
+            }, children=[
+                {"type": "paragraph", "paragraph": {"rich_text": [{"text": {"content": f"{label} 본문 {i}-{j} " * 4}}]}}
+                for j in range(paragraphs)
+            ])
+            comment_db = store.create_database(page["id"], [{"text": {"content": "commentSubDB"}}], COMMENT_SCHEMA)
+            for j in range(comments):
+                store.create_page(comment_db["id"], {
+                    "subWriter": {"title": [{"text": {"content": f"사용자{j}"}}]},
+                    "text": {"rich_text": [{"text": {"content": f"댓글 {j}"}}]},
+                    "like": {"multi_select": [{"name": f"사용자{k}"} for k in range(j % 3)]},
+                })
+    return store
+
+
+def seed_env(base_url: str) -> dict:
+    """시드 데이터에 앱을 연결하는 환경변수"""
+    return {
+        "NOTION_BASE_URL": base_url,
+        "NOTION_API_KEY": "fake-notion-key",
+        "NOTION_DB_ID": USERS_DB,
+        "NOTION_NOTIFICATION_DB": NOTIFICATION_DB,
+        "NOTION_ANON_DB": ANON_DB,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Notion API 대역")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 ± 범위(초)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 응답 확률 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429의 Retry-After(초)")
+    parser.add_argument("--posts", type=int, default=30)
+    parser.add_argument("--comments", type=int, default=5)
+    args = parser.parse_args()
+
+    store = seed_store(FakeNotionStore(), posts=args.posts, comments=args.comments)
+    app = create_fake_notion(store, args.latency, args.jitter, args.rate_429, args.retry_after)
+    for key, value in seed_env(f"http://{args.host}:{args.port}/v1").items():
+        print(f"{key}={value}")
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+api/index.py 전체 라우트 벤치마크 (로컬 Notion 대역 사용).
+
+    python -m bench.run --requests 200 --concurrency 8 --latency 0.08 --jitter 0.03
+
+- 같은 프로세스에서 fake Notion 서버와 앱 서버를 띄우고 실제 HTTP로 호출
+- 라우트마다 처리량(req/s)과 p50 / p95 / p99 지연(ms), 오류 수를 출력
+- 시나리오가 없는 라우트가 생기면 마지막에 목록으로 알려 줌
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from werkzeug.serving import make_server
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench.fake_notion import (  # noqa: E402
+    ANON_DB,
+    NOTIFICATION_DB,
+    FakeNotionStore,
+    create_fake_notion,
+    seed_env,
+    seed_store,
+)
+
+
+def _serve(app):
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def percentile(sorted_values, p: float) -> float:
+    """nearest-rank 백분위"""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+class Scenario:
+    """
+    rule: 대상 Flask route 템플릿 (커버리지 확인용)
+    build(i, ctx): i번째 요청의 (method, path, json | None)
+    prepare(n, ctx): 측정 전에 필요한 데이터 생성 (삭제 대상 등)
+    """
+
+    def __init__(self, name, rule, build, prepare=None):
+        self.name = name
+        self.rule = rule
+        self.build = build
+        self.prepare = prepare
+
+
+def _board_posts(store, db_id):
+    return [pid for pid in store.databases[db_id]["rows"] if not store.pages[pid]["archived"]]
+
+
+def _comment_db(store, page_id):
+    return next(b["id"] for b in store.children.get(page_id, []) if b["type"] == "child_database")
+
+
+def _new_posts(db_id):
+    def prepare(n, ctx):
+        store = ctx["store"]
+        ctx[f"victims:{db_id}"] = [
+            store.create_page(db_id, {"title": {"title": [{"text": {"content": f"삭제용 {i}"}}]}})["id"]
+            for i in range(n)
+        ]
+    return prepare
+
+
+def _new_comments(n, ctx):
+    store = ctx["store"]
+    ctx["comment_victims"] = [
+        store.create_page(ctx["comment_dbs"][i % len(ctx["comment_dbs"])], {
+            "subWriter": {"title": [{"text": {"content": "bench"}}]},
+            "text": {"rich_text": [{"text": {"content": f"삭제용 댓글 {i}"}}]},
+        })["id"]
+        for i in range(n)
+    ]
+
+
+def scenarios():
+    post = lambda payload: lambda i, ctx: ("POST", payload[0], payload[1](i, ctx))
+    pick = lambda key: lambda i, ctx: ctx[key][i % len(ctx[key])]
+    return [
+        Scenario("home", "/", lambda i, ctx: ("GET", "/", None)),
+        Scenario("login_html", "/login.html", lambda i, ctx: ("GET", "/login.html", None)),
+        Scenario("main", "/main", lambda i, ctx: ("GET", "/main", None)),
+        Scenario("spa_catch_all", "/<path:subpath>", lambda i, ctx: ("GET", "/board/notification", None)),
+        Scenario("static", "/static/<path:filename>", lambda i, ctx: ("GET", "/static/css/styles.css", None)),
+        Scenario("static_dist", "/static/dist/<path:filename>", lambda i, ctx: ("GET", ctx["dist_asset"], None)),
+        Scenario("health", "/health", lambda i, ctx: ("GET", "/health", None)),
+        Scenario("cache_stats", "/cacheStats", lambda i, ctx: ("GET", "/cacheStats", None)),
+        Scenario("notion_stats", "/notionStats", lambda i, ctx: ("GET", "/notionStats", None)),
+        Scenario("metrics", "/metrics", lambda i, ctx: ("GET", "/metrics", None)),
+        Scenario("login", "/login", post(("/login", lambda i, ctx: {"id": f"user{i % 20}", "pw": f"pw{i % 20}"}))),
+        Scenario("notification_list", "/getNotificationDB",
+                 lambda i, ctx: ("GET", "/getNotificationDB?page_size=10", None)),
+        Scenario("anon_list", "/getAnonDB", lambda i, ctx: ("GET", "/getAnonDB?page_size=10&lean=1", None)),
+        Scenario("notification_stream", "/streamNotificationDB", post(("/streamNotificationDB", lambda i, ctx: {}))),
+        Scenario("anon_stream", "/streamAnonDB", post(("/streamAnonDB", lambda i, ctx: {}))),
+        Scenario("dashboard", "/dashboard", lambda i, ctx: ("GET", "/dashboard?limit=3", None)),
+        Scenario("search", "/search",
+                 lambda i, ctx: ("GET", f"/search?q={['게시글', '본문 3', '댓글', '공지'][i % 4]}", None)),
+        Scenario("events", "/events", lambda i, ctx: ("GET", "/events?timeout=0", None)),
+        Scenario("notification_page", "/getNotificationPage/<page_id>",
+                 lambda i, ctx: ("GET", f"/getNotificationPage/{pick('notification_posts')(i, ctx)}", None)),
+        Scenario("anon_page", "/getAnonPage/<page_id>",
+                 lambda i, ctx: ("GET", f"/getAnonPage/{pick('anon_posts')(i, ctx)}", None)),
+        Scenario("toggle_post_like", "/togglePostLike", post(("/togglePostLike", lambda i, ctx: {
+            "comment_db_id": pick("comment_dbs")(i, ctx),
+            "content_like_row_id": pick("comment_rows")(i, ctx),
+            "user_name": f"bench{i % 7}",
+        }))),
+        Scenario("toggle_comment_like", "/toggleCommentLike", post(("/toggleCommentLike", lambda i, ctx: {
+            "comment_row_id": pick("comment_rows")(i, ctx), "user_name": f"bench{i % 7}",
+        }))),
+        Scenario("add_comment", "/addComment", post(("/addComment", lambda i, ctx: {
+            "comment_db_id": pick("comment_dbs")(i, ctx), "writer": "bench", "content": f"벤치 댓글 {i}",
+        }))),
+        Scenario("delete_comment", "/deleteComment",
+                 post(("/deleteComment", lambda i, ctx: {"comment_row_id": ctx["comment_victims"][i]})),
+                 prepare=_new_comments),
+        Scenario("create_notification", "/createNotification", post(("/createNotification", lambda i, ctx: {
+            "title": f"벤치 공지 {i}", "body": "본문", "writer": "회장단",
+        }))),
+        Scenario("create_anon", "/createAnon", post(("/createAnon", lambda i, ctx: {
+            "title": f"벤치 익명 {i}", "body": "본문", "writer": "익명",
+        }))),
+        Scenario("delete_notification", "/deleteNotification/<page_id>",
+                 lambda i, ctx: ("POST", f"/deleteNotification/{ctx['victims:' + NOTIFICATION_DB][i]}", None),
+                 prepare=_new_posts(NOTIFICATION_DB)),
+        Scenario("delete_anon", "/deleteAnon/<page_id>",
+                 lambda i, ctx: ("POST", f"/deleteAnon/{ctx['victims:' + ANON_DB][i]}", None),
+                 prepare=_new_posts(ANON_DB)),
+    ]
+
+
+def run_scenario(base_url, scenario, ctx, n, concurrency):
+    if scenario.prepare:
+        scenario.prepare(n, ctx)
+    local = threading.local()
+
+    def one(i):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        method, path, body = scenario.build(i, ctx)
+        started = time.perf_counter()
+        try:
+            resp = session.request(method, base_url + path, json=body)
+            ok = resp.status_code < 400
+        except requests.RequestException:
+            ok = False
+        return time.perf_counter() - started, ok
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(one, range(n)))
+    wall = time.perf_counter() - started
+
+    latencies = sorted(r[0] * 1000 for r in results)
+    return {
+        "scenario": scenario.name,
+        "route": scenario.rule,
+        "requests": n,
+        "errors": sum(1 for r in results if not r[1]),
+        "rps": n / wall if wall else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 라우트 벤치마크 (fake Notion)")
+    parser.add_argument("--requests", type=int, default=200, help="시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="fake Notion 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    parser.add_argument("--notion-rate", type=float, default=None,
+                        help="앱 스케줄러의 초당 Notion 호출 수 (기본: 환경변수 / 앱 기본값 3)")
+    parser.add_argument("--write-journal", action="store_true",
+                        help="임시 파일로 쓰기 저널(WRITE_JOURNAL_PATH)을 켜고 측정")
+    parser.add_argument("--only", default="", help="쉼표로 구분한 시나리오 이름만 실행")
+    parser.add_argument("--json", dest="json_out", default="", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    store = seed_store(FakeNotionStore())
+    fake = create_fake_notion(store, args.latency, args.jitter, args.rate_429, args.retry_after, seed=1)
+    _, fake_url = _serve(fake)
+
+    # 앱은 import 시점에 환경변수를 읽으므로 먼저 설정
+    os.environ.update(seed_env(f"{fake_url}/v1"))
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    if args.notion_rate:
+        os.environ["NOTION_RATE_PER_SEC"] = str(args.notion_rate)
+        os.environ["NOTION_BURST"] = str(max(args.notion_rate, 1.0))
+    if args.write_journal:
+        os.environ["WRITE_JOURNAL_PATH"] = os.path.join(tempfile.mkdtemp(prefix="bench-journal-"), "journal.sqlite3")
+    from api.index import app
+    from flask_utils.assets import load_manifest
+
+    _, app_url = _serve(app)
+
+    notification_posts = _board_posts(store, NOTIFICATION_DB)
+    anon_posts = _board_posts(store, ANON_DB)
+    comment_dbs = [_comment_db(store, pid) for pid in notification_posts + anon_posts]
+    manifest = load_manifest()
+    ctx = {
+        "store": store,
+        "notification_posts": notification_posts,
+        "anon_posts": anon_posts,
+        "comment_dbs": comment_dbs,
+        "comment_rows": [row for db in comment_dbs for row in store.databases[db]["rows"]],
+        "dist_asset": f"/static/dist/{manifest['css/styles.css']}" if manifest else None,
+    }
+
+    selected = [s for s in scenarios() if not args.only or s.name in args.only.split(",")]
+    results = []
+    print(f"{'scenario':<22}{'req':>6}{'err':>6}{'req/s':>10}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)")
+    for scenario in selected:
+        if scenario.name == "static_dist" and not ctx["dist_asset"]:
+            print(f"{scenario.name:<22}  건너뜀 (python -m flask_utils.assets 로 먼저 빌드)")
+            continue
+        r = run_scenario(app_url, scenario, ctx, args.requests, args.concurrency)
+        results.append(r)
+        print(f"{r['scenario']:<22}{r['requests']:>6}{r['errors']:>6}{r['rps']:>10.1f}"
+              f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}")
+
+    print(f"\nfake Notion: 요청 {fake.config['stats']['requests']}건, 429 {fake.config['stats']['throttled']}건")
+
+    covered = {s.rule for s in scenarios()}
+    missing = sorted(
+        rule.rule for rule in app.url_map.iter_rules()
+        if rule.rule not in covered and rule.endpoint != "static"
+    )
+    if missing:
+        print("시나리오가 없는 라우트:", ", ".join(missing))
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
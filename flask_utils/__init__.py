@@ -1 +1,21 @@
-from .notion import *
\ No newline at end of file
+from .log import *
+from .metrics import *
+from .scheduler import *
+from .client import *
+from .cache import *
+from .blocks import *
+from .replica import *
+from .boards import *
+from .notion import *
+from .users import *
+from .likes import *
+from .counters import *
+from .search import *
+from .feed import *
+from .provision import *
+from .journal import *
+from .idempotency import *
+from .etag import *
+from .projection import *
+from .assets import *
+from .shell import *
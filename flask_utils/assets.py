@@ -0,0 +1,203 @@
+"""
+정적 자산 빌드 / 서빙.
+
+빌드: python -m flask_utils.assets
+- static/ 아래 JS / CSS를 내용 해시로 fingerprint → static/dist/<경로>/<이름>.<hash>.<ext>
+- 각 파일을 gzip / brotli(설치된 경우)로 미리 압축 (.gz / .br)
+- static/dist/manifest.json: 원본 상대경로 → 해시 경로
+- CSS의 @import / url() 참조는 해시 경로로 치환
+- JS 모듈 import는 그대로 두고, 템플릿의 import map이 해시 경로로 연결 (순환 import도 안전)
+
+static/dist는 저장소에 함께 커밋 (Vercel 배포에는 빌드 단계가 없음).
+static/ 아래 JS / CSS를 고치면 다시 빌드해서 같이 커밋할 것 (tests/test_assets.py가 확인)
+"""
+import os
+import json
+import gzip
+import hashlib
+import mimetypes
+import posixpath
+import re
+import shutil
+from typing import Dict, Optional
+
+from flask import abort, request, send_file
+from markupsafe import Markup
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 생성
+    brotli = None
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+DIST_DIRNAME = "dist"
+DIST_DIR = os.path.join(STATIC_DIR, DIST_DIRNAME)
+MANIFEST_PATH = os.path.join(DIST_DIR, "manifest.json")
+
+HASHED_EXTENSIONS = (".js", ".css")
+IMMUTABLE_MAX_AGE = 31536000  # 1년
+
+_CSS_REF = re.compile(r"""(@import\s+(?!url\()|url\(\s*)(['"]?)([^'")\s]+)\2""")
+_HASHED_NAME = re.compile(r"\.[0-9a-f]{10}\.[a-z0-9]+$")
+
+
+# =========================
+# 빌드
+# =========================
+def _content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def _hashed_name(rel: str, digest: str) -> str:
+    stem, ext = posixpath.splitext(rel)
+    return f"{stem}.{digest}{ext}"
+
+
+def _resolve_css_ref(rel: str, ref: str) -> Optional[str]:
+    """CSS 안의 참조를 static 기준 상대경로로 변환 (외부 URL / data URI는 None)"""
+    if re.match(r"^[a-z]+:", ref) or ref.startswith("//"):
+        return None
+    if ref.startswith("/static/"):
+        return posixpath.normpath(ref[len("/static/"):])
+    if ref.startswith("/"):
+        return None
+    return posixpath.normpath(posixpath.join(posixpath.dirname(rel), ref))
+
+
+def _write_variants(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(data, quality=11))
+
+
+def build_assets(static_dir: str = STATIC_DIR) -> Dict[str, str]:
+    """static/ → static/dist/ 빌드 후 manifest 반환"""
+    dist_dir = os.path.join(static_dir, DIST_DIRNAME)
+    shutil.rmtree(dist_dir, ignore_errors=True)
+
+    sources = {}
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != dist_dir]
+        for name in files:
+            if name.endswith(HASHED_EXTENSIONS):
+                full = os.path.join(root, name)
+                rel = os.path.relpath(full, static_dir).replace(os.sep, "/")
+                with open(full, "rb") as f:
+                    sources[rel] = f.read()
+
+    manifest: Dict[str, str] = {}
+
+    def process(rel: str, visiting=()):
+        if rel in manifest:
+            return
+        data = sources[rel]
+        if rel.endswith(".css"):
+            # 참조하는 CSS를 먼저 해시해야 치환된 내용으로 내 해시가 결정됨
+            def replace(m):
+                target = _resolve_css_ref(rel, m.group(3))
+                if target not in sources or target in visiting:
+                    return m.group(0)
+                process(target, visiting + (rel,))
+                return f"{m.group(1)}{m.group(2)}/static/{DIST_DIRNAME}/{manifest[target]}{m.group(2)}"
+
+            data = _CSS_REF.sub(replace, data.decode("utf-8")).encode("utf-8")
+
+        hashed = _hashed_name(rel, _content_hash(data))
+        _write_variants(os.path.join(dist_dir, hashed), data)
+        manifest[rel] = hashed
+
+    for rel in sorted(sources):
+        process(rel)
+
+    with open(os.path.join(dist_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return manifest
+
+
+# =========================
+# 템플릿 헬퍼
+# =========================
+_manifest_cache = {"mtime": None, "data": {}}
+
+
+def load_manifest() -> Dict[str, str]:
+    """manifest.json (파일이 바뀌면 다시 읽음, 없으면 빈 dict → 원본 경로 사용)"""
+    try:
+        mtime = os.path.getmtime(MANIFEST_PATH)
+    except OSError:
+        return {}
+    if _manifest_cache["mtime"] != mtime:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            _manifest_cache["data"] = json.load(f)
+        _manifest_cache["mtime"] = mtime
+    return _manifest_cache["data"]
+
+
+def asset_url(rel: str) -> str:
+    """원본 상대경로(예: "css/styles.css") → 해시 URL (빌드 전이면 원본 URL)"""
+    hashed = load_manifest().get(rel)
+    if hashed:
+        return f"/static/{DIST_DIRNAME}/{hashed}"
+    return f"/static/{rel}"
+
+
+def import_map_tag() -> Markup:
+    """
+    JS 모듈 import map.
+    원본 URL(/static/js/..)과 dist 기준 상대 import가 가리키는 URL(/static/dist/js/..)을
+    모두 해시 URL로 연결
+    """
+    imports = {}
+    for rel, hashed in load_manifest().items():
+        if rel.endswith(".js"):
+            target = f"/static/{DIST_DIRNAME}/{hashed}"
+            imports[f"/static/{rel}"] = target
+            imports[f"/static/{DIST_DIRNAME}/{rel}"] = target
+    if not imports:
+        return Markup("")
+    payload = json.dumps({"imports": imports}, ensure_ascii=False, sort_keys=True)
+    return Markup(f'<script type="importmap">{payload}</script>')
+
+
+# =========================
+# 서빙
+# =========================
+def send_asset(filename: str):
+    """
+    static/dist 파일 응답.
+    - Accept-Encoding에 따라 .br → .gz → 원본 순으로 선택
+    - 해시가 붙은 파일은 Cache-Control: immutable (1년)
+    """
+    path = safe_join(DIST_DIR, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+
+    chosen, encoding = path, None
+    for enc, ext in (("br", ".br"), ("gzip", ".gz")):
+        if request.accept_encodings[enc] and os.path.isfile(path + ext):
+            chosen, encoding = path + ext, enc
+            break
+
+    mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if mimetype == "application/javascript":
+        mimetype = "text/javascript"
+    resp = send_file(chosen, mimetype=mimetype, conditional=True)
+    resp.headers["Vary"] = "Accept-Encoding"
+    if encoding:
+        resp.headers["Content-Encoding"] = encoding
+    if _HASHED_NAME.search(filename):
+        resp.headers["Cache-Control"] = f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+    return resp
+
+
+if __name__ == "__main__":
+    built = build_assets()
+    print(f"[assets] {len(built)}개 파일 빌드 완료 → {DIST_DIR}")
+    if brotli is None:
+        print("[assets] brotli 미설치: .br 생략 (pip install brotli)")
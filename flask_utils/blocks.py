@@ -0,0 +1,182 @@
+import os
+import asyncio
+
+from .client import notion_client, notion_executor
+from .log import get_logger
+from .scheduler import PRIORITY_INTERACTIVE
+
+_log = get_logger("blocks")
+
+# 본문 블록 트리 로딩 한도 (큰 페이지도 빠르고 메모리 한정적으로)
+BLOCK_TREE_MAX_DEPTH = int(os.getenv("BLOCK_TREE_MAX_DEPTH", "3"))
+BLOCK_TREE_MAX_BLOCKS = int(os.getenv("BLOCK_TREE_MAX_BLOCKS", "1000"))
+BLOCK_TREE_CONCURRENCY = int(os.getenv("BLOCK_TREE_CONCURRENCY", "4"))
+
+# 하위 페이지 / DB는 본문이 아니므로 내려가지 않음
+_NO_DESCEND = ("child_database", "child_page")
+
+
+def fetch_block_children(
+    block_id: str,
+    client=notion_client,
+    priority: int = PRIORITY_INTERACTIVE,
+    limit: int = BLOCK_TREE_MAX_BLOCKS,
+):
+    """
+    next_cursor를 따라 블록의 children을 모두 조회 (최대 limit개).
+    반환: (blocks, truncated, 실패한 응답 | None)
+    """
+    blocks = []
+    params = {"page_size": 100}
+    while True:
+        resp = client.get(f"blocks/{block_id}/children", params=dict(params), priority=priority)
+        if resp.status_code != 200:
+            return blocks, False, resp
+        data = resp.json()
+        blocks.extend(data.get("results", []))
+        if len(blocks) >= limit:
+            return blocks[:limit], bool(data.get("has_more")) or len(blocks) > limit, None
+        if not data.get("has_more"):
+            return blocks, False, None
+        params["start_cursor"] = data.get("next_cursor")
+
+
+def load_block_tree(
+    page_id: str,
+    client=notion_client,
+    priority: int = PRIORITY_INTERACTIVE,
+    max_depth: int = BLOCK_TREE_MAX_DEPTH,
+    max_blocks: int = BLOCK_TREE_MAX_BLOCKS,
+    concurrency: int = BLOCK_TREE_CONCURRENCY,
+    on_roots=None,
+):
+    """
+    페이지 본문 블록 트리를 깊이 단위(BFS)로 조회.
+    - 각 블록의 children은 커서를 끝까지 따라감
+    - has_children 블록은 한 번에 concurrency개씩 병렬로 내려감
+    - max_depth 단계 / 전체 max_blocks개를 넘으면 중단하고 truncated=True
+    - 하위 블록은 부모 블록의 "children" 키에 담김
+    - on_roots(blocks): 최상위 블록을 받은 직후 호출 (하위 조회와 겹쳐서 처리할 작업용)
+    반환: (최상위 blocks | None, truncated, 실패한 응답 | None)
+    """
+    roots, truncated, err = fetch_block_children(page_id, client, priority, max_blocks)
+    if err is not None:
+        return None, False, err
+    if on_roots is not None:
+        on_roots(roots)
+
+    total = len(roots)
+    level = roots
+    for depth in range(max_depth + 1):
+        parents = [b for b in level if b.get("has_children") and b.get("type") not in _NO_DESCEND]
+        if not parents:
+            break
+        if depth == max_depth or total >= max_blocks:
+            truncated = True
+            break
+
+        next_level = []
+        for i in range(0, len(parents), concurrency):
+            if total >= max_blocks:
+                truncated = True
+                break
+            batch = parents[i:i + concurrency]
+            futures = [
+                notion_executor.submit(
+                    fetch_block_children, b["id"], client, priority, max_blocks - total
+                )
+                for b in batch
+            ]
+            for b, future in zip(batch, futures):
+                fetched, cut, child_err = future.result()
+                if child_err is not None:
+                    _log.warning("하위 블록 조회 실패", block_id=b["id"], status=child_err.status_code, body=child_err.text)
+                    truncated = True
+                # 병렬로 받은 배치가 전체 한도를 넘지 않도록 잘라냄
+                children = fetched[:max(0, max_blocks - total)]
+                if cut or len(children) < len(fetched):
+                    truncated = True
+                b["children"] = children
+                total += len(children)
+                next_level.extend(children)
+        level = next_level
+
+    return roots, truncated, None
+
+
+# =========================
+# 비동기 버전 (Flask async view 용)
+# =========================
+async def afetch_block_children(
+    block_id: str,
+    client=notion_client,
+    priority: int = PRIORITY_INTERACTIVE,
+    limit: int = BLOCK_TREE_MAX_BLOCKS,
+):
+    """fetch_block_children의 비동기 버전 (반환 형식 동일)"""
+    blocks = []
+    params = {"page_size": 100}
+    while True:
+        resp = await client.aget(f"blocks/{block_id}/children", params=dict(params), priority=priority)
+        if resp.status_code != 200:
+            return blocks, False, resp
+        data = resp.json()
+        blocks.extend(data.get("results", []))
+        if len(blocks) >= limit:
+            return blocks[:limit], bool(data.get("has_more")) or len(blocks) > limit, None
+        if not data.get("has_more"):
+            return blocks, False, None
+        params["start_cursor"] = data.get("next_cursor")
+
+
+async def aload_block_tree(
+    page_id: str,
+    client=notion_client,
+    priority: int = PRIORITY_INTERACTIVE,
+    max_depth: int = BLOCK_TREE_MAX_DEPTH,
+    max_blocks: int = BLOCK_TREE_MAX_BLOCKS,
+    concurrency: int = BLOCK_TREE_CONCURRENCY,
+    on_roots=None,
+):
+    """
+    load_block_tree의 비동기 버전 (한도 / 잘림 / 반환 형식 동일).
+    하위 블록 조회는 워커 풀 대신 같은 루프에서 concurrency개씩 gather.
+    """
+    roots, truncated, err = await afetch_block_children(page_id, client, priority, max_blocks)
+    if err is not None:
+        return None, False, err
+    if on_roots is not None:
+        on_roots(roots)
+
+    total = len(roots)
+    level = roots
+    for depth in range(max_depth + 1):
+        parents = [b for b in level if b.get("has_children") and b.get("type") not in _NO_DESCEND]
+        if not parents:
+            break
+        if depth == max_depth or total >= max_blocks:
+            truncated = True
+            break
+
+        next_level = []
+        for i in range(0, len(parents), concurrency):
+            if total >= max_blocks:
+                truncated = True
+                break
+            batch = parents[i:i + concurrency]
+            results = await asyncio.gather(*[
+                afetch_block_children(b["id"], client, priority, max_blocks - total) for b in batch
+            ])
+            for b, (fetched, cut, child_err) in zip(batch, results):
+                if child_err is not None:
+                    _log.warning("하위 블록 조회 실패", block_id=b["id"], status=child_err.status_code, body=child_err.text)
+                    truncated = True
+                children = fetched[:max(0, max_blocks - total)]
+                if cut or len(children) < len(fetched):
+                    truncated = True
+                b["children"] = children
+                total += len(children)
+                next_level.extend(children)
+        level = next_level
+
+    return roots, truncated, None
@@ -0,0 +1,208 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from .cache import BOARD_CACHE_MAXSIZE, BOARD_CACHE_TTL, TTLCache
+from .replica import BOARD_REPLICA_INTERVAL
+
+# 게시판 정의 추가 / 덮어쓰기: JSON 파일 경로 또는 JSON 배열 문자열
+#   예: [{"name": "qna", "label": "질문"}, {"name": "anon", "cache_ttl": 10}]
+#   → 새 게시판은 NOTION_QNA_DB에서 DB id를 읽고 /getQnaDB, /getQnaPage/<id>, /createQna ... 라우트가 생김
+BOARDS_CONFIG = os.getenv("BOARDS_CONFIG", "")
+# 목록 조회 후 next_cursor 페이지를 몇 장까지 미리 캐시에 채울지 (게시판별 prefetch_depth 기본값, 0이면 끔)
+BOARD_PREFETCH_DEPTH = int(os.getenv("BOARD_PREFETCH_DEPTH", "0"))
+
+# 게시글 / 댓글 DB / 댓글 row id → 게시판 매핑을 최근 몇 개까지 기억할지 (쓰기 후 그 게시판 캐시만 비우는 데 사용)
+BOARD_OWNER_MAXSIZE = int(os.getenv("BOARD_OWNER_MAXSIZE", "50000"))
+
+# 목록 item 필드 → Notion property 이름 (+ 글 작성 시 writer property 타입)
+DEFAULT_SCHEMA = {"title": "title", "writer": "writer", "date": "date", "writer_type": "select"}
+
+_WRITER_TYPES = ("select", "multi_select", "rich_text")
+
+# 기본 게시판 (BOARDS_CONFIG에서 같은 name으로 설정을 덮어쓸 수 있음)
+_DEFAULT_BOARDS = [
+    {"name": "notification", "route": "Notification", "label": "공지"},
+    {"name": "anon", "route": "Anon", "label": "익명"},
+]
+
+
+def _compact_id(db_id: Optional[str]) -> str:
+    """Notion은 id를 하이픈 포함 / 미포함 형태로 섞어 씀"""
+    return (db_id or "").replace("-", "")
+
+
+class Board:
+    """
+    게시판 1개의 정의 (registry 항목).
+    - name: 검색 / 변경 피드 / dashboard에서 쓰는 이름, route: URL 이름 (/get{route}DB, /create{route} ...)
+    - db_id: Notion DB id (db_id가 없으면 db_id_env 환경변수, 기본 NOTION_{NAME}_DB)
+    - schema: 목록 item 필드(title / writer / date) → Notion property 이름, writer_type: 작성 시 writer 타입
+    - cache_ttl / cache_maxsize: 게시판별 목록 캐시 정책
+    - prefetch_depth: 목록 miss 후 다음 커서 페이지를 background 레인으로 미리 채울 장 수
+    - sync_interval: 로컬 복제본 동기화 주기(초)
+    """
+
+    __slots__ = ("name", "route", "label", "db_id_env", "db_id", "schema",
+                 "cache_ttl", "prefetch_depth", "sync_interval", "cache")
+
+    def __init__(self, name: str, route: str = None, label: str = None, db_id: str = None,
+                 db_id_env: str = None, schema: Dict[str, str] = None,
+                 cache_ttl: float = BOARD_CACHE_TTL, cache_maxsize: int = BOARD_CACHE_MAXSIZE,
+                 prefetch_depth: int = BOARD_PREFETCH_DEPTH, sync_interval: float = BOARD_REPLICA_INTERVAL):
+        if not name or not str(name).isidentifier():
+            raise ValueError(f"invalid board name: {name!r}")
+        self.name = name
+        self.route = route or name[:1].upper() + name[1:]
+        self.label = label or name
+        self.db_id_env = db_id_env or f"NOTION_{name.upper()}_DB"
+        self.db_id = db_id or os.getenv(self.db_id_env)
+        self.schema = {**DEFAULT_SCHEMA, **(schema or {})}
+        if self.schema["writer_type"] not in _WRITER_TYPES:
+            raise ValueError(f"board {name}: unsupported writer_type {self.schema['writer_type']!r}")
+        self.cache_ttl = float(cache_ttl)
+        self.prefetch_depth = max(0, int(prefetch_depth))
+        self.sync_interval = float(sync_interval)
+        self.cache = TTLCache(maxsize=int(cache_maxsize), ttl=self.cache_ttl)
+
+    def post_properties(self, title: str, writer: str, date: str) -> dict:
+        """글 작성용 Notion properties (schema의 property 이름 / writer 타입에 맞춤)"""
+        writer_type = self.schema["writer_type"]
+        if writer_type == "rich_text":
+            writer_value = [{"text": {"content": writer}}]
+        elif writer_type == "multi_select":
+            writer_value = [{"name": writer}]
+        else:
+            writer_value = {"name": writer}
+        return {
+            self.schema["title"]: {"title": [{"text": {"content": title}}]},
+            self.schema["writer"]: {writer_type: writer_value},
+            self.schema["date"]: {"date": {"start": date}},
+        }
+
+    def stats(self) -> dict:
+        return {
+            "db_id_set": bool(self.db_id),
+            "prefetch_depth": self.prefetch_depth,
+            "sync_interval": self.sync_interval,
+            "cache": self.cache.stats(),
+        }
+
+
+class BoardRegistry:
+    """
+    게시판 정의 모음. 라우트 / 캐시 / 복제본 / 검색 / 변경 피드가 모두 여기서 게시판 목록을 읽음
+    → 게시판 추가는 BOARDS_CONFIG 설정만으로 가능
+    - remember(): 목록 / 상세 / 쓰기에서 본 게시글 / 댓글 DB / 댓글 row가 어느 게시판 소속인지 기억 (LRU)
+      → clear_caches(ids)가 그 게시판 캐시만 비움
+    """
+
+    def __init__(self, definitions: List[dict], owner_maxsize: int = BOARD_OWNER_MAXSIZE):
+        self.owner_maxsize = owner_maxsize
+        self._owners: "OrderedDict[str, Board]" = OrderedDict()
+        self._owners_lock = threading.Lock()
+        self._boards: "OrderedDict[str, Board]" = OrderedDict()
+        for d in definitions:
+            board = Board(**d)
+            if board.name in self._boards:
+                raise ValueError(f"duplicate board name: {board.name}")
+            if any(b.route == board.route for b in self._boards.values()):
+                raise ValueError(f"duplicate board route: {board.route}")
+            self._boards[board.name] = board
+
+    def __iter__(self):
+        return iter(self._boards.values())
+
+    def __len__(self):
+        return len(self._boards)
+
+    def get(self, name: str) -> Optional[Board]:
+        return self._boards.get(name)
+
+    def for_db(self, db_id: Optional[str]) -> Optional[Board]:
+        compact = _compact_id(db_id)
+        if not compact:
+            return None
+        for board in self._boards.values():
+            if board.db_id and _compact_id(board.db_id) == compact:
+                return board
+        return None
+
+    def for_page(self, page: dict) -> Optional[Board]:
+        """게시글의 parent DB → 게시판"""
+        return self.for_db((page.get("parent") or {}).get("database_id"))
+
+    def db_ids(self) -> List[str]:
+        return [b.db_id for b in self._boards.values() if b.db_id]
+
+    def db_map(self) -> Dict[str, str]:
+        """{board 이름: DB id} (DB id가 설정된 게시판만)"""
+        return {b.name: b.db_id for b in self._boards.values() if b.db_id}
+
+    def sync_intervals(self) -> Dict[str, float]:
+        """{DB id: 복제본 동기화 주기}"""
+        return {b.db_id: b.sync_interval for b in self._boards.values() if b.db_id}
+
+    def remember(self, board: Optional[Board], ids):
+        """ids(게시글 / 댓글 DB / 댓글 row id)가 board 소속임을 기억"""
+        if board is None:
+            return
+        with self._owners_lock:
+            for id_ in ids:
+                key = _compact_id(id_)
+                if not key:
+                    continue
+                self._owners[key] = board
+                self._owners.move_to_end(key)
+            while len(self._owners) > self.owner_maxsize:
+                self._owners.popitem(last=False)
+
+    def owner(self, id_: Optional[str]) -> Optional[Board]:
+        """게시판 DB id 또는 remember()로 기억한 id → 게시판 (모르면 None)"""
+        board = self.for_db(id_)
+        if board is not None:
+            return board
+        with self._owners_lock:
+            return self._owners.get(_compact_id(id_))
+
+    def clear_caches(self, ids=()):
+        """
+        쓰기 발생 시 목록 캐시 무효화.
+        ids(쓴 게시글 / 댓글 DB / 댓글 row / 게시판 DB id)의 게시판만 비우고,
+        ids가 없거나 소속을 모르는 id가 있으면 모든 게시판을 비움
+        """
+        owners = {self.owner(id_) for id_ in ids}
+        if not ids or None in owners:
+            owners = self._boards.values()
+        for board in owners:
+            board.cache.clear()
+
+    def stats(self) -> dict:
+        return {b.name: b.stats() for b in self._boards.values()}
+
+    def owner_count(self) -> int:
+        with self._owners_lock:
+            return len(self._owners)
+
+
+def load_board_definitions(config: str = BOARDS_CONFIG) -> List[dict]:
+    """
+    기본 게시판 정의 + BOARDS_CONFIG(JSON 파일 경로 또는 JSON 배열).
+    같은 name이면 기본 정의에 설정을 덮어쓰고, 새 name이면 뒤에 추가
+    """
+    definitions = OrderedDict((d["name"], dict(d)) for d in _DEFAULT_BOARDS)
+    if config:
+        raw = config.strip()
+        if not raw.startswith("["):
+            with open(raw, encoding="utf-8") as f:
+                raw = f.read()
+        for d in json.loads(raw):
+            if not isinstance(d, dict) or not d.get("name"):
+                raise ValueError(f"BOARDS_CONFIG entry needs a name: {d!r}")
+            definitions[d["name"]] = {**definitions.get(d["name"], {}), **d}
+    return list(definitions.values())
+
+
+board_registry = BoardRegistry(load_board_definitions())
@@ -0,0 +1,102 @@
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict
+
+BOARD_CACHE_TTL = float(os.getenv("BOARD_CACHE_TTL", "30"))
+BOARD_CACHE_MAXSIZE = int(os.getenv("BOARD_CACHE_MAXSIZE", "256"))
+
+# 캐시 키에 포함되는 클라이언트 쿼리 필드 (그 외 필드가 있으면 캐시를 우회)
+CACHEABLE_QUERY_FIELDS = ("page_size", "sorts", "filter", "start_cursor")
+
+
+class TTLCache:
+    """
+    TTL + LRU 방식의 스레드 안전한 메모리 캐시.
+    - ttl 초가 지난 항목은 조회 시 만료 처리
+    - maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - hit / miss / eviction 카운터 제공
+    - generation: clear()마다 증가. read-through 조회는 시작 전에 읽어 set(..., generation=)으로 넘기면
+      조회 도중 무효화가 있었을 때 쓰기 이전 결과를 저장하지 않음
+    """
+
+    def __init__(self, maxsize: int = BOARD_CACHE_MAXSIZE, ttl: float = BOARD_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stale_fills = 0
+        self.generation = 0
+
+    def get(self, key):
+        """캐시 값 반환, 없거나 만료되었으면 None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def contains(self, key) -> bool:
+        """만료되지 않은 항목이 있는지 (hit / miss 카운터와 LRU 순서는 건드리지 않음)"""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def set(self, key, value, generation: Optional[int] = None) -> bool:
+        """저장. generation이 현재 값과 다르면(조회 도중 clear됨) 버리고 False"""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                self.stale_fills += 1
+                return False
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def clear(self):
+        """쓰기 발생 시 즉시 무효화"""
+        with self._lock:
+            self._data.clear()
+            self.generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "stale_fills": self.stale_fills,
+            }
+
+
+def normalize_query(query: Optional[Dict]):
+    """
+    클라이언트 쿼리 바디를 캐시 키 문자열로 정규화.
+    page_size / sorts / filter / start_cursor 외의 필드가 있으면 None(캐시 불가) 반환.
+    """
+    query = query or {}
+    if any(k not in CACHEABLE_QUERY_FIELDS for k in query):
+        return None
+    normalized = {k: query[k] for k in CACHEABLE_QUERY_FIELDS if query.get(k) is not None}
+    return json.dumps(normalized, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
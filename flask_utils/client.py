@@ -0,0 +1,273 @@
+import os
+import asyncio
+import random
+import threading
+import time
+import httpx
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+from .metrics import notion_endpoint, notion_errors, notion_request_seconds, notion_retries, notion_wait_seconds
+from .scheduler import PRIORITY_INTERACTIVE, notion_scheduler
+from .singleflight import SingleFlight, request_key
+
+# 로컬 Notion 대역(bench/fake_notion.py) 등으로 바꿀 때 NOTION_BASE_URL 지정
+NOTION_BASE = os.getenv("NOTION_BASE_URL", "https://api.notion.com/v1")
+NOTION_VERSION = "2022-06-28"  # 안정적인 버전 고정
+
+# 커넥션 풀 / 타임아웃 기본값 (환경변수로 조정 가능)
+NOTION_POOL_SIZE = int(os.getenv("NOTION_POOL_SIZE", "16"))
+NOTION_CONNECT_TIMEOUT = float(os.getenv("NOTION_CONNECT_TIMEOUT", "3.05"))
+NOTION_READ_TIMEOUT = float(os.getenv("NOTION_READ_TIMEOUT", "20"))
+# 독립적인 Notion 호출을 동시에 보낼 때 사용하는 워커 수 (풀 크기 이하로 유지)
+NOTION_FANOUT_WORKERS = int(os.getenv("NOTION_FANOUT_WORKERS", "8"))
+# 429 / 일시적 5xx 재시도 설정
+NOTION_MAX_RETRIES = int(os.getenv("NOTION_MAX_RETRIES", "4"))
+NOTION_BACKOFF_BASE = float(os.getenv("NOTION_BACKOFF_BASE", "0.5"))
+NOTION_BACKOFF_MAX = float(os.getenv("NOTION_BACKOFF_MAX", "8"))
+
+_TRANSIENT_STATUSES = (502, 503, 504)
+
+
+def _backoff(attempt: int) -> float:
+    """지수 backoff + jitter"""
+    return min(NOTION_BACKOFF_MAX, NOTION_BACKOFF_BASE * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+
+def _retry_after(resp) -> float:
+    try:
+        return max(0.0, float(resp.headers.get("Retry-After", "")))
+    except ValueError:
+        return 0.0
+
+
+class _AsyncTransport:
+    """
+    httpx.AsyncClient를 소유한 백그라운드 이벤트 루프 스레드 (첫 비동기 호출 때 시작).
+    Flask async view는 요청마다 새 이벤트 루프에서 실행되므로,
+    비동기 Notion 호출을 모두 이 루프 하나에서 처리해 커넥션 풀 / single-flight를 요청 간에 공유.
+    """
+
+    def __init__(self, headers: dict, timeout, pool_size: int):
+        self._headers = headers
+        self._timeout = timeout
+        self._pool_size = pool_size
+        self._lock = threading.Lock()
+        self.loop = None
+        self.client = None
+
+    def _start(self):
+        with self._lock:
+            if self.loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="notion-aio", daemon=True).start()
+                self.client = httpx.AsyncClient(
+                    headers=self._headers,
+                    timeout=_httpx_timeout(self._timeout),
+                    # requests 풀처럼 keep-alive 수만 제한 (동시 호출 수는 스케줄러가 제한)
+                    limits=httpx.Limits(max_connections=None, max_keepalive_connections=self._pool_size),
+                )
+                self.loop = loop
+        return self.loop
+
+    async def run(self, coro):
+        """coro를 전송 루프에서 실행하고 결과를 호출한 루프에서 기다림"""
+        loop = self.loop or self._start()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def _httpx_timeout(timeout):
+    """requests 형식 (connect, read) 타임아웃 → httpx.Timeout"""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return timeout
+
+
+class NotionClient:
+    """
+    모든 Notion API 호출이 공유하는 HTTP 클라이언트.
+    - keep-alive requests.Session + 크기가 정해진 커넥션 풀 → 매 호출마다 TCP/TLS 핸드셰이크 X
+    - Authorization / Notion-Version / Content-Type 헤더를 미리 구성
+    - 기본 타임아웃 (connect, read) 적용
+    - 모든 호출은 notion_scheduler의 토큰 버킷을 거치고,
+      429(Retry-After 준수) / 읽기 요청의 일시적 5xx는 jitter backoff로 자동 재시도
+    - 동시에 들어온 동일한 읽기 요청(method + URL + body)은 upstream 호출 1번으로 합침
+    - 동기(get / post / patch)와 비동기(aget / apost / apatch) 호출을 같은 스케줄러 / 재시도 / 지표로 처리
+      (비동기 경로는 httpx.AsyncClient, 응답 객체는 status_code / json() / text / headers를 동일하게 제공)
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: str = NOTION_BASE,
+        version: str = NOTION_VERSION,
+        pool_size: int = NOTION_POOL_SIZE,
+        timeout=(NOTION_CONNECT_TIMEOUT, NOTION_READ_TIMEOUT),
+        scheduler=notion_scheduler,
+        max_retries: int = NOTION_MAX_RETRIES,
+    ):
+        self.api_key = api_key or os.getenv("NOTION_API_KEY")
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.scheduler = scheduler
+        self.max_retries = max_retries
+        self.singleflight = SingleFlight()
+
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Notion-Version": version,
+            "Content-Type": "application/json",
+        }
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(headers)
+        self._aio = _AsyncTransport(headers, timeout, pool_size)
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    @staticmethod
+    def _is_read(method: str, path: str) -> bool:
+        # pages / blocks children 조회(GET)와 databases query는 읽기 요청
+        return method == "GET" or path.rstrip("/").endswith("/query")
+
+    def request(
+        self, method: str, path: str, priority: int = PRIORITY_INTERACTIVE, **kwargs
+    ) -> requests.Response:
+        """
+        path는 base_url 기준 상대경로 (예: "pages/{id}").
+        priority: 스케줄러 레인 (PRIORITY_INTERACTIVE / PRIORITY_BACKGROUND)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if not self._is_read(method, path):
+            return self._send(method, path, priority, False, kwargs)
+
+        key = request_key(method, self.url(path), kwargs.get("params"), kwargs.get("json"))
+        return self.singleflight.do(key, lambda: self._send(method, path, priority, True, kwargs))
+
+    def _retry_delay(self, resp, attempt: int, is_read: bool):
+        """
+        재시도 여부 판단.
+        - 429: Retry-After 동안 스케줄러 전체 보류 (+ jitter로 동시 재시도 분산) → 0 (토큰 대기로 지연)
+        - 읽기 요청의 일시적 5xx: backoff 시간
+        - 그 외 / 재시도 한도 초과: None
+        """
+        if attempt >= self.max_retries:
+            return None
+        if resp.status_code == 429:
+            delay = _retry_after(resp) or _backoff(attempt)
+            self.scheduler.pause(delay + random.uniform(0, NOTION_BACKOFF_BASE))
+            return 0.0
+        if resp.status_code in _TRANSIENT_STATUSES and is_read:
+            return _backoff(attempt)
+        return None
+
+    def _observe(self, method: str, path: str, started: float, waited: float, status: str):
+        endpoint = notion_endpoint(method, path)
+        notion_request_seconds.observe(endpoint, method, value=time.perf_counter() - started)
+        notion_wait_seconds.observe(endpoint, method, value=waited)
+        if not status.startswith("2"):
+            notion_errors.inc(endpoint, method, status)
+
+    def _record_retry(self, method: str, path: str, status_code: int):
+        self.scheduler.record_retry(status_code)
+        notion_retries.inc(notion_endpoint(method, path), method, str(status_code))
+
+    def _send(self, method: str, path: str, priority: int, is_read: bool, kwargs: dict):
+        """스케줄러 토큰을 받아 전송하고, 429 / (읽기) 5xx는 재시도"""
+        started = time.perf_counter()
+        waited = 0.0
+        status = "exception"
+        attempt = 0
+        try:
+            while True:
+                waited += self.scheduler.acquire(priority)
+                resp = self.session.request(method, self.url(path), **kwargs)
+                status = str(resp.status_code)
+                if is_read:
+                    # 여러 호출자가 공유하므로 본문을 미리 읽어 둠
+                    resp.content
+                delay = self._retry_delay(resp, attempt, is_read)
+                if delay is None:
+                    return resp
+                if delay:
+                    time.sleep(delay)
+                self._record_retry(method, path, resp.status_code)
+                attempt += 1
+        finally:
+            self._observe(method, path, started, waited, status)
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", path, **kwargs)
+
+    # =========================
+    # 비동기 경로 (Flask async view 용)
+    # =========================
+    async def arequest(
+        self, method: str, path: str, priority: int = PRIORITY_INTERACTIVE, **kwargs
+    ) -> httpx.Response:
+        """request()의 비동기 버전. 어느 이벤트 루프에서든 await 가능"""
+        return await self._aio.run(self._arequest(method, path, priority, kwargs))
+
+    async def _arequest(self, method: str, path: str, priority: int, kwargs: dict):
+        if "timeout" in kwargs:
+            kwargs["timeout"] = _httpx_timeout(kwargs["timeout"])
+        if not self._is_read(method, path):
+            return await self._asend(method, path, priority, False, kwargs)
+
+        key = request_key(method, self.url(path), kwargs.get("params"), kwargs.get("json"))
+        return await self.singleflight.ado(key, lambda: self._asend(method, path, priority, True, kwargs))
+
+    async def _asend(self, method: str, path: str, priority: int, is_read: bool, kwargs: dict):
+        """_send와 동일한 스케줄러 / 재시도 규칙 (토큰 대기는 루프를 막지 않도록 워커 스레드에서)"""
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        waited = 0.0
+        status = "exception"
+        attempt = 0
+        try:
+            while True:
+                if not self.scheduler.try_acquire(priority):
+                    waited += await loop.run_in_executor(None, self.scheduler.acquire, priority)
+                resp = await self._aio.client.request(method, self.url(path), **kwargs)
+                status = str(resp.status_code)
+                delay = self._retry_delay(resp, attempt, is_read)
+                if delay is None:
+                    return resp
+                if delay:
+                    await asyncio.sleep(delay)
+                self._record_retry(method, path, resp.status_code)
+                attempt += 1
+        finally:
+            self._observe(method, path, started, waited, status)
+
+    async def aget(self, path: str, **kwargs) -> httpx.Response:
+        return await self.arequest("GET", path, **kwargs)
+
+    async def apost(self, path: str, **kwargs) -> httpx.Response:
+        return await self.arequest("POST", path, **kwargs)
+
+    async def apatch(self, path: str, **kwargs) -> httpx.Response:
+        return await self.arequest("PATCH", path, **kwargs)
+
+
+# 프로세스 전역에서 공유하는 단일 클라이언트
+notion_client = NotionClient()
+
+# 한 요청 안의 독립적인 Notion 호출(fan-out)을 병렬로 처리하는 공유 워커 풀
+notion_executor = ThreadPoolExecutor(
+    max_workers=min(NOTION_FANOUT_WORKERS, NOTION_POOL_SIZE),
+    thread_name_prefix="notion-fanout",
+)
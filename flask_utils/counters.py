@@ -0,0 +1,212 @@
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .likes import like_aggregator
+from .log import get_logger
+from .notion import notion_query_all
+from .replica import board_replica
+from .scheduler import PRIORITY_BACKGROUND
+
+_log = get_logger("counters")
+
+# commentSubDB 안에서 게시글 좋아요를 담는 row의 subWriter 값 (댓글 수에서 제외)
+LIKE_ROW_WRITER = "contentLikeCount"
+
+
+def _now_iso() -> str:
+    """Notion last_edited_time과 같은 형식 (문자열 비교 가능)"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+
+
+def _writer(row: dict) -> str:
+    title = ((row.get("properties") or {}).get("subWriter") or {}).get("title") or []
+    return "".join(t.get("plain_text", "") for t in title)
+
+
+def _like_count(row: dict) -> int:
+    names = like_aggregator.current(row.get("id"))
+    if names is not None:
+        return len(names)
+    like = ((row.get("properties") or {}).get("like") or {}).get("multi_select") or []
+    return len(like)
+
+
+def board_pages(db_id: str) -> Optional[List[dict]]:
+    """게시판의 모든 게시글 (복제본이 준비됐으면 로컬, 아니면 Notion background 레인). 실패 시 None"""
+    if board_replica and board_replica.is_ready(db_id):
+        pages, cursor = [], None
+        while True:
+            data = board_replica.query_board(db_id, {"page_size": 100, "start_cursor": cursor})
+            pages.extend(data["results"])
+            if not data["has_more"]:
+                return pages
+            cursor = data["next_cursor"]
+    pages, err = notion_query_all(db_id, max_rows=10000, priority=PRIORITY_BACKGROUND)
+    if err:
+        _log.warning("게시판 전체 조회 실패", db_id=db_id, error=err)
+    return pages
+
+
+class _PostCount:
+    __slots__ = ("comments", "likes", "comment_likes", "last_activity", "rows")
+
+    def __init__(self):
+        self.comments = 0
+        self.likes = 0
+        self.comment_likes = 0
+        self.last_activity = ""
+        self.rows = set()
+
+    def as_dict(self, last_edited_time: Optional[str]) -> dict:
+        return {
+            "comments": self.comments,
+            "likes": self.likes,
+            "comment_likes": self.comment_likes,
+            "last_activity": max(self.last_activity, last_edited_time or "") or None,
+        }
+
+
+class PostCounters:
+    """
+    게시글별 댓글 수 / 좋아요 수 / 마지막 활동 시각 인덱스 (메모리).
+    - 쓰기 라우트(addComment / deleteComment / 좋아요 토글)가 성공할 때마다 증감
+    - 상세 조회에서 이미 받아 온 댓글 row로 해당 게시글을 다시 계산 (추가 호출 X)
+    - 전체 재계산은 별도로 크롤링하지 않음: search_index 재색인이 게시글마다 observe()를 부르고,
+      끝나면 retain()으로 목록에서 사라진(삭제된) 게시글을 정리
+    - 목록 item에는 merge()로 "counts"를 붙임 (모르는 게시글은 None)
+    """
+
+    def __init__(self):
+        self._posts: Dict[str, _PostCount] = {}
+        self._rows: Dict[str, list] = {}   # row_id -> [page_id, is_like_row, like_count]
+        self._dbs: Dict[str, str] = {}     # comment_db_id -> page_id
+        self._lock = threading.Lock()
+        self.reconciles = 0
+        self.last_reconcile = None
+
+    # -------------------------
+    # 재계산
+    # -------------------------
+    def observe(self, page_id: str, comment_dbs: List[tuple]):
+        """게시글 하나의 [(comment_db_id, rows)]로 카운터를 다시 계산"""
+        post = _PostCount()
+        rows = {}
+        for db_id, db_rows in comment_dbs:
+            for row in db_rows:
+                if row.get("archived"):
+                    continue
+                is_like_row = _writer(row) == LIKE_ROW_WRITER
+                likes = _like_count(row)
+                rows[row["id"]] = [page_id, is_like_row, likes]
+                if is_like_row:
+                    post.likes += likes
+                else:
+                    post.comments += 1
+                    post.comment_likes += likes
+                post.last_activity = max(post.last_activity, row.get("last_edited_time") or "")
+        post.rows = set(rows)
+
+        with self._lock:
+            old = self._posts.get(page_id)
+            if old is not None:
+                for row_id in old.rows - post.rows:
+                    self._rows.pop(row_id, None)
+            self._posts[page_id] = post
+            self._rows.update(rows)
+            for db_id, _ in comment_dbs:
+                self._dbs[db_id] = page_id
+
+    def retain(self, page_ids):
+        """전체 재색인이 끝난 뒤 호출: page_ids(모든 게시판의 현재 게시글)에 없는 게시글 정리"""
+        with self._lock:
+            for page_id in [p for p in self._posts if p not in page_ids]:
+                self._drop(page_id)
+            self.reconciles += 1
+            self.last_reconcile = _now_iso()
+
+    # -------------------------
+    # 쓰기 라우트 증감
+    # -------------------------
+    def comment_added(self, comment_db_id: str, row: dict):
+        """addComment 반영 성공 (row: Notion이 돌려준 댓글 페이지)"""
+        with self._lock:
+            page_id = self._dbs.get(comment_db_id)
+            post = self._posts.get(page_id)
+            if post is None or row["id"] in self._rows:
+                return
+            post.comments += 1
+            post.rows.add(row["id"])
+            post.last_activity = max(post.last_activity, row.get("last_edited_time") or _now_iso())
+            self._rows[row["id"]] = [page_id, False, 0]
+
+    def row_archived(self, row_id: str):
+        """deleteComment / 게시글 삭제 반영 성공"""
+        with self._lock:
+            if row_id in self._posts:
+                self._drop(row_id)
+                return
+            entry = self._rows.pop(row_id, None)
+            post = self._posts.get(entry[0]) if entry else None
+            if post is None:
+                return
+            post.rows.discard(row_id)
+            if entry[1]:
+                post.likes -= entry[2]
+            else:
+                post.comments -= 1
+                post.comment_likes -= entry[2]
+            post.last_activity = max(post.last_activity, _now_iso())
+
+    def likes_changed(self, row_id: str, count: int, comment_db_id: str = None):
+        """좋아요 토글 (count: 토글 후 이름 수). 게시글 좋아요는 comment_db_id로 처음 보는 row도 연결"""
+        with self._lock:
+            entry = self._rows.get(row_id)
+            if entry is None:
+                page_id = self._dbs.get(comment_db_id)
+                if page_id not in self._posts:
+                    return
+                entry = self._rows[row_id] = [page_id, True, 0]
+                self._posts[page_id].rows.add(row_id)
+            post = self._posts.get(entry[0])
+            if post is None:
+                return
+            if entry[1]:
+                post.likes += count - entry[2]
+            else:
+                post.comment_likes += count - entry[2]
+            entry[2] = count
+            post.last_activity = max(post.last_activity, _now_iso())
+
+    def _drop(self, page_id: str):
+        post = self._posts.pop(page_id, None)
+        if post is not None:
+            for row_id in post.rows:
+                self._rows.pop(row_id, None)
+        for db_id in [d for d, p in self._dbs.items() if p == page_id]:
+            del self._dbs[db_id]
+
+    # -------------------------
+    # 조회
+    # -------------------------
+    def merge(self, items: List[dict]) -> List[dict]:
+        """목록 item마다 "counts" 추가 (원본 item은 캐시에 있으므로 복사본 반환)"""
+        with self._lock:
+            out = []
+            for it in items:
+                post = self._posts.get(it.get("id"))
+                counts = post.as_dict(it.get("last_edited_time")) if post is not None else None
+                out.append({**it, "counts": counts})
+            return out
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "posts": len(self._posts),
+                "rows": len(self._rows),
+                "reconciles": self.reconciles,
+                "last_reconcile": self.last_reconcile,
+            }
+
+
+post_counters = PostCounters()
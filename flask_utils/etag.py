@@ -0,0 +1,37 @@
+import hashlib
+import json
+
+
+def pages_etag(pages, *extra) -> str:
+    """
+    페이지(또는 단순화된 item) 목록의 id + last_edited_time (+ 목록 item의 counts)으로 강한 ETag 생성.
+    extra: 같은 페이지 목록이라도 응답이 달라지는 값 (커서, 잘림 여부 등)
+    """
+    h = hashlib.sha1()
+    for p in pages:
+        h.update(f"{p.get('id')}:{p.get('last_edited_time')}:{p.get('counts')}\n".encode("utf-8"))
+    if extra:
+        h.update(json.dumps(extra, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+def listing_etag(listing: dict, *extra) -> str:
+    """목록 응답({has_more, next_cursor, items})의 ETag"""
+    return pages_etag(listing["items"], listing.get("has_more"), listing.get("next_cursor"), *extra)
+
+
+def page_detail_etag(detail: dict, *extra) -> str:
+    """
+    상세 응답의 ETag.
+    - 게시글 + 모든 댓글 row의 id / last_edited_time
+    - 댓글 row의 좋아요 목록 (Notion 반영 전 토글도 응답에 보이므로 포함)
+    """
+    pages = [detail["page"]]
+    likes = []
+    for db in detail["comment_dbs"]:
+        pages.append({"id": db["db_id"], "last_edited_time": len(db["items"])})
+        for item in db["items"]:
+            pages.append(item)
+            like = (item.get("properties") or {}).get("like") or {}
+            likes.append([x.get("name") for x in like.get("multi_select", [])])
+    return pages_etag(pages, detail.get("blocks_truncated"), likes, *extra)
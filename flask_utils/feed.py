@@ -0,0 +1,327 @@
+import os
+import json
+import hashlib
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional
+
+from .client import notion_client
+from .counters import LIKE_ROW_WRITER
+from .log import get_logger
+from .scheduler import PRIORITY_BACKGROUND
+
+_log = get_logger("feed")
+
+# 구독자가 있을 때만 이 주기(초)로 Notion 변경 조회
+FEED_POLL_INTERVAL = float(os.getenv("FEED_POLL_INTERVAL", "5"))
+# 한 주기에 조회하는 댓글 DB 수 (순서대로 돌아가며, 최근 본 게시글 우선)
+FEED_COMMENT_DBS_PER_POLL = int(os.getenv("FEED_COMMENT_DBS_PER_POLL", "4"))
+# DB 하나를 한 주기에 최대 몇 장(100개씩)까지 읽을지. 남은 변경은 다음 주기에 이어서
+FEED_QUERY_MAX_PAGES = int(os.getenv("FEED_QUERY_MAX_PAGES", "5"))
+# Last-Event-ID 재접속 때 다시 보내 줄 최근 이벤트 수
+FEED_BACKLOG = int(os.getenv("FEED_BACKLOG", "256"))
+# 구독자별 대기열 크기 (넘치면 끊고 재접속 → backlog로 따라잡음)
+FEED_CLIENT_QUEUE = int(os.getenv("FEED_CLIENT_QUEUE", "64"))
+FEED_HEARTBEAT = float(os.getenv("FEED_HEARTBEAT", "15"))
+# 연결 하나의 최대 유지 시간(초). 닫히면 EventSource가 Last-Event-ID로 자동 재접속.
+# Vercel에서는 함수 실행 시간 한도(기본 10초) 안에 닫도록 기본 8초
+FEED_STREAM_MAX_SECONDS = float(os.getenv("FEED_STREAM_MAX_SECONDS", "8" if os.getenv("VERCEL") else "300"))
+FEED_RETRY_MS = int(os.getenv("FEED_RETRY_MS", "3000"))
+
+
+def _plain(prop: Optional[dict], key: str) -> str:
+    return "".join(t.get("plain_text", "") for t in ((prop or {}).get(key) or []))
+
+
+def _version(page: dict) -> str:
+    """
+    변경 판별용 버전. Notion last_edited_time은 분 단위로 잘리므로
+    같은 분 안의 수정(좋아요 등)도 구분되도록 property 해시를 함께 사용
+    """
+    props = json.dumps(page.get("properties"), sort_keys=True, ensure_ascii=False)
+    return f"{page.get('last_edited_time')}:{hashlib.sha1(props.encode('utf-8')).hexdigest()}"
+
+
+def post_event(page: dict, board: str, action: str) -> dict:
+    props = page.get("properties", {})
+    return {
+        "type": "post",
+        "action": action,
+        "board": board,
+        "id": page["id"],
+        "post_id": page["id"],
+        "title": _plain(props.get("title"), "title"),
+        "last_edited_time": page.get("last_edited_time"),
+    }
+
+
+def comment_event(row: dict, post_id: str, board: str, action: str) -> dict:
+    props = row.get("properties", {})
+    writer = _plain(props.get("subWriter"), "title")
+    likes = len((props.get("like") or {}).get("multi_select") or [])
+    if writer == LIKE_ROW_WRITER:
+        return {"type": "likes", "action": action, "board": board, "id": row["id"], "post_id": post_id,
+                "likes": likes, "last_edited_time": row.get("last_edited_time")}
+    return {
+        "type": "comment",
+        "action": action,
+        "board": board,
+        "id": row["id"],
+        "post_id": post_id,
+        "writer": writer,
+        "text": _plain(props.get("text"), "rich_text"),
+        "likes": likes,
+        "last_edited_time": row.get("last_edited_time"),
+    }
+
+
+def format_sse(event: dict) -> str:
+    data = json.dumps({k: v for k, v in event.items() if k != "seq"}, ensure_ascii=False)
+    return f"id: {event['seq']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+
+class _Subscriber:
+    __slots__ = ("queue", "dropped")
+
+    def __init__(self):
+        self.queue = queue.Queue(maxsize=FEED_CLIENT_QUEUE)
+        self.dropped = False
+
+
+class ChangeFeed:
+    """
+    게시판 / 댓글 DB 변경 피드 (프로세스당 poller 1개 → SSE 구독자 전체에 fan-out).
+    - 게시판 DB: 주기마다 last_edited_time 체크포인트 이후 페이지만 조회 (DB당 호출 1번)
+    - 댓글 DB: 상세 조회 / 재색인에서 알게 된 DB를 주기마다 FEED_COMMENT_DBS_PER_POLL개씩 돌아가며 조회
+    - 이 서버를 거친 쓰기는 publish()로 즉시 알림 (poller가 같은 버전을 다시 보내지 않음)
+    - 구독자가 없으면 poller는 Notion을 호출하지 않음 → Notion 부하는 접속한 브라우저 수가 아니라
+      구독자가 있는 프로세스 수에 비례 (서버리스에서는 인스턴스마다 poller가 따로 돎 → FEED_POLL_INTERVAL로 조절)
+    """
+
+    def __init__(self, client=notion_client):
+        self.client = client
+        self._lock = threading.Lock()
+        self._boards: Dict[str, str] = {}                   # db_id -> board 이름
+        self._comment_dbs: "OrderedDict[str, tuple]" = OrderedDict()  # db_id -> (post_id, board)
+        self._checkpoints: Dict[str, str] = {}
+        self._versions: Dict[str, str] = {}
+        self._subscribers = set()
+        self._backlog = deque(maxlen=FEED_BACKLOG)
+        # 이벤트 id: 프로세스 시작 시각(ms)부터 증가 → 재시작 전 Last-Event-ID는 backlog보다 오래된 것으로 처리
+        self._seq = int(time.time() * 1000)
+        self._wake = threading.Event()
+        self._thread = None
+        self.polls = 0
+        self.published = 0
+        self.dropped = 0
+
+    # -------------------------
+    # 감시 대상
+    # -------------------------
+    def watch_boards(self, boards: Dict[str, str]):
+        """boards: {board 이름: DB id}"""
+        with self._lock:
+            self._boards = {db_id: name for name, db_id in boards.items() if db_id}
+
+    def watch_comment_db(self, db_id: str, post_id: str, board: str):
+        """댓글 DB 감시 등록 (최근 본 게시글일수록 먼저 조회)"""
+        with self._lock:
+            self._comment_dbs[db_id] = (post_id, board)
+            self._comment_dbs.move_to_end(db_id, last=False)
+
+    # -------------------------
+    # 발행 / 구독
+    # -------------------------
+    def publish(self, event: dict, page: dict = None):
+        """이벤트 발행. page(원본)를 주면 그 버전을 기록해 poller가 같은 변경을 다시 보내지 않음"""
+        with self._lock:
+            if page is not None:
+                self._versions[page["id"]] = _version(page)
+            self._seq += 1
+            event = {**event, "seq": self._seq}
+            self._backlog.append(event)
+            subscribers = list(self._subscribers)
+            self.published += 1
+        for sub in subscribers:
+            try:
+                sub.queue.put_nowait(event)
+            except queue.Full:
+                # 느린 구독자는 끊음 → 재접속하면 Last-Event-ID로 backlog에서 따라잡음
+                sub.dropped = True
+                self.dropped += 1
+                self._unsubscribe(sub)
+
+    def comment_changed(self, comment_db_id: str, row: dict, action: str):
+        """이 서버를 거친 댓글 쓰기 (게시글 / 게시판은 감시 중인 댓글 DB에서 찾음)"""
+        with self._lock:
+            post_id, board = self._comment_dbs.get(comment_db_id, (None, None))
+        self.publish(comment_event(row, post_id, board, action), row)
+
+    def likes_changed(self, row_id: str, count: int, comment_db_id: str = None):
+        """좋아요 토글 (Notion 반영 전이라 버전은 기록하지 않음 → 반영 후 poller가 한 번 더 알림)"""
+        with self._lock:
+            post_id, board = self._comment_dbs.get(comment_db_id, (None, None))
+        self.publish({"type": "likes", "action": "updated", "board": board, "id": row_id,
+                      "post_id": post_id, "likes": count})
+
+    def _subscribe(self, last_event_id):
+        sub = _Subscriber()
+        with self._lock:
+            self._subscribers.add(sub)
+            replay = None
+            if last_event_id is not None:
+                oldest = self._backlog[0]["seq"] if self._backlog else self._seq + 1
+                if last_event_id + 1 < oldest:
+                    replay = [{"type": "reset", "seq": self._seq}]  # 놓친 이벤트가 backlog보다 오래됨 → 전체 새로고침
+                else:
+                    replay = [e for e in self._backlog if e["seq"] > last_event_id]
+        self.start()
+        self._wake.set()
+        return sub, replay or []
+
+    def _unsubscribe(self, sub: _Subscriber):
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def stream(self, last_event_id: Optional[str] = None, max_seconds: float = FEED_STREAM_MAX_SECONDS):
+        """
+        SSE 응답 본문 generator.
+        - 재접속(Last-Event-ID)이면 backlog에서 놓친 이벤트부터
+        - FEED_HEARTBEAT마다 주석 줄로 연결 유지, max_seconds 후 종료 (클라이언트가 재접속)
+        """
+        try:
+            last = int(last_event_id) if last_event_id not in (None, "") else None
+        except ValueError:
+            last = None
+        sub, replay = self._subscribe(last)
+        try:
+            yield f"retry: {FEED_RETRY_MS}\n\n"
+            for event in replay:
+                yield format_sse(event)
+            deadline = time.monotonic() + max_seconds
+            while not sub.dropped:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    event = sub.queue.get(timeout=min(FEED_HEARTBEAT, remaining))
+                except queue.Empty:
+                    yield ": ping\n\n"
+                    continue
+                yield format_sse(event)
+        finally:
+            self._unsubscribe(sub)
+
+    # -------------------------
+    # Notion polling
+    # -------------------------
+    def _query(self, db_id: str, query: dict) -> Optional[dict]:
+        resp = self.client.post(f"databases/{db_id}/query", json=query, priority=PRIORITY_BACKGROUND)
+        if resp.status_code != 200:
+            _log.warning("변경 피드 조회 실패", db_id=db_id, status=resp.status_code)
+            return None
+        return resp.json()
+
+    def _changed(self, db_id: str) -> Optional[List[dict]]:
+        """
+        체크포인트 이후 수정된 페이지 중 버전이 바뀐 것 (수정 시각 순, 첫 조회는 기준점만 잡고 빈 목록).
+        커서를 따라 FEED_QUERY_MAX_PAGES장까지 읽고, 체크포인트는 실제로 읽은 페이지까지만 전진
+        """
+        since = self._checkpoints.get(db_id)
+        if not since:
+            data = self._query(db_id, {
+                "page_size": 100, "sorts": [{"timestamp": "last_edited_time", "direction": "descending"}],
+            })
+            if data is None:
+                return None
+            pages = data.get("results", [])
+            with self._lock:
+                for p in pages:
+                    self._versions[p["id"]] = _version(p)
+                latest = max((p.get("last_edited_time") or "" for p in pages), default="")
+                # 빈 DB → 지금부터
+                self._checkpoints[db_id] = latest or time.strftime("%Y-%m-%dT%H:%M:00.000Z", time.gmtime())
+            return []
+
+        query = {
+            "page_size": 100,
+            "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+            "filter": {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": since}},
+        }
+        changed = []
+        for _ in range(max(1, FEED_QUERY_MAX_PAGES)):
+            data = self._query(db_id, query)
+            if data is None:
+                break
+            pages = data.get("results", [])
+            with self._lock:
+                for p in pages:
+                    version = _version(p)
+                    if self._versions.get(p["id"]) != version:
+                        created = p["id"] not in self._versions and (p.get("created_time") or "") >= since
+                        changed.append((p, created))
+                        self._versions[p["id"]] = version
+                latest = max([p.get("last_edited_time") or "" for p in pages] + [self._checkpoints[db_id]])
+                self._checkpoints[db_id] = latest
+            if not data.get("has_more"):
+                break
+            query["start_cursor"] = data.get("next_cursor")
+        else:
+            _log.info("변경 피드: 남은 변경은 다음 주기에 이어서 조회", db_id=db_id, checkpoint=self._checkpoints[db_id])
+        if data is None and not changed:
+            return None
+        return changed
+
+    def poll_once(self):
+        with self._lock:
+            boards = dict(self._boards)
+            comment_dbs = list(self._comment_dbs.items())[:FEED_COMMENT_DBS_PER_POLL]
+            for db_id, _ in comment_dbs:
+                self._comment_dbs.move_to_end(db_id)
+
+        for db_id, board in boards.items():
+            for page, created in self._changed(db_id) or []:
+                self.publish(post_event(page, board, "created" if created else "updated"))
+        for db_id, (post_id, board) in comment_dbs:
+            for row, created in self._changed(db_id) or []:
+                self.publish(comment_event(row, post_id, board, "created" if created else "updated"))
+        self.polls += 1
+
+    def _run(self):
+        while True:
+            with self._lock:
+                idle = not self._subscribers
+            if idle:
+                # 구독자가 생길 때까지 Notion 호출 없이 대기
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            try:
+                self.poll_once()
+            except Exception:
+                _log.error("변경 피드 poll 실패", exc_info=True)
+            time.sleep(FEED_POLL_INTERVAL)
+
+    def start(self):
+        """poller 스레드 시작 (첫 구독 때, 프로세스당 1회)"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="change-feed", daemon=True)
+                self._thread.start()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "boards": len(self._boards),
+                "comment_dbs": len(self._comment_dbs),
+                "polls": self.polls,
+                "published": self.published,
+                "dropped": self.dropped,
+                "last_seq": self._seq,
+            }
+
+
+change_feed = ChangeFeed()
@@ -0,0 +1,69 @@
+import os
+
+from .cache import TTLCache
+from .singleflight import SingleFlight
+
+# 같은 Idempotency-Key 재요청에 첫 결과를 돌려주는 시간(초)
+IDEMPOTENCY_TTL = float(os.getenv("IDEMPOTENCY_TTL", "600"))
+IDEMPOTENCY_MAXSIZE = int(os.getenv("IDEMPOTENCY_MAXSIZE", "1024"))
+
+
+class IdempotencyStore:
+    """
+    쓰기 요청 중복 방지.
+    - 진행 중인 같은 key 요청은 single-flight로 첫 요청의 결과를 기다림
+    - 성공한 결과(body, status)는 ttl 동안 보관 → 클라이언트 재시도에 같은 응답
+    - 실패한 결과는 보관하지 않음 (재시도 시 다시 실행)
+    - 메모리에 결과가 없으면(재시작 / 다른 인스턴스) recover()로 이미 반영된 결과를 먼저 확인
+    - claim(resource_id): 어떤 key의 결과로 확인된 리소스 표시 → recover가 다른 key의 결과를 가져가지 않도록
+    """
+
+    def __init__(self, ttl: float = IDEMPOTENCY_TTL, maxsize: int = IDEMPOTENCY_MAXSIZE):
+        self.ttl = ttl
+        self._done = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._claimed = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight = SingleFlight()
+        self.replayed = 0
+        self.recovered = 0
+
+    def run(self, key, fn, recover=None):
+        """
+        fn() → (body(dict), status). key가 None이면(헤더 없음) 그냥 실행.
+        key는 (라우트, Idempotency-Key 헤더 값)처럼 호출 범위를 포함해야 함.
+        recover() → (body, status) | None: fn 전에 호출, 결과가 있으면 fn 대신 반환
+            (성공 결과는 재응답으로 표시, 실패 결과는 보관하지 않음 → 재시도 시 다시 확인)
+        반환: (body, status, replayed)
+        """
+        if key is None:
+            body, status = fn()
+            return body, status, False
+
+        cached = self._done.get(key)
+        if cached is not None:
+            self.replayed += 1
+            return cached[0], cached[1], True
+
+        def execute():
+            found = recover() if recover else None
+            body, status = found if found is not None else fn()
+            if status < 400:
+                self._done.set(key, (body, status))
+            recovered = found is not None and status < 400
+            if recovered:
+                self.recovered += 1
+            return body, status, recovered
+
+        return self._inflight.do(key, execute)
+
+    def claim(self, resource_id: str):
+        self._claimed.set(resource_id, True)
+
+    def claimed(self, resource_id: str) -> bool:
+        return self._claimed.contains(resource_id)
+
+    def stats(self) -> dict:
+        return {"replayed": self.replayed, "recovered": self.recovered,
+                **self._done.stats(), **self._inflight.stats()}
+
+
+idempotency_store = IdempotencyStore()
@@ -0,0 +1,347 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from .client import notion_client
+from .log import get_logger
+
+_log = get_logger("journal")
+
+# 비어 있으면 쓰기 저널 비활성화 → 쓰기 라우트는 Notion에 동기 호출 (예: /tmp/write_journal.sqlite3)
+WRITE_JOURNAL_PATH = os.getenv("WRITE_JOURNAL_PATH", "")
+# 서로 다른 대상(target)의 쓰기를 동시에 반영하는 워커 수
+WRITE_JOURNAL_WORKERS = int(os.getenv("WRITE_JOURNAL_WORKERS", "4"))
+# 반영 실패 시 재시도 (지수 backoff, 최대 대기 WRITE_JOURNAL_RETRY_MAX초)
+WRITE_JOURNAL_MAX_ATTEMPTS = int(os.getenv("WRITE_JOURNAL_MAX_ATTEMPTS", "8"))
+WRITE_JOURNAL_RETRY_BASE = float(os.getenv("WRITE_JOURNAL_RETRY_BASE", "1"))
+WRITE_JOURNAL_RETRY_MAX = float(os.getenv("WRITE_JOURNAL_RETRY_MAX", "60"))
+# 반영이 끝난 항목 보관 시간(초) → 그동안은 같은 dedupe_key 재요청에 같은 write_id 반환
+WRITE_JOURNAL_RETAIN = float(os.getenv("WRITE_JOURNAL_RETAIN", "86400"))
+
+# 이 상태 코드는 재시도 (그 외 4xx는 요청 자체가 잘못된 것이므로 failed 처리)
+_RETRY_STATUSES = (409, 429, 500, 502, 503, 504)
+# 생성 확인 조회 범위: 기록 시각보다 이만큼(초) 이전부터 (Notion created_time은 분 단위 + 시계 오차)
+_CREATE_LOOKBACK = 120
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS writes (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind       TEXT NOT NULL,
+    target     TEXT NOT NULL,
+    method     TEXT NOT NULL,
+    path       TEXT NOT NULL,
+    body       TEXT,
+    dedupe_key TEXT UNIQUE,
+    state      TEXT NOT NULL DEFAULT 'pending',
+    attempts   INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    result     TEXT,
+    error      TEXT
+);
+CREATE INDEX IF NOT EXISTS writes_by_state ON writes (state, id);
+"""
+
+
+def _is_create(entry: dict) -> bool:
+    return entry["method"] == "POST" and entry["path"] == "pages"
+
+
+def _prop_value(prop: dict):
+    """property 입력값 / 응답값을 비교용 값으로 (text.content 또는 plain_text, select name, date start)"""
+    kind = next((k for k in prop if k not in ("id", "type")), None)
+    value = prop.get(kind)
+    if kind in ("title", "rich_text"):
+        return "".join((t.get("text") or {}).get("content", t.get("plain_text", "")) for t in value or [])
+    if kind == "select":
+        return (value or {}).get("name")
+    if kind == "multi_select":
+        return sorted(o.get("name") for o in value or [])
+    if kind == "date":
+        return (value or {}).get("start")
+    return value
+
+
+def _same_properties(page: dict, body: dict) -> bool:
+    props = page.get("properties") or {}
+    return all(
+        name in props and _prop_value(props[name]) == _prop_value(value)
+        for name, value in (body.get("properties") or {}).items()
+    )
+
+
+def find_created_page(client, body: dict, since: float, skip=None):
+    """
+    body(POST pages 요청)의 parent DB에서 since(unix time) 이후 생성된, 같은 properties의 row 조회 (최신순).
+    skip(page_id)가 True인 row는 건너뜀 (이미 다른 요청의 결과로 확인된 row).
+    반환: (row | None, 조회 실패 응답 | None)
+    """
+    db_id = (body.get("parent") or {}).get("database_id")
+    if not db_id:
+        return None, None
+    # Notion created_time은 분 단위 → 분 단위로 내림
+    since = datetime.fromtimestamp(since, timezone.utc)
+    query = {
+        "filter": {"timestamp": "created_time",
+                   "created_time": {"on_or_after": since.strftime("%Y-%m-%dT%H:%M:00.000Z")}},
+        "sorts": [{"timestamp": "created_time", "direction": "descending"}],
+        "page_size": 100,
+    }
+    while True:
+        resp = client.post(f"databases/{db_id}/query", json=query)
+        if resp.status_code != 200:
+            return None, resp
+        data = resp.json()
+        for page in data.get("results", []):
+            if _same_properties(page, body) and not (skip and skip(page.get("id"))):
+                return page, None
+        if not data.get("has_more"):
+            return None, None
+        query["start_cursor"] = data.get("next_cursor")
+
+
+class WriteJournal:
+    """
+    Notion 쓰기 요청의 로컬 append-only 저널 (SQLite).
+    - append(): 저널에 기록(commit)만 하고 바로 반환 → 라우트는 Notion 응답을 기다리지 않고 202 응답
+    - 백그라운드 워커가 pending 항목을 Notion에 반영, 실패하면 backoff 후 재시도
+    - 같은 target(게시글 / 댓글 DB / 댓글 row)의 쓰기는 기록된 순서대로 하나씩 반영
+    - 재시작하면 남아 있는 pending 항목부터 이어서 반영 (at-least-once)
+    - 생성(POST pages)은 타임아웃 / 5xx / 응답 전 종료처럼 결과가 모호한 시도 후에는 다시 보내기 전에
+      parent DB에서 같은 properties로 기록 이후 생성된 row를 찾고, 있으면 그 row로 반영 완료 처리 (중복 생성 방지)
+    - on_applied(entry, result): 반영 성공 후 호출 (캐시 무효화, 후속 작업 등)
+    """
+
+    def __init__(self, path: str, client=notion_client, workers: int = WRITE_JOURNAL_WORKERS):
+        self.path = path
+        self.client = client
+        self.on_applied = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="write-journal")
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: commit된 항목은 프로세스가 죽어도 남음 (전원 장애 시 마지막 몇 건은 유실 가능)
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        # pending 항목의 메모리 사본 (id → entry) + 항목별 다음 시도 시각 / 반영 중인 target
+        self._pending: Dict[int, dict] = {}
+        self._next_at: Dict[int, float] = {}
+        self._inflight = set()
+        for row in self._conn.execute(
+            "SELECT id, kind, target, method, path, body, attempts, created_at "
+            "FROM writes WHERE state = 'pending' ORDER BY id"
+        ):
+            self._pending[row[0]] = self._entry(row)
+        self.applied = 0
+        self.retried = 0
+        self.failed = 0
+
+    @staticmethod
+    def _entry(row) -> dict:
+        return {
+            "id": row[0], "kind": row[1], "target": row[2], "method": row[3], "path": row[4],
+            "body": json.loads(row[5]) if row[5] else None, "attempts": row[6], "created_at": row[7],
+        }
+
+    # -------------------------
+    # 기록
+    # -------------------------
+    def append(self, kind: str, target: str, method: str, path: str, body: Optional[dict] = None,
+               dedupe_key: Optional[str] = None):
+        """
+        쓰기 1건을 기록하고 (write_id, replayed) 반환.
+        dedupe_key가 이미 기록된 항목과 같으면 새로 기록하지 않고 기존 write_id 반환 (replayed=True).
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            if dedupe_key is not None:
+                row = self._conn.execute("SELECT id FROM writes WHERE dedupe_key = ?", (dedupe_key,)).fetchone()
+                if row is not None:
+                    return row[0], True
+            body_json = json.dumps(body, ensure_ascii=False) if body is not None else None
+            write_id = self._conn.execute(
+                "INSERT INTO writes (kind, target, method, path, body, dedupe_key, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, target, method, path, body_json, dedupe_key, now),
+            ).lastrowid
+            self._pending[write_id] = {
+                "id": write_id, "kind": kind, "target": target, "method": method, "path": path,
+                "body": body, "attempts": 0, "created_at": now,
+            }
+        self.start()
+        self._wake.set()
+        return write_id, False
+
+    def pending(self, kind: Optional[str] = None) -> List[dict]:
+        """아직 Notion에 반영되지 않은 항목 (기록 순서). 읽기 라우트가 응답에 덮어쓸 때 사용"""
+        with self._lock:
+            return [e for e in self._pending.values() if kind is None or e["kind"] == kind]
+
+    # -------------------------
+    # 반영 (Notion)
+    # -------------------------
+    def _claim(self, now: float):
+        """
+        target별 가장 오래된 pending 항목 중 지금 보낼 수 있는 것을 골라 반영 중으로 표시.
+        반환: (보낼 항목들, 다음에 깨어날 때까지의 시간 | None)
+        """
+        heads = {}
+        with self._lock:
+            for e in self._pending.values():
+                if e["target"] not in heads:
+                    heads[e["target"]] = e
+            ready, wait = [], None
+            for target, e in heads.items():
+                if target in self._inflight:
+                    continue
+                due = self._next_at.get(e["id"], 0.0)
+                if due <= now:
+                    self._inflight.add(target)
+                    ready.append(e)
+                else:
+                    wait = due - now if wait is None else min(wait, due - now)
+        return ready, wait
+
+    def _finish(self, entry: dict, state: str, result=None, error: Optional[str] = None):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE writes SET state = ?, attempts = ?, result = ?, error = ? WHERE id = ?",
+                (state, entry["attempts"], json.dumps(result) if result is not None else None, error, entry["id"]),
+            )
+            self._pending.pop(entry["id"], None)
+            self._next_at.pop(entry["id"], None)
+
+    def _claimed_by_other(self, page_id: str, entry: dict) -> bool:
+        """같은 내용의 다른 저널 항목이 이미 만든 row인지 (짧은 시간에 같은 댓글을 두 번 쓴 경우)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM writes WHERE id != ? AND state = 'done' AND json_extract(result, '$.id') = ?",
+                (entry["id"], page_id),
+            ).fetchone()
+        return row is not None
+
+    def _find_created(self, entry: dict):
+        """
+        이전 시도에서 이미 생성된 row 조회.
+        반환: (row | None, 조회 실패 응답 / 오류 | None)
+        """
+        return find_created_page(
+            self.client, entry["body"] or {}, entry["created_at"] - _CREATE_LOOKBACK,
+            skip=lambda page_id: self._claimed_by_other(page_id, entry),
+        )
+
+    def _send(self, entry: dict):
+        """Notion에 반영. 반환: (응답 | None, 이미 생성되어 있던 row | None, 오류 문자열 | None)"""
+        create = _is_create(entry)
+        try:
+            if create and entry["attempts"] > 0:
+                found, failed = self._find_created(entry)
+                if found is not None:
+                    return None, found, None
+                if failed is not None:
+                    # 확인하지 못하면 다시 보내지 않고 재시도 대기
+                    return failed, None, None
+            if create:
+                # 응답 전에 프로세스가 죽어도 재시작 후 확인부터 하도록 시도를 먼저 기록
+                with self._lock, self._conn:
+                    self._conn.execute("UPDATE writes SET attempts = ? WHERE id = ?",
+                                       (entry["attempts"] + 1, entry["id"]))
+            return self.client.request(entry["method"], entry["path"], json=entry["body"]), None, None
+        except Exception as e:
+            return None, None, str(e)
+
+    def _apply(self, entry: dict):
+        resp, found, error = self._send(entry)
+
+        entry["attempts"] += 1
+        try:
+            if found is not None or (resp is not None and resp.status_code == 200):
+                if found is not None:
+                    _log.info("이전 시도에서 생성된 row 확인, 다시 보내지 않음", write_id=entry["id"],
+                              kind=entry["kind"], page_id=found.get("id"))
+                result = found if found is not None else resp.json()
+                self._finish(entry, "done", result={"id": result.get("id")})
+                self.applied += 1
+                if self.on_applied:
+                    try:
+                        self.on_applied(entry, result)
+                    except Exception:
+                        _log.error("쓰기 반영 후 처리 실패", write_id=entry["id"], exc_info=True)
+                return
+
+            if resp is not None:
+                error = f"{resp.status_code}: {resp.text}"
+            retryable = resp is None or resp.status_code in _RETRY_STATUSES
+            if retryable and entry["attempts"] < WRITE_JOURNAL_MAX_ATTEMPTS:
+                delay = min(WRITE_JOURNAL_RETRY_MAX, WRITE_JOURNAL_RETRY_BASE * (2 ** (entry["attempts"] - 1)))
+                _log.warning("쓰기 반영 실패, 재시도 예정", write_id=entry["id"], kind=entry["kind"],
+                             attempt=entry["attempts"], delay=delay, error=error)
+                with self._lock, self._conn:
+                    self._conn.execute("UPDATE writes SET attempts = ?, error = ? WHERE id = ?",
+                                       (entry["attempts"], error, entry["id"]))
+                    self._next_at[entry["id"]] = time.time() + delay
+                self.retried += 1
+                return
+
+            _log.error("쓰기 반영 포기", write_id=entry["id"], kind=entry["kind"], target=entry["target"],
+                       attempts=entry["attempts"], error=error)
+            self._finish(entry, "failed", error=error)
+            self.failed += 1
+        finally:
+            with self._lock:
+                self._inflight.discard(entry["target"])
+            self._wake.set()
+
+    def _prune(self):
+        """보관 시간이 지난 반영 완료 항목 삭제 (failed는 확인용으로 남김)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM writes WHERE state = 'done' AND created_at < ?", (time.time() - WRITE_JOURNAL_RETAIN,)
+            )
+
+    def _run(self):
+        last_prune = 0.0
+        while True:
+            self._wake.clear()
+            now = time.time()
+            if now - last_prune > 3600:
+                self._prune()
+                last_prune = now
+            ready, wait = self._claim(now)
+            try:
+                for entry in ready:
+                    self._executor.submit(self._apply, entry)
+            except RuntimeError:
+                # 인터프리터 종료 중 → 남은 pending 항목은 다음 실행에서 반영
+                return
+            self._wake.wait(wait)
+
+    def start(self):
+        """백그라운드 반영 스레드 시작 (프로세스당 1회, 이전 실행의 pending 항목도 이어서 반영)"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="write-journal", daemon=True)
+                self._thread.start()
+
+    def stats(self) -> dict:
+        with self._lock:
+            oldest = min((e["created_at"] for e in self._pending.values()), default=None)
+            return {
+                "pending": len(self._pending),
+                "inflight": len(self._inflight),
+                "oldest_pending_s": round(time.time() - oldest, 3) if oldest is not None else None,
+                "applied": self.applied,
+                "retried": self.retried,
+                "failed": self.failed,
+            }
+
+
+# WRITE_JOURNAL_PATH가 설정된 경우에만 생성
+write_journal = WriteJournal(WRITE_JOURNAL_PATH) if WRITE_JOURNAL_PATH else None
@@ -0,0 +1,245 @@
+import os
+import atexit
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .client import notion_client
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+from .log import get_logger
+
+_log = get_logger("likes")
+
+# 1이면 토글을 메모리에 모았다가 debounce 후 반영 (write-behind).
+# 응답 후에도 프로세스가 계속 살아 있는 서버에서만 켤 것 (서버리스는 응답 후 멈추면 대기 중인 토글이 유실됨)
+LIKE_WRITE_BEHIND = os.getenv("LIKE_WRITE_BEHIND", "0") == "1"
+# 마지막 클릭 후 이 시간(초) 동안 모인 토글을 PATCH 1번으로 반영
+LIKE_FLUSH_DELAY = float(os.getenv("LIKE_FLUSH_DELAY", "1.0"))
+# 반영이 끝난 row 상태를 이 시간(초) 이후 버리고 Notion에서 다시 읽음
+LIKE_STATE_TTL = float(os.getenv("LIKE_STATE_TTL", "300"))
+# 반영 시도 횟수 한도 (넘으면 대기 중인 토글을 버리고 row를 다시 읽음)
+LIKE_FLUSH_MAX_ATTEMPTS = int(os.getenv("LIKE_FLUSH_MAX_ATTEMPTS", "5"))
+
+# 이 상태 코드만 재시도 (그 외 4xx: archive / 삭제된 row 등 → 재시도해도 실패)
+_RETRY_STATUSES = (409, 429, 500, 502, 503, 504)
+# 동기 경로에서 같은 row의 GET→PATCH를 직렬화하는 lock 수 (row id 해시로 분배)
+_ROW_LOCK_STRIPES = 64
+
+
+def _names(page: dict) -> List[str]:
+    return [x["name"] for x in page["properties"]["like"]["multi_select"]]
+
+
+def _apply_ops(base: List[str], ops: Dict[str, bool]) -> List[str]:
+    """base 목록에 사용자별 최종 상태(True: 좋아요, False: 취소)만 반영"""
+    names = [n for n in base if ops.get(n, True)]
+    names.extend(u for u, liked in ops.items() if liked and u not in names)
+    return names
+
+
+class _LikeRow:
+    __slots__ = ("base", "ops", "flushing", "timer", "touched", "failures")
+
+    def __init__(self, base: List[str]):
+        self.base = base       # 마지막으로 Notion에서 읽은 / 반영한 목록
+        self.ops = {}          # 아직 반영하지 않은 사용자별 최종 상태
+        self.flushing = None   # 반영 중인 ops
+        self.timer = None
+        self.touched = time.monotonic()
+        self.failures = 0
+
+    def names(self) -> List[str]:
+        names = _apply_ops(self.base, self.flushing or {})
+        return _apply_ops(names, self.ops)
+
+
+class LikeAggregator:
+    """
+    좋아요 토글 처리.
+    - 기본(동기): row를 읽고 사용자 1명을 토글해 바로 PATCH (같은 프로세스의 같은 row는 직렬화)
+    - LIKE_WRITE_BEHIND=1: 토글을 메모리에 사용자별 최종 상태로 모으고 debounce 후 반영.
+      반영할 때 row를 다시 읽어 모은 사용자만 추가 / 제거 → 다른 인스턴스 / Notion UI의 좋아요를 덮어쓰지 않음.
+      재시도는 LIKE_FLUSH_MAX_ATTEMPTS번까지, 재시도할 수 없는 4xx면 바로 포기
+    - on_patched(page): PATCH 성공 후 호출 (Notion이 돌려준 row)
+    """
+
+    def __init__(self, client=notion_client, write_behind: bool = LIKE_WRITE_BEHIND,
+                 delay: float = LIKE_FLUSH_DELAY, ttl: float = LIKE_STATE_TTL,
+                 max_attempts: int = LIKE_FLUSH_MAX_ATTEMPTS):
+        self.client = client
+        self.write_behind = write_behind
+        self.delay = delay
+        self.ttl = ttl
+        self.max_attempts = max_attempts
+        self.on_patched = None
+        self._rows: Dict[str, _LikeRow] = {}
+        self._lock = threading.Lock()
+        self._row_locks = [threading.Lock() for _ in range(_ROW_LOCK_STRIPES)]
+        self.toggles = 0
+        self.flushes = 0
+        self.dropped = 0
+
+    def toggle(self, row_id: str, user: str):
+        """
+        user의 좋아요를 토글하고 새 이름 목록 반환.
+        반환: (names | None, 실패한 Notion 응답 | None)
+        """
+        if not self.write_behind:
+            return self._toggle_now(row_id, user)
+        return self._toggle_later(row_id, user)
+
+    # -------------------------
+    # 동기 (기본)
+    # -------------------------
+    def _patch(self, row_id: str, names: List[str], priority: int = PRIORITY_INTERACTIVE):
+        resp = self.client.patch(
+            f"pages/{row_id}",
+            json={"properties": {"like": {"multi_select": [{"name": n} for n in names]}}},
+            priority=priority,
+        )
+        if resp.status_code == 200 and self.on_patched:
+            try:
+                self.on_patched(resp.json())
+            except Exception:
+                _log.error("좋아요 반영 후 처리 실패", row_id=row_id, exc_info=True)
+        return resp
+
+    def _toggle_now(self, row_id: str, user: str):
+        with self._row_locks[hash(row_id) % _ROW_LOCK_STRIPES]:
+            resp = self.client.get(f"pages/{row_id}")
+            if resp.status_code != 200:
+                return None, resp
+            names = _names(resp.json())
+            names = _apply_ops(names, {user: user not in names})
+            resp = self._patch(row_id, names)
+            if resp.status_code != 200:
+                return None, resp
+        with self._lock:
+            self.toggles += 1
+            self.flushes += 1
+        return names, None
+
+    # -------------------------
+    # write-behind (LIKE_WRITE_BEHIND=1)
+    # -------------------------
+    def _get_row(self, row_id: str) -> Optional[_LikeRow]:
+        row = self._rows.get(row_id)
+        if row is None:
+            return None
+        idle = not (row.ops or row.flushing is not None or row.timer)
+        if idle and time.monotonic() - row.touched > self.ttl:
+            del self._rows[row_id]
+            return None
+        return row
+
+    def _schedule(self, row_id: str, row: _LikeRow, delay: float):
+        row.timer = threading.Timer(delay, self._flush, args=(row_id,))
+        row.timer.daemon = True
+        row.timer.start()
+
+    def _toggle_later(self, row_id: str, user: str):
+        with self._lock:
+            row = self._get_row(row_id)
+
+        if row is None:
+            # 처음 보는 row만 1회 조회 (동시 조회는 single-flight로 합쳐짐)
+            resp = self.client.get(f"pages/{row_id}")
+            if resp.status_code != 200:
+                return None, resp
+            with self._lock:
+                row = self._get_row(row_id)
+                if row is None:
+                    row = self._rows[row_id] = _LikeRow(_names(resp.json()))
+
+        with self._lock:
+            row.ops[user] = user not in row.names()
+            row.touched = time.monotonic()
+            self.toggles += 1
+            if row.timer is None:
+                self._schedule(row_id, row, self.delay)
+            return row.names(), None
+
+    def _flush(self, row_id: str):
+        with self._lock:
+            row = self._rows.get(row_id)
+            if row is None:
+                return
+            row.timer = None
+            if not row.ops:
+                return
+            if row.flushing is not None:
+                # 이전 PATCH가 끝난 뒤 다시 시도 (순서 역전 방지)
+                self._schedule(row_id, row, self.delay)
+                return
+            ops, row.ops = row.ops, {}
+            row.flushing = ops
+
+        # 반영 직전에 다시 읽어 사용자별 추가 / 제거만 적용
+        resp, names = None, None
+        try:
+            resp = self.client.get(f"pages/{row_id}", priority=PRIORITY_BACKGROUND)
+            if resp.status_code == 200:
+                names = _apply_ops(_names(resp.json()), ops)
+                resp = self._patch(row_id, names, priority=PRIORITY_BACKGROUND)
+        except Exception as e:
+            _log.warning("좋아요 반영 실패", row_id=row_id, error=str(e))
+            resp = None
+
+        with self._lock:
+            row.flushing = None
+            self.flushes += 1
+            if resp is not None and resp.status_code == 200:
+                row.base = names
+                row.failures = 0
+            else:
+                row.failures += 1
+                retryable = resp is None or resp.status_code in _RETRY_STATUSES
+                if retryable and row.failures < self.max_attempts:
+                    _log.warning("좋아요 반영 실패, 재시도 예정", row_id=row_id, attempt=row.failures,
+                                 status=resp.status_code if resp is not None else None)
+                    row.ops = {**ops, **row.ops}
+                else:
+                    # 포기: 대기 중인 토글을 버리고 다음 토글 때 row를 다시 읽음
+                    _log.error("좋아요 반영 포기", row_id=row_id, attempts=row.failures,
+                               status=resp.status_code if resp is not None else None,
+                               body=resp.text if resp is not None else None)
+                    self.dropped += len(ops) + len(row.ops)
+                    if row.timer is not None:
+                        row.timer.cancel()
+                    self._rows.pop(row_id, None)
+                    return
+            if row.ops and row.timer is None:
+                self._schedule(row_id, row, self.delay * (2 ** min(row.failures, 5)))
+
+    def flush_all(self):
+        """대기 중인 토글을 즉시 반영 (프로세스 종료 시)"""
+        with self._lock:
+            pending = [row_id for row_id, row in self._rows.items() if row.ops]
+            for row_id in pending:
+                timer = self._rows[row_id].timer
+                if timer is not None:
+                    timer.cancel()
+                    self._rows[row_id].timer = None
+        for row_id in pending:
+            self._flush(row_id)
+
+    def current(self, row_id: str) -> Optional[List[str]]:
+        """아직 Notion에 반영되지 않았을 수 있는 row의 최신 좋아요 목록 (모르면 None, 동기 모드는 항상 None)"""
+        with self._lock:
+            row = self._get_row(row_id)
+            return row.names() if row is not None else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "write_behind": self.write_behind,
+                "rows": len(self._rows),
+                "pending": sum(1 for r in self._rows.values() if r.ops or r.flushing is not None),
+                "toggles": self.toggles,
+                "flushes": self.flushes,
+                "dropped": self.dropped,
+            }
+
+
+like_aggregator = LikeAggregator()
+atexit.register(like_aggregator.flush_all)
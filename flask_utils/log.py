@@ -0,0 +1,139 @@
+import os
+import sys
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+
+# 로그 레벨 (DEBUG 이면 Notion 요청/응답 덤프까지 출력)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# 비동기 큐 크기 (가득 차면 요청 스레드를 막지 않고 버림)
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+LOGGER_ROOT = "songnyunhoe"
+
+# 이 이름의 key(대소문자 무시)는 값을 가림
+SECRET_KEYS = frozenset({
+    "pw", "password", "passwd", "secret", "token", "api_key", "apikey",
+    "authorization", "notion_api_key", "cookie",
+})
+REDACTED = "***"
+
+
+def redact(value):
+    """
+    dict / list를 재귀로 돌며 비밀 값을 가림.
+    - key가 SECRET_KEYS에 있으면 값 전체
+    - Notion 필터 모양 {"property": "PW", ...} 이면 property 외 나머지 값
+    """
+    if isinstance(value, dict):
+        prop = value.get("property")
+        hide_rest = isinstance(prop, str) and prop.lower() in SECRET_KEYS
+        out = {}
+        for k, v in value.items():
+            if isinstance(k, str) and k.lower() in SECRET_KEYS:
+                out[k] = REDACTED
+            elif hide_rest and k != "property":
+                out[k] = REDACTED
+            else:
+                out[k] = redact(v)
+        return out
+    if isinstance(value, (list, tuple)):
+        return [redact(v) for v in value]
+    return value
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 1개 → JSON 한 줄 (ts / level / logger / msg + 필드)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(redact(fields))
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    요청 스레드에서는 레코드를 큐에 넣기만 함.
+    포맷(직렬화 / 가림)은 listener 스레드에서 수행.
+    """
+
+    dropped = 0
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class StructLogger:
+    """
+    레벨 + 구조화 필드 로거.
+        log.info("로그인 성공", user_id=uid)
+        log.debug("요청 페이로드", payload=payload)   # 비활성 시 레벨 확인만 하고 반환
+    필드 값은 출력될 때만 직렬화되므로 덤프 비용은 해당 레벨이 켜져 있을 때만 발생.
+    """
+
+    __slots__ = ("_logger",)
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+
+    def is_enabled(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def _log(self, level: int, msg: str, exc_info, fields):
+        if self._logger.isEnabledFor(level):
+            self._logger._log(level, msg, (), exc_info=exc_info, extra={"fields": fields})
+
+    def debug(self, msg: str, exc_info=None, **fields):
+        self._log(logging.DEBUG, msg, exc_info, fields)
+
+    def info(self, msg: str, exc_info=None, **fields):
+        self._log(logging.INFO, msg, exc_info, fields)
+
+    def warning(self, msg: str, exc_info=None, **fields):
+        self._log(logging.WARNING, msg, exc_info, fields)
+
+    def error(self, msg: str, exc_info=None, **fields):
+        self._log(logging.ERROR, msg, exc_info, fields)
+
+
+def _setup():
+    root = logging.getLogger(LOGGER_ROOT)
+    root.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+    root.propagate = False
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter())
+
+    handler = _NonBlockingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    root.addHandler(handler)
+
+    listener = logging.handlers.QueueListener(handler.queue, stream)
+    listener.start()
+    atexit.register(listener.stop)
+    return handler
+
+
+log_queue_handler = _setup()
+
+
+def get_logger(name: str) -> StructLogger:
+    """모듈별 로거 (songnyunhoe.<name>)"""
+    return StructLogger(logging.getLogger(f"{LOGGER_ROOT}.{name}"))
@@ -0,0 +1,184 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Tuple
+
+from flask import request
+
+# 지연 히스토그램 bucket 상한(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_LE_INF = 'le="+Inf"'
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    def __init__(self, name: str, doc: str, labels: Tuple[str, ...]):
+        self.name = name
+        self.doc = doc
+        self.label_names = labels
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self):
+        yield f"# HELP {self.name} {self.doc}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}{_labels(self.label_names, labels)} {value:g}"
+
+
+class Histogram:
+    """
+    label 조합별 누적 bucket 히스토그램.
+    observe는 bisect 1번 + lock 구간의 정수 증가뿐이라 항상 켜 두어도 부담이 적음.
+    """
+
+    def __init__(self, name: str, doc: str, labels: Tuple[str, ...], buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.doc = doc
+        self.label_names = labels
+        self.buckets = tuple(buckets)
+        # labels → [bucket별 count..., +Inf count, sum]
+        self._series: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, *labels, value: float):
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[i] += 1
+            series[-1] += value
+
+    def render(self):
+        yield f"# HELP {self.name} {self.doc}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = _labels(self.label_names, labels, f'le="{bound:g}"')
+                yield f"{self.name}_bucket{le} {cumulative}"
+            cumulative += series[len(self.buckets)]
+            yield f"{self.name}_bucket{_labels(self.label_names, labels, _LE_INF)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.label_names, labels)} {series[-1]:.6f}"
+            yield f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name: str, doc: str, labels: Tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, doc, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, doc: str, labels: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS) -> Histogram:
+        metric = Histogram(name, doc, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+# ---- Flask 라우트 ----
+http_request_seconds = metrics_registry.histogram(
+    "http_request_duration_seconds", "Flask 요청 처리 시간 (응답 반환까지)", ("route", "method"),
+)
+http_request_errors = metrics_registry.counter(
+    "http_request_errors_total", "4xx / 5xx 응답 및 처리되지 않은 예외 수", ("route", "method", "status"),
+)
+
+# ---- Notion upstream ----
+notion_request_seconds = metrics_registry.histogram(
+    "notion_request_duration_seconds",
+    "Notion 호출 1건의 전체 시간 (rate limit 대기 + 재시도 포함)",
+    ("endpoint", "method"),
+)
+notion_wait_seconds = metrics_registry.histogram(
+    "notion_rate_limit_wait_seconds",
+    "Notion 호출 1건이 스케줄러 토큰 / 429 pause를 기다린 시간 합계",
+    ("endpoint", "method"),
+)
+notion_retries = metrics_registry.counter(
+    "notion_retries_total", "429 / 일시적 5xx로 인한 재시도 수", ("endpoint", "method", "status"),
+)
+notion_errors = metrics_registry.counter(
+    "notion_request_errors_total", "최종 응답이 2xx가 아니거나 예외로 끝난 Notion 호출 수", ("endpoint", "method", "status"),
+)
+
+
+def notion_endpoint(method: str, path: str) -> str:
+    """
+    Notion 경로 → endpoint 종류 (label 카디널리티를 id와 무관하게 고정)
+    pages / blocks / databases.query / databases.create / databases
+    """
+    path = path.strip("/")
+    head = path.split("/", 1)[0]
+    if head == "databases":
+        if path.endswith("/query"):
+            return "databases.query"
+        if method == "POST" and path == "databases":
+            return "databases.create"
+        return "databases"
+    if head in ("pages", "blocks", "users", "search", "comments"):
+        return head
+    return "other"
+
+
+def install_request_metrics(app):
+    """Flask 앱의 모든 요청 시간 / 오류를 route 템플릿 단위로 기록"""
+
+    def _route() -> str:
+        rule = request.url_rule
+        return rule.rule if rule is not None else "<unmatched>"
+
+    @app.before_request
+    def _metrics_start():
+        request.environ["metrics.started"] = time.perf_counter()
+
+    @app.after_request
+    def _metrics_observe(resp):
+        started = request.environ.pop("metrics.started", None)
+        if started is not None:
+            route = _route()
+            http_request_seconds.observe(route, request.method, value=time.perf_counter() - started)
+            if resp.status_code >= 400:
+                http_request_errors.inc(route, request.method, str(resp.status_code))
+        return resp
+
+    @app.teardown_request
+    def _metrics_exception(exc):
+        # 처리되지 않은 예외는 after_request를 거치지 않음
+        started = request.environ.pop("metrics.started", None)
+        if exc is not None and started is not None:
+            route = _route()
+            http_request_seconds.observe(route, request.method, value=time.perf_counter() - started)
+            http_request_errors.inc(route, request.method, "500")
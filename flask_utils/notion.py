@@ -1,16 +1,13 @@
-import json, requests, os
+import os
 from typing import Optional, Dict
 
+from .client import notion_client
+from .log import get_logger
+
+_log = get_logger("notion")
+
 NOTION_API_KEY = os.getenv("NOTION_API_KEY")
 DATABASE_ID    = os.getenv("NOTION_DB_ID")
-NOTION_VERSION = "2022-06-28"  # 안정적인 버전 고정
-NOTION_BASE = "https://api.notion.com/v1"
-
-NOTION_HEADERS = {
-    "Authorization": f"Bearer {NOTION_API_KEY}",
-    "Notion-Version": "2022-06-28",
-    "Content-Type": "application/json"
-}
 
 def _get_plain_text(prop_obj):
     """
@@ -39,8 +36,6 @@ def query_user_by_credentials(user_id: str, user_pw: str):
     Notion Databases Query API에 필터를 걸어 ID/PW가 일치하는 사용자만 조회.
     컬럼명은 스크린샷 기준: user_name(title), ID(rich_text), PW(rich_text), user_role(select)
     """
-    url = f"https://api.notion.com/v1/databases/{DATABASE_ID}/query"
-
     payload = {
         "filter": {
             "and": [
@@ -50,25 +45,18 @@ def query_user_by_credentials(user_id: str, user_pw: str):
         }
     }
 
-    print("\n[Notion] 요청 페이로드:")
-    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    _log.debug("사용자 조회 요청", payload=payload)
 
-    res = requests.post(url, headers=NOTION_HEADERS, json=payload)
-    print(f"[Notion] HTTP {res.status_code}")
+    res = notion_client.post(f"databases/{DATABASE_ID}/query", json=payload)
 
     try:
         data = res.json()
     except Exception as e:
-        print("[Notion] JSON 디코드 실패:", e)
+        _log.warning("사용자 조회 응답 JSON 디코드 실패", status=res.status_code, error=str(e))
         return None, {"error": "invalid_json"}
 
-    # 원본 일부 로깅(너무 길면 앞부분만)
-    print("[Notion] 응답 본문:")
-    pretty = json.dumps(data, ensure_ascii=False)
-    print(pretty + ("..." if len(pretty) == 600 else ""))
-
     results = data.get("results", [])
-    print(f"[Notion] 결과 개수: {len(results)}")
+    _log.debug("사용자 조회 응답", status=res.status_code, count=len(results), body=data)
 
     if not results:
         return None, data
@@ -90,18 +78,17 @@ def query_user_by_credentials(user_id: str, user_pw: str):
         "user_role": user_role,
     }
 
-    print("[Notion] 파싱된 사용자 정보:")
-    print(json.dumps(parsed, ensure_ascii=False, indent=2))
+    _log.debug("사용자 조회 결과", user=parsed)
 
     return parsed, data
 
 # =========================
 # Notion 헬퍼 함수
 # =========================
-def notion_query_database(db_id: str, query: Optional[Dict] = None):
+def notion_query_database(db_id: str, query: Optional[Dict] = None, **kwargs):
     """
     Notion Database Query API 호출.
-    query 인자를 생략하면 기본 쿼리로 호출.
+    query 인자를 생략하면 기본 쿼리로 호출. kwargs는 notion_client로 전달 (priority 등)
     반환: (json(dict) | None, error(dict) | None)
     """
     if not NOTION_API_KEY:
@@ -109,14 +96,8 @@ def notion_query_database(db_id: str, query: Optional[Dict] = None):
     if not db_id:
         return None, {"error": "database_id is missing"}
 
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
-    }
-    url = f"{NOTION_BASE}/databases/{db_id}/query"
     try:
-        resp = requests.post(url, headers=headers, json=query or {})
+        resp = notion_client.post(f"databases/{db_id}/query", json=query or {}, **kwargs)
         if resp.status_code != 200:
             # Notion 에러 원문을 그대로 내려줄 수 있도록 detail에 포함
             return None, {"status": resp.status_code, "detail": resp.text}
@@ -124,22 +105,43 @@ def notion_query_database(db_id: str, query: Optional[Dict] = None):
     except Exception as e:
         return None, {"error": str(e)}
 
+def notion_query_all(db_id: str, query: Optional[Dict] = None, max_rows: int = 1000, **kwargs):
+    """
+    next_cursor를 따라 Database Query 결과를 모두 모아서 반환 (최대 max_rows개).
+    반환: (results(list) | None, error(dict) | None)
+    """
+    query = dict(query or {})
+    query.setdefault("page_size", 100)
+    results = []
+    while True:
+        resp = notion_client.post(f"databases/{db_id}/query", json=dict(query), **kwargs)
+        if resp.status_code != 200:
+            return None, {"status": resp.status_code, "detail": resp.text}
+        data = resp.json()
+        results.extend(data.get("results", []))
+        if not data.get("has_more") or len(results) >= max_rows:
+            return results[:max_rows], None
+        query["start_cursor"] = data.get("next_cursor")
+
+async def anotion_query_all(db_id: str, query: Optional[Dict] = None, max_rows: int = 1000, **kwargs):
+    """notion_query_all의 비동기 버전 (반환 형식 동일)"""
+    query = dict(query or {})
+    query.setdefault("page_size", 100)
+    results = []
+    while True:
+        resp = await notion_client.apost(f"databases/{db_id}/query", json=dict(query), **kwargs)
+        if resp.status_code != 200:
+            return None, {"status": resp.status_code, "detail": resp.text}
+        data = resp.json()
+        results.extend(data.get("results", []))
+        if not data.get("has_more") or len(results) >= max_rows:
+            return results[:max_rows], None
+        query["start_cursor"] = data.get("next_cursor")
+
 def notion_update_page(page_id: str, payload: dict):
     """Notion Page Update API"""
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
-    }
-    url = f"{NOTION_BASE}/pages/{page_id}"
-    resp = requests.patch(url, headers=headers, json=payload)
-    return resp
+    return notion_client.patch(f"pages/{page_id}", json=payload)
 
 def get_db_properties(db_id):
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": NOTION_VERSION
-    }
-    url = f"{NOTION_BASE}/databases/{db_id}"
-    res = requests.get(url, headers=headers)
+    res = notion_client.get(f"databases/{db_id}")
     return res.json()
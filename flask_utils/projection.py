@@ -0,0 +1,50 @@
+from functools import lru_cache
+from typing import Optional
+
+# lean 모드에서 항상 포함되는 필드
+LEAN_FIELDS = ("id", "title", "writer", "date", "last_edited_time", "counts")
+
+
+@lru_cache(maxsize=64)
+def compile_projection(fields: tuple):
+    """
+    단순화된 item → lean item 추출기를 미리 만들어 둠 (fields 조합마다 1회).
+    fields: LEAN_FIELDS 외에 포함할 property 이름들 (원본 Notion property 그대로 properties에 담김)
+    """
+    names = tuple(fields)
+
+    if not names:
+        def project(item: dict) -> dict:
+            return {k: item.get(k) for k in LEAN_FIELDS}
+    else:
+        def project(item: dict) -> dict:
+            out = {k: item.get(k) for k in LEAN_FIELDS}
+            props = item.get("properties") or {}
+            out["properties"] = {n: props[n] for n in names if n in props}
+            return out
+
+    return project
+
+
+def parse_projection(lean=None, fields=None) -> Optional[tuple]:
+    """
+    요청 파라미터 → projection key.
+    - fields: "like,text" 문자열 또는 리스트 → lean + 해당 property
+    - lean: 참이면 LEAN_FIELDS만
+    - 둘 다 없으면 None (기존 전체 응답)
+    """
+    if isinstance(fields, str):
+        fields = [f.strip() for f in fields.split(",")]
+    if fields:
+        return tuple(sorted({f for f in fields if f}))
+    if lean in (True, 1) or str(lean).lower() in ("1", "true", "yes"):
+        return ()
+    return None
+
+
+def project_items(items, projection: Optional[tuple]):
+    """projection이 None이면 그대로, 아니면 미리 만든 추출기로 변환"""
+    if projection is None:
+        return items
+    project = compile_projection(projection)
+    return [project(it) for it in items]
@@ -0,0 +1,119 @@
+import os
+import queue
+import threading
+
+from .client import notion_client
+from .log import get_logger
+from .scheduler import PRIORITY_BACKGROUND
+
+_log = get_logger("provision")
+
+# 댓글 DB 생성 실패 시 재시도 (지수 backoff)
+COMMENT_DB_MAX_ATTEMPTS = int(os.getenv("COMMENT_DB_MAX_ATTEMPTS", "6"))
+COMMENT_DB_RETRY_BASE = float(os.getenv("COMMENT_DB_RETRY_BASE", "2"))
+
+COMMENT_DB_TITLE = "commentSubDB"
+COMMENT_DB_SCHEMA = {
+    "subWriter": {"title": {}},
+    "text": {"rich_text": {}},
+    "like": {"multi_select": {}},
+}
+
+
+class CommentDbProvisioner:
+    """
+    게시글 아래 commentSubDB 생성을 요청 경로 밖(백그라운드 스레드)에서 처리.
+    - 생성 전에 페이지의 child_database를 확인 → 재시도 / 재시작해도 중복 생성 X
+    - 실패하면 backoff 후 재시도 (background 레인이라 사용자 요청보다 뒤로 밀림)
+    - on_ready(page_id, db_id): 생성(또는 기존 DB 확인) 후 호출 (캐시 무효화 등)
+    """
+
+    def __init__(self, client=notion_client, on_ready=None):
+        self.client = client
+        self.on_ready = on_ready
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.created = 0
+        self.failed = 0
+
+    def enqueue(self, page_id: str):
+        with self._lock:
+            if page_id in self._pending:
+                return
+            self._pending.add(page_id)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="comment-db-provisioner", daemon=True)
+                self._thread.start()
+        self._queue.put((page_id, 0))
+
+    def is_pending(self, page_id: str) -> bool:
+        with self._lock:
+            return page_id in self._pending
+
+    def _existing_db(self, page_id: str):
+        resp = self.client.get(f"blocks/{page_id}/children", params={"page_size": 100}, priority=PRIORITY_BACKGROUND)
+        if resp.status_code != 200:
+            return None, resp
+        for b in resp.json().get("results", []):
+            if b.get("type") == "child_database":
+                return b["id"], None
+        return None, None
+
+    def provision(self, page_id: str):
+        """댓글 DB id 반환 (실패 시 None, 실패한 응답)"""
+        db_id, err = self._existing_db(page_id)
+        if err is not None:
+            return None, err
+        if db_id:
+            return db_id, None
+
+        resp = self.client.post("databases", json={
+            "parent": {"page_id": page_id},
+            "title": [{"type": "text", "text": {"content": COMMENT_DB_TITLE}}],
+            "properties": COMMENT_DB_SCHEMA,
+        }, priority=PRIORITY_BACKGROUND)
+        if resp.status_code != 200:
+            return None, resp
+        return resp.json()["id"], None
+
+    def _run(self):
+        while True:
+            page_id, attempt = self._queue.get()
+            try:
+                db_id, err = self.provision(page_id)
+            except Exception as e:
+                db_id, err = None, e
+
+            if db_id:
+                with self._lock:
+                    self._pending.discard(page_id)
+                    self.created += 1
+                if self.on_ready:
+                    try:
+                        self.on_ready(page_id, db_id)
+                    except Exception:
+                        # 후속 처리 실패로 provisioner 스레드가 죽지 않도록 (다음 게시글은 계속 처리)
+                        _log.error("댓글 DB 생성 후 처리 실패", page_id=page_id, db_id=db_id, exc_info=True)
+                continue
+
+            detail = getattr(err, "text", str(err))
+            if attempt + 1 >= COMMENT_DB_MAX_ATTEMPTS:
+                _log.error("댓글 DB 생성 포기", page_id=page_id, attempts=attempt + 1, error=detail)
+                with self._lock:
+                    self._pending.discard(page_id)
+                    self.failed += 1
+                continue
+            _log.warning("댓글 DB 생성 실패, 재시도 예정", page_id=page_id, attempt=attempt + 1, error=detail)
+            # 대기 중에도 다른 게시글은 계속 처리되도록 타이머로 다시 넣음
+            retry = threading.Timer(COMMENT_DB_RETRY_BASE * (2 ** attempt), self._queue.put, args=((page_id, attempt + 1),))
+            retry.daemon = True
+            retry.start()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"pending": len(self._pending), "created": self.created, "failed": self.failed}
+
+
+comment_db_provisioner = CommentDbProvisioner()
@@ -0,0 +1,416 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, List
+
+from .blocks import load_block_tree
+from .client import notion_client
+from .log import get_logger
+from .scheduler import PRIORITY_BACKGROUND
+
+_log = get_logger("replica")
+
+# 비어 있으면 로컬 복제본 비활성화 (예: /tmp/board_replica.sqlite3)
+BOARD_REPLICA_PATH = os.getenv("BOARD_REPLICA_PATH", "")
+BOARD_REPLICA_INTERVAL = float(os.getenv("BOARD_REPLICA_INTERVAL", "15"))
+# N번의 증분 동기화마다 한 번 전체 스캔 (모든 댓글 DB 포함) → 외부에서 archive된 페이지 / 단 댓글 반영
+BOARD_REPLICA_FULL_EVERY = int(os.getenv("BOARD_REPLICA_FULL_EVERY", "40"))
+
+REPLICA_CURSOR_PREFIX = "replica:"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id               TEXT PRIMARY KEY,
+    db_id            TEXT NOT NULL,
+    created_time     TEXT,
+    last_edited_time TEXT,
+    date             TEXT,
+    archived         INTEGER NOT NULL DEFAULT 0,
+    data             TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_by_db ON pages (db_id, archived, created_time);
+CREATE TABLE IF NOT EXISTS blocks (
+    page_id   TEXT PRIMARY KEY,
+    data      TEXT NOT NULL,
+    truncated INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS comment_dbs (
+    db_id    TEXT PRIMARY KEY,
+    page_id  TEXT NOT NULL,
+    title    TEXT,
+    position INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS comment_dbs_by_page ON comment_dbs (page_id, position);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    db_id            TEXT PRIMARY KEY,
+    last_edited_time TEXT,
+    full_synced_at   REAL
+);
+"""
+
+# 로컬에서 재현 가능한 정렬 (그 외 정렬/필터는 Notion으로 우회)
+_SORT_COLUMNS = {
+    ("timestamp", "created_time"): "created_time",
+    ("timestamp", "last_edited_time"): "last_edited_time",
+    ("property", "date"): "date",
+}
+
+
+def _page_date(page: dict) -> str:
+    d_prop = (page.get("properties") or {}).get("date")
+    if isinstance(d_prop, dict) and isinstance(d_prop.get("date"), dict):
+        return d_prop["date"].get("start") or ""
+    return ""
+
+
+class BoardReplica:
+    """
+    Notion 게시판 DB + 각 게시글의 commentSubDB를 로컬 SQLite로 미러링.
+    - 최초 1회 전체 로드 후에는 checkpoint 이후 last_edited_time 페이지만 조회 (증분)
+    - 댓글 DB는 사이클마다 전부 훑지 않고 touch()된 것(쓰기 / 상세 조회)만 증분 조회
+    - 이 서버가 쓴 row는 record_page()로 바로 저장 (방금 단 댓글이 다음 동기화 전에도 보임)
+    - 주기적 전체 스캔 / 삭제 라우트 알림으로 archive된 페이지 / 외부에서 단 댓글 반영
+    - 목록/상세 라우트가 Notion 대신 로컬 디스크에서 읽을 수 있도록 조회 함수 제공
+    """
+
+    def __init__(self, path: str, client=notion_client):
+        self.path = path
+        self.client = client
+        self.board_db_ids: List[str] = []
+        self._intervals: Dict[str, float] = {}   # 게시판 DB id -> 동기화 주기
+        self._next_sync: Dict[str, float] = {}
+        self._cycles: Dict[str, int] = {}
+        # 다음 사이클에 따로 동기화할 댓글 DB / 본문 (쓰기 / 상세 조회로 알게 된 것만)
+        self._touched_dbs = set()
+        self._touched_pages = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    # -------------------------
+    # 저장 / 체크포인트
+    # -------------------------
+    def _checkpoint(self, db_id: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_edited_time, full_synced_at FROM checkpoints WHERE db_id = ?", (db_id,)
+            ).fetchone()
+        return row or (None, None)
+
+    def _save_checkpoint(self, db_id: str, last_edited_time: Optional[str], full: bool):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO checkpoints (db_id, last_edited_time, full_synced_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(db_id) DO UPDATE SET last_edited_time = excluded.last_edited_time, "
+                "full_synced_at = COALESCE(excluded.full_synced_at, checkpoints.full_synced_at)",
+                (db_id, last_edited_time, time.time() if full else None),
+            )
+
+    def _upsert_pages(self, db_id: str, pages: List[dict]):
+        rows = [
+            (
+                p["id"], db_id, p.get("created_time"), p.get("last_edited_time"),
+                _page_date(p), 1 if p.get("archived") else 0, json.dumps(p, ensure_ascii=False),
+            )
+            for p in pages
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages "
+                "(id, db_id, created_time, last_edited_time, date, archived, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def mark_archived(self, page_id: str):
+        """삭제(archive) 라우트 성공 시 즉시 반영"""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE pages SET archived = 1 WHERE id = ?", (page_id,))
+
+    def record_page(self, db_id: str, page: dict):
+        """
+        이 서버가 쓴 게시글 / 댓글 row(Notion 응답)를 바로 저장
+        → 다음 동기화 전에도 목록 / 상세에 방금 쓴 내용이 보임
+        """
+        self._upsert_pages(db_id, [page])
+
+    # -------------------------
+    # Notion → 로컬 동기화
+    # -------------------------
+    def _fetch_changed(self, db_id: str, since: Optional[str]) -> List[dict]:
+        """since 이후 수정된 페이지를 커서를 따라 모두 조회 (since가 없으면 전체)"""
+        query = {
+            "page_size": 100,
+            "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+        }
+        if since:
+            query["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": since},
+            }
+
+        pages = []
+        while True:
+            resp = self.client.post(
+                f"databases/{db_id}/query", json=query, priority=PRIORITY_BACKGROUND
+            )
+            if resp.status_code != 200:
+                raise RuntimeError(f"replica query failed ({resp.status_code}): {resp.text}")
+            data = resp.json()
+            pages.extend(data.get("results", []))
+            if not data.get("has_more"):
+                return pages
+            query["start_cursor"] = data.get("next_cursor")
+
+    def sync_database(self, db_id: str, full: bool = False) -> List[dict]:
+        """
+        DB 하나를 동기화하고 변경된 페이지 목록 반환.
+        증분 조회는 checkpoint와 같은 시각(on_or_after)의 페이지도 다시 오므로,
+        저장된 원본과 같은 페이지는 변경 목록에서 제외 (매 사이클 본문을 다시 받지 않도록)
+        """
+        since, _ = self._checkpoint(db_id)
+        full = full or since is None
+        pages = self._fetch_changed(db_id, None if full else since)
+        changed = pages
+        if not full and pages:
+            ids = [p["id"] for p in pages]
+            with self._lock:
+                stored = dict(self._conn.execute(
+                    f"SELECT id, data FROM pages WHERE id IN ({','.join('?' * len(ids))})", ids
+                ).fetchall())
+            changed = [p for p in pages if stored.get(p["id"]) != json.dumps(p, ensure_ascii=False)]
+        self._upsert_pages(db_id, pages)
+
+        if full:
+            # 전체 스캔에 없는 페이지 = Notion에서 archive/삭제됨
+            seen = [p["id"] for p in pages]
+            with self._lock, self._conn:
+                self._conn.execute(
+                    f"UPDATE pages SET archived = 1 WHERE db_id = ? "
+                    f"AND id NOT IN ({','.join('?' * len(seen))})",
+                    (db_id, *seen),
+                )
+
+        latest = max([p.get("last_edited_time") or "" for p in pages] + [since or ""]) or None
+        self._save_checkpoint(db_id, latest, full)
+        return changed
+
+    def _sync_page_blocks(self, page_id: str) -> List[str]:
+        """게시글 본문 블록 트리를 저장하고, 새로 발견한 댓글 DB id 목록 반환"""
+        blocks, truncated, err = load_block_tree(
+            page_id, client=self.client, priority=PRIORITY_BACKGROUND
+        )
+        if err is not None:
+            raise RuntimeError(f"replica blocks failed ({err.status_code}): {err.text}")
+
+        comment_dbs = [
+            (b["id"], page_id, b.get("child_database", {}).get("title", ""), pos)
+            for pos, b in enumerate(blocks)
+            if b.get("type") == "child_database"
+        ]
+        with self._lock, self._conn:
+            known = {
+                r[0] for r in self._conn.execute(
+                    "SELECT db_id FROM comment_dbs WHERE page_id = ?", (page_id,)
+                )
+            }
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blocks (page_id, data, truncated) VALUES (?, ?, ?)",
+                (page_id, json.dumps(blocks, ensure_ascii=False), 1 if truncated else 0),
+            )
+            self._conn.execute("DELETE FROM comment_dbs WHERE page_id = ?", (page_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO comment_dbs (db_id, page_id, title, position) VALUES (?, ?, ?, ?)",
+                comment_dbs,
+            )
+        return [c[0] for c in comment_dbs if c[0] not in known]
+
+    def sync_once(self, full: bool = False, board_db_ids: Optional[List[str]] = None):
+        """
+        게시판 DB 증분 조회 → 변경된 게시글의 본문 / 새 댓글 DB 동기화.
+        댓글 DB는 full일 때만 전부 훑음 (평소에는 sync_touched()로 쓰기 / 조회된 DB만).
+        board_db_ids를 생략하면 모든 게시판
+        """
+        board_db_ids = self.board_db_ids if board_db_ids is None else board_db_ids
+        synced_comment_dbs = set()
+        for board_db_id in board_db_ids:
+            for page in self.sync_database(board_db_id, full=full):
+                if page.get("archived"):
+                    continue
+                for comment_db_id in self._sync_page_blocks(page["id"]):
+                    self.sync_database(comment_db_id, full=True)
+                    synced_comment_dbs.add(comment_db_id)
+
+        if not (full and board_db_ids):
+            return
+        with self._lock:
+            comment_db_ids = [
+                r[0] for r in self._conn.execute(
+                    f"SELECT c.db_id FROM comment_dbs c JOIN pages p ON p.id = c.page_id "
+                    f"WHERE p.db_id IN ({','.join('?' * len(board_db_ids))})",
+                    board_db_ids,
+                )
+            ]
+        for comment_db_id in comment_db_ids:
+            if comment_db_id not in synced_comment_dbs:
+                self.sync_database(comment_db_id, full=True)
+
+    def touch(self, comment_db_ids=(), page_ids=()):
+        """
+        쓰기 / 상세 조회된 댓글 DB(증분), 본문이 바뀐 게시글(블록 트리)을 다음 사이클에 동기화.
+        같은 DB는 사이클당 1번만 조회하므로 Notion 호출 수는 조회 수가 아니라 DB 수에 비례
+        """
+        with self._lock:
+            self._touched_dbs.update(d for d in comment_db_ids if d)
+            self._touched_pages.update(p for p in page_ids if p)
+
+    def sync_touched(self):
+        with self._lock:
+            db_ids, self._touched_dbs = self._touched_dbs, set()
+            page_ids, self._touched_pages = self._touched_pages, set()
+        for page_id in page_ids:
+            for comment_db_id in self._sync_page_blocks(page_id):
+                self.sync_database(comment_db_id, full=True)
+                db_ids.discard(comment_db_id)
+        with self._lock:
+            # 복제본이 아직 모르는 댓글 DB는 버림 (게시글 본문 동기화 때 발견되면 전체 로드)
+            known = {
+                r[0] for r in self._conn.execute(
+                    f"SELECT db_id FROM comment_dbs WHERE db_id IN ({','.join('?' * len(db_ids))})",
+                    list(db_ids),
+                )
+            } if db_ids else set()
+        for comment_db_id in known:
+            self.sync_database(comment_db_id)
+
+    def request_sync(self):
+        """쓰기 라우트에서 호출 → 다음 주기를 기다리지 않고 touch()된 댓글 DB / 본문만 바로 동기화"""
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            now = time.monotonic()
+            for db_id in self.board_db_ids:
+                if self._next_sync.get(db_id, 0.0) > now:
+                    continue
+                cycles = self._cycles.get(db_id, 0)
+                full = cycles > 0 and cycles % BOARD_REPLICA_FULL_EVERY == 0
+                try:
+                    self.sync_once(full=full, board_db_ids=[db_id])
+                except Exception:
+                    _log.error("복제본 동기화 실패", db_id=db_id, exc_info=True)
+                self._cycles[db_id] = cycles + 1
+                self._next_sync[db_id] = time.monotonic() + self._intervals[db_id]
+            try:
+                self.sync_touched()
+            except Exception:
+                _log.error("복제본 댓글 DB 동기화 실패", exc_info=True)
+
+            wait = min(self._next_sync.values(), default=now + BOARD_REPLICA_INTERVAL) - time.monotonic()
+            self._wake.wait(max(wait, 0.0))
+            self._wake.clear()
+
+    def start(self, board_db_ids, interval: float = BOARD_REPLICA_INTERVAL):
+        """
+        백그라운드 동기화 스레드 시작 (프로세스당 1회).
+        board_db_ids: [DB id] (모두 interval 주기) 또는 {DB id: 게시판별 동기화 주기}
+        """
+        if not isinstance(board_db_ids, dict):
+            board_db_ids = {db_id: interval for db_id in board_db_ids}
+        self._intervals = {db_id: i for db_id, i in board_db_ids.items() if db_id}
+        self.board_db_ids = list(self._intervals)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="board-replica", daemon=True)
+            self._thread.start()
+
+    # -------------------------
+    # 로컬 조회
+    # -------------------------
+    def is_ready(self, db_id: str) -> bool:
+        """전체 로드가 한 번이라도 끝난 DB만 로컬 조회 대상"""
+        return self._checkpoint(db_id)[1] is not None
+
+    def query_board(self, db_id: str, query: Optional[Dict] = None):
+        """
+        /databases/query 와 같은 형태({has_more, next_cursor, results})로 로컬 조회.
+        로컬에서 재현할 수 없는 쿼리(filter, 임의 정렬, Notion 커서)는 None 반환.
+        """
+        query = query or {}
+        if query.get("filter"):
+            return None
+
+        sorts = query.get("sorts") or [{"timestamp": "created_time", "direction": "descending"}]
+        order_by = []
+        for s in sorts:
+            kind = "timestamp" if "timestamp" in s else "property"
+            column = _SORT_COLUMNS.get((kind, s.get(kind)))
+            if column is None:
+                return None
+            order_by.append(f"{column} {'ASC' if s.get('direction') == 'ascending' else 'DESC'}")
+
+        cursor = query.get("start_cursor")
+        if cursor and not str(cursor).startswith(REPLICA_CURSOR_PREFIX):
+            return None
+        offset = int(cursor[len(REPLICA_CURSOR_PREFIX):]) if cursor else 0
+        page_size = max(1, min(int(query.get("page_size") or 100), 100))
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM pages WHERE db_id = ? AND archived = 0 "
+                f"ORDER BY {', '.join(order_by)}, id LIMIT ? OFFSET ?",
+                (db_id, page_size + 1, offset),
+            ).fetchall()
+
+        has_more = len(rows) > page_size
+        return {
+            "has_more": has_more,
+            "next_cursor": f"{REPLICA_CURSOR_PREFIX}{offset + page_size}" if has_more else None,
+            "results": [json.loads(r[0]) for r in rows[:page_size]],
+        }
+
+    def page_detail(self, page_id: str):
+        """
+        게시글 원본 + 본문 블록 + 댓글 DB 행들을 로컬에서 조회.
+        반환: {"page", "blocks", "truncated", "comment_dbs": [(db_id, title, rows)]} | None
+        """
+        with self._lock:
+            page = self._conn.execute(
+                "SELECT data FROM pages WHERE id = ? AND archived = 0", (page_id,)
+            ).fetchone()
+            blocks = self._conn.execute(
+                "SELECT data, truncated FROM blocks WHERE page_id = ?", (page_id,)
+            ).fetchone()
+            if page is None or blocks is None:
+                return None
+
+            comment_dbs = []
+            for db_id, title, synced in self._conn.execute(
+                "SELECT c.db_id, c.title, k.full_synced_at FROM comment_dbs c "
+                "LEFT JOIN checkpoints k ON k.db_id = c.db_id "
+                "WHERE c.page_id = ? ORDER BY c.position",
+                (page_id,),
+            ).fetchall():
+                if synced is None:
+                    # 아직 전체 로드 전인 댓글 DB → Notion에서 읽도록 우회
+                    return None
+                rows = self._conn.execute(
+                    "SELECT data FROM pages WHERE db_id = ? AND archived = 0 ORDER BY created_time DESC",
+                    (db_id,),
+                ).fetchall()
+                comment_dbs.append((db_id, title, [json.loads(r[0]) for r in rows]))
+
+        return {
+            "page": json.loads(page[0]),
+            "blocks": json.loads(blocks[0]),
+            "truncated": bool(blocks[1]),
+            "comment_dbs": comment_dbs,
+        }
+
+
+# BOARD_REPLICA_PATH가 설정된 경우에만 생성
+board_replica = BoardReplica(BOARD_REPLICA_PATH) if BOARD_REPLICA_PATH else None
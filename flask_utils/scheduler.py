@@ -0,0 +1,136 @@
+import os
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+
+# Notion 통합(integration)당 평균 약 3 req/s, 짧은 burst 허용
+NOTION_RATE_PER_SEC = float(os.getenv("NOTION_RATE_PER_SEC", "3"))
+NOTION_BURST = float(os.getenv("NOTION_BURST", "6"))
+
+# 우선순위 레인 (숫자가 작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0   # 사용자 요청을 처리 중인 라우트
+PRIORITY_BACKGROUND = 10   # 복제본 동기화 / 정산 등 백그라운드 작업
+
+_LANE_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BACKGROUND: "background"}
+
+
+class NotionScheduler:
+    """
+    모든 Notion 호출이 공유하는 아웃바운드 스케줄러.
+    - 토큰 버킷 (rate / burst)으로 전체 호출 속도 제한
+    - 우선순위 레인: 대기 중인 interactive 호출이 background 호출보다 먼저 토큰을 받음
+    - 429 응답 시 pause()로 Retry-After 동안 모든 호출을 멈춤
+    - 레인별 대기열 길이 / 대기 시간 통계 제공
+    """
+
+    def __init__(self, rate: float = NOTION_RATE_PER_SEC, burst: float = NOTION_BURST):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        self._waiters = []  # heap of (priority, seq)
+        self._seq = itertools.count()
+
+        self._depth = {}
+        self._waits = deque(maxlen=2048)
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._acquired = 0
+        self._retries = {}
+        self._throttled = 0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> float:
+        """토큰 1개를 받을 때까지 대기하고, 대기한 시간(초)을 반환"""
+        start = time.monotonic()
+        ticket = (priority, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            self._depth[priority] = self._depth.get(priority, 0) + 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._waiters[0] != ticket:
+                        # 앞선 대기자가 토큰을 받을 때까지 대기
+                        self._cond.wait()
+                        continue
+                    if self._tokens >= 1 and now >= self._paused_until:
+                        heapq.heappop(self._waiters)
+                        self._tokens -= 1
+                        break
+                    self._cond.wait(max(self._paused_until - now, (1 - self._tokens) / self.rate))
+            except BaseException:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                raise
+            finally:
+                self._depth[priority] -= 1
+                self._cond.notify_all()
+
+            waited = time.monotonic() - start
+            self._waits.append(waited)
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            self._acquired += 1
+        return waited
+
+    def try_acquire(self, priority: int = PRIORITY_INTERACTIVE) -> bool:
+        """대기 없이 토큰을 받을 수 있으면 받고 True (비동기 경로에서 스레드 전환 없이 처리)"""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            if self._waiters or self._tokens < 1 or now < self._paused_until:
+                return False
+            self._tokens -= 1
+            self._waits.append(0.0)
+            self._acquired += 1
+            return True
+
+    def pause(self, seconds: float):
+        """429 수신 시 seconds 동안 모든 호출 보류"""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+            self._throttled += 1
+            self._cond.notify_all()
+
+    def record_retry(self, status: int):
+        with self._cond:
+            self._retries[status] = self._retries.get(status, 0) + 1
+
+    def stats(self) -> dict:
+        with self._cond:
+            waits = sorted(self._waits)
+            n = len(waits)
+
+            def pct(p):
+                return round(waits[min(n - 1, int(n * p))], 4) if n else 0.0
+
+            return {
+                "rate_per_sec": self.rate,
+                "burst": self.capacity,
+                "queue_depth": {
+                    _LANE_NAMES.get(p, str(p)): d for p, d in sorted(self._depth.items())
+                },
+                "acquired": self._acquired,
+                "wait_seconds": {
+                    "avg": round(self._wait_total / self._acquired, 4) if self._acquired else 0.0,
+                    "p50": pct(0.50),
+                    "p99": pct(0.99),
+                    "max": round(self._wait_max, 4),
+                },
+                "throttled_429": self._throttled,
+                "retries": {str(k): v for k, v in self._retries.items()},
+                "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 3),
+            }
+
+
+notion_scheduler = NotionScheduler()
@@ -0,0 +1,351 @@
+import os
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+from .blocks import load_block_tree
+from .counters import board_pages
+from .log import get_logger
+from .notion import notion_query_all
+from .replica import board_replica
+from .scheduler import PRIORITY_BACKGROUND
+
+_log = get_logger("search")
+
+# 전체 재색인 주기(초). 0이면 시작 시 1회만 (이후에는 상세 조회 / 쓰기 라우트로 증분 반영)
+SEARCH_REINDEX_INTERVAL = float(os.getenv("SEARCH_REINDEX_INTERVAL", "900"))
+# 1이면 import 시 재색인 시작. 서버리스(Vercel)는 기본 0 → 첫 /search 요청 때 시작
+# (콜드 스타트마다 모든 게시판 / 본문 / 댓글 DB를 크롤링하지 않도록)
+SEARCH_REINDEX_ON_START = os.getenv("SEARCH_REINDEX_ON_START", "0" if os.getenv("VERCEL") else "1") == "1"
+SEARCH_SNIPPET_CHARS = int(os.getenv("SEARCH_SNIPPET_CHARS", "80"))
+
+# 필드별 가중치 (제목 일치가 본문 / 댓글보다 위로)
+FIELD_WEIGHTS = {"title": 3.0, "body": 1.0, "text": 1.0}
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    """NFKC + 소문자 (전각 / 호환 문자, 영문 대소문자 차이 제거)"""
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def ngram_tokens(text: str) -> List[str]:
+    """
+    문자 n-gram 토큰.
+    - 단어(\\w+)마다 글자 1-gram + 2-gram → 한국어처럼 띄어쓰기 / 조사와 무관하게 부분 일치
+    - 정규화된 텍스트를 받음 (normalize_text)
+    """
+    tokens = []
+    for word in _WORD.findall(text):
+        tokens.extend(word)
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _query_tokens(terms: List[str]) -> List[str]:
+    """검색어 토큰: 2글자 이상 단어는 2-gram만 (1-gram은 후보가 너무 많음), 1글자 단어는 1-gram"""
+    tokens = []
+    for term in terms:
+        tokens.extend([term] if len(term) == 1 else [term[i:i + 2] for i in range(len(term) - 1)])
+    return list(dict.fromkeys(tokens))
+
+
+def _snippet(text: str, norm: str, terms: List[str], width: int = SEARCH_SNIPPET_CHARS):
+    """
+    첫 일치 위치 주변을 잘라 (snippet, [[start, end], ...]) 반환.
+    NFKC 정규화로 길이가 바뀌는 문자가 있으면 원문 대신 정규화된 텍스트 기준으로 자름
+    """
+    source = text if len(text) == len(norm) else norm
+    first = min((norm.find(t) for t in terms if t in norm), default=-1)
+    if first < 0:
+        return None
+    start = max(0, first - width // 4)
+    end = min(len(norm), start + width)
+    window = norm[start:end]
+    spans = []
+    for term in terms:
+        pos = window.find(term)
+        while pos >= 0:
+            spans.append([pos, pos + len(term)])
+            pos = window.find(term, pos + len(term))
+    spans.sort()
+    merged = []
+    for s, e in spans:
+        if merged and s <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], e)
+        else:
+            merged.append([s, e])
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(norm) else ""
+    offset = len(prefix)
+    return prefix + source[start:end] + suffix, [[s + offset, e + offset] for s, e in merged]
+
+
+class _Doc:
+    __slots__ = ("id", "kind", "board", "post_id", "fields", "norm", "meta", "length")
+
+    def __init__(self, doc_id, kind, board, post_id, fields, meta):
+        self.id = doc_id
+        self.kind = kind
+        self.board = board
+        self.post_id = post_id
+        self.fields = fields
+        self.norm = {name: normalize_text(value) for name, value in fields.items()}
+        self.meta = meta
+        self.length = sum(len(v) for v in self.norm.values()) or 1
+
+
+class SearchIndex:
+    """
+    게시글(제목 / 본문) + 댓글(text) 메모리 역색인.
+    - 토큰: 글자 1-gram / 2-gram (ngram_tokens) → 형태소 분석 없이 한국어 부분 일치
+    - 증분 반영: sync_post(게시글 + 댓글 전체 교체), add_comment, remove
+    - 검색: 검색어의 모든 토큰을 포함하는 문서 중 실제로 모든 단어가 들어 있는 문서만,
+      tf-idf(필드 가중치, 길이 정규화) 순 + 일치 구간 하이라이트
+    - 백그라운드 재색인: 복제본(있으면) 또는 Notion(background 레인)에서 게시글 / 본문 / 댓글 로딩
+    - on_reindexed(post_ids): 모든 게시판을 빠짐없이 재색인한 뒤 호출 (현재 게시글 id 집합)
+    """
+
+    def __init__(self):
+        self._docs: Dict[str, _Doc] = {}
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)  # token -> {doc_id: 가중 tf}
+        self._post_docs: Dict[str, set] = {}   # post_id -> 댓글 doc id
+        self._signatures: Dict[str, tuple] = {}  # post_id -> 마지막으로 색인한 원본의 버전
+        self._comment_dbs: Dict[str, str] = {}   # comment_db_id -> post_id
+        self._lock = threading.RLock()
+        self._thread = None
+        self.on_reindexed = None
+        self.queries = 0
+        self.reindexes = 0
+
+    # -------------------------
+    # 색인
+    # -------------------------
+    def _add(self, doc: _Doc):
+        self._remove_doc(doc.id)
+        self._docs[doc.id] = doc
+        for name, norm in doc.norm.items():
+            weight = FIELD_WEIGHTS.get(name, 1.0)
+            for token in ngram_tokens(norm):
+                postings = self._postings[token]
+                postings[doc.id] = postings.get(doc.id, 0.0) + weight
+
+    def _remove_doc(self, doc_id: str):
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for norm in doc.norm.values():
+            for token in set(ngram_tokens(norm)):
+                postings = self._postings.get(token)
+                if postings is not None:
+                    postings.pop(doc_id, None)
+                    if not postings:
+                        del self._postings[token]
+
+    def sync_post(self, post: dict, comments: List[dict], comment_db_ids: List[str] = (), signature=None):
+        """
+        게시글 하나와 그 댓글 전체를 교체 색인.
+        post: {id, board, title, body, writer, date}
+        comments: [{id, text, writer, date}]
+        signature: 원본 버전 (같으면 건너뜀, 상세 조회마다 다시 토큰화하지 않도록)
+        """
+        post_id = post["id"]
+        with self._lock:
+            if signature is not None and self._signatures.get(post_id) == signature:
+                return
+            self._add(_Doc(
+                post_id, "post", post["board"], post_id,
+                {"title": post.get("title") or "", "body": post.get("body") or ""},
+                {"writer": post.get("writer"), "date": post.get("date")},
+            ))
+            old = self._post_docs.get(post_id, set())
+            new = set()
+            for c in comments:
+                self._add_comment(post_id, post["board"], c)
+                new.add(c["id"])
+            for doc_id in old - new:
+                self._remove_doc(doc_id)
+            self._post_docs[post_id] = new
+            for db_id in comment_db_ids:
+                self._comment_dbs[db_id] = post_id
+            self._signatures[post_id] = signature
+
+    def _add_comment(self, post_id: str, board: str, comment: dict):
+        self._add(_Doc(
+            comment["id"], "comment", board, post_id,
+            {"text": comment.get("text") or ""},
+            {"writer": comment.get("writer"), "date": comment.get("date")},
+        ))
+
+    def add_comment(self, comment_db_id: str, comment: dict):
+        """addComment 반영 성공 → 댓글 1건 추가 (게시글이 아직 색인 전이면 재색인 때 반영)"""
+        with self._lock:
+            post_id = self._comment_dbs.get(comment_db_id)
+            post = self._docs.get(post_id)
+            if post is None:
+                return
+            self._add_comment(post_id, post.board, comment)
+            self._post_docs.setdefault(post_id, set()).add(comment["id"])
+            self._signatures.pop(post_id, None)
+
+    def remove(self, doc_id: str):
+        """게시글 / 댓글 archive 반영 → 색인에서 제거 (게시글이면 댓글도)"""
+        with self._lock:
+            for comment_id in self._post_docs.pop(doc_id, ()):
+                self._remove_doc(comment_id)
+            self._signatures.pop(doc_id, None)
+            doc = self._docs.get(doc_id)
+            if doc is not None and doc.kind == "comment":
+                self._post_docs.get(doc.post_id, set()).discard(doc_id)
+                self._signatures.pop(doc.post_id, None)
+            self._remove_doc(doc_id)
+
+    # -------------------------
+    # 검색
+    # -------------------------
+    def search(self, query: str, board: Optional[str] = None, kind: Optional[str] = None, limit: int = 20):
+        """
+        반환: {"total", "results": [{id, kind, board, post_id, title, writer, date, score, field, snippet, highlights}]}
+        highlights: snippet 안의 [start, end) 구간
+        """
+        terms = list(dict.fromkeys(_WORD.findall(normalize_text(query))))
+        if not terms:
+            return {"total": 0, "results": []}
+        tokens = _query_tokens(terms)
+
+        with self._lock:
+            self.queries += 1
+            postings = [self._postings.get(t) for t in tokens]
+            if not all(postings):
+                return {"total": 0, "results": []}
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for p in postings[1:]:
+                candidates.intersection_update(p)
+                if not candidates:
+                    return {"total": 0, "results": []}
+
+            n = len(self._docs)
+            idf = [math.log(1 + n / len(p)) for p in postings]
+            scored = []
+            for doc_id in candidates:
+                doc = self._docs[doc_id]
+                if (board and doc.board != board) or (kind and doc.kind != kind):
+                    continue
+                # n-gram 후보 중 실제로 모든 단어가 (어느 필드에든) 들어 있는 문서만
+                if not all(any(t in v for v in doc.norm.values()) for t in terms):
+                    continue
+                tf = sum(w * p[doc_id] for w, p in zip(idf, postings))
+                scored.append((tf / math.sqrt(doc.length), doc))
+
+            scored.sort(key=lambda x: x[0], reverse=True)
+            results = [self._result(doc, score, terms) for score, doc in scored[:limit]]
+            return {"total": len(scored), "results": results}
+
+    def _result(self, doc: _Doc, score: float, terms: List[str]) -> dict:
+        post = self._docs.get(doc.post_id)
+        field, snippet, highlights = None, "", []
+        for name in ("title", "body", "text"):
+            if name in doc.fields:
+                found = _snippet(doc.fields[name], doc.norm[name], terms)
+                if found is not None:
+                    field, (snippet, highlights) = name, found
+                    break
+        return {
+            "id": doc.id,
+            "kind": doc.kind,
+            "board": doc.board,
+            "post_id": doc.post_id,
+            "title": post.fields["title"] if post is not None else "",
+            "writer": doc.meta.get("writer"),
+            "date": doc.meta.get("date"),
+            "score": round(score, 4),
+            "field": field,
+            "snippet": snippet,
+            "highlights": highlights,
+        }
+
+    # -------------------------
+    # 백그라운드 재색인
+    # -------------------------
+    def _load_post(self, page: dict):
+        """게시글 하나의 (blocks, [(comment_db_id, title, rows)]) 로딩 (실패 시 None)"""
+        if board_replica:
+            local = board_replica.page_detail(page["id"])
+            if local is not None:
+                return local["blocks"], local["comment_dbs"]
+
+        blocks, _, err = load_block_tree(page["id"], priority=PRIORITY_BACKGROUND)
+        if err is not None:
+            return None
+        comment_dbs = []
+        for b in blocks:
+            if b.get("type") == "child_database":
+                rows, err = notion_query_all(b["id"], priority=PRIORITY_BACKGROUND)
+                if err:
+                    return None
+                comment_dbs.append((b["id"], b.get("child_database", {}).get("title", ""), rows))
+        return blocks, comment_dbs
+
+    def reindex(self, boards: Dict[str, str], on_post: Callable):
+        """
+        boards: {board 이름: DB id}
+        on_post(page, blocks, comment_dbs): 원본 → sync_post 호출 (본문 텍스트 추출 규칙은 호출한 쪽에서)
+        """
+        seen, complete = set(), True
+        for name, db_id in boards.items():
+            pages = board_pages(db_id)
+            if pages is None:
+                complete = False
+                continue
+            for page in pages:
+                seen.add(page["id"])
+                loaded = self._load_post(page)
+                if loaded is not None:
+                    on_post(page, *loaded)
+
+        if complete:
+            with self._lock:
+                for post_id in [d.id for d in self._docs.values() if d.kind == "post" and d.id not in seen]:
+                    self.remove(post_id)
+            if self.on_reindexed:
+                self.on_reindexed(seen)
+        self.reindexes += 1
+
+    def _run(self, boards: Dict[str, str], on_post: Callable, interval: float):
+        while True:
+            try:
+                self.reindex(boards, on_post)
+            except Exception:
+                _log.error("재색인 실패", exc_info=True)
+            if interval <= 0:
+                return
+            time.sleep(interval)
+
+    def start(self, boards: Dict[str, str], on_post: Callable, interval: float = SEARCH_REINDEX_INTERVAL):
+        """백그라운드 재색인 스레드 시작 (프로세스당 1회, 이미 시작했으면 무시)"""
+        boards = {name: db_id for name, db_id in boards.items() if db_id}
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, args=(boards, on_post, interval), name="search-index", daemon=True
+                )
+                self._thread.start()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "docs": len(self._docs),
+                "posts": sum(1 for d in self._docs.values() if d.kind == "post"),
+                "tokens": len(self._postings),
+                "queries": self.queries,
+                "reindexes": self.reindexes,
+            }
+
+
+search_index = SearchIndex()
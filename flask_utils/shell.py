@@ -0,0 +1,91 @@
+import os
+import gzip
+import hashlib
+import threading
+import time
+
+from flask import Response, request
+
+from .assets import MANIFEST_PATH
+
+# 템플릿 / manifest 변경 확인 간격(초). 그 사이 요청은 stat 없이 캐시된 bytes 그대로 응답
+SHELL_CACHE_CHECK_INTERVAL = float(os.getenv("SHELL_CACHE_CHECK_INTERVAL", "2"))
+
+
+class _Rendered:
+    __slots__ = ("body", "gzipped", "etag", "gzip_etag", "stamp")
+
+    def __init__(self, body: bytes, stamp: tuple):
+        self.body = body
+        self.gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        self.etag = hashlib.sha1(body).hexdigest()
+        # 표현(인코딩)마다 다른 strong ETag (gzip 본문과 원본 본문은 바이트가 다름)
+        self.gzip_etag = f"{self.etag}-gz"
+        self.stamp = stamp
+
+
+class ShellCache:
+    """
+    SPA 진입 HTML(login.html / index.html) 렌더 결과 캐시.
+    - 요청별 context가 없는 템플릿이므로 한 번 렌더한 bytes + gzip + ETag를 재사용
+    - 템플릿 파일 또는 asset manifest의 mtime이 바뀌면 다시 렌더
+    render: 템플릿 이름 → HTML 문자열 (app context 안에서 호출됨)
+    """
+
+    def __init__(self, render, template_dir: str, check_interval: float = SHELL_CACHE_CHECK_INTERVAL):
+        self.render = render
+        self.template_dir = template_dir
+        self.check_interval = check_interval
+        self._entries = {}
+        self._checked = {}
+        self._lock = threading.Lock()
+        self.renders = 0
+
+    def _stamp(self, name: str) -> tuple:
+        stamp = []
+        for path in (os.path.join(self.template_dir, name), MANIFEST_PATH):
+            try:
+                stamp.append(os.path.getmtime(path))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def get(self, name: str) -> _Rendered:
+        entry = self._entries.get(name)
+        now = time.monotonic()
+        if entry is not None and now - self._checked.get(name, 0) < self.check_interval:
+            return entry
+
+        with self._lock:
+            entry = self._entries.get(name)
+            stamp = self._stamp(name)
+            if entry is None or entry.stamp != stamp:
+                entry = _Rendered(self.render(name).encode("utf-8"), stamp)
+                self._entries[name] = entry
+                self.renders += 1
+            self._checked[name] = now
+            return entry
+
+    def warm(self, *names):
+        for name in names:
+            self.get(name)
+
+    def respond(self, name: str) -> Response:
+        """캐시된 HTML 응답 (Accept-Encoding gzip → 압축본, 선택한 표현의 ETag로 If-None-Match → 304)"""
+        entry = self.get(name)
+        gzipped = bool(request.accept_encodings["gzip"])
+        etag = entry.gzip_etag if gzipped else entry.etag
+        if request.if_none_match.contains(etag):
+            resp = Response(status=304)
+        elif gzipped:
+            resp = Response(entry.gzipped, mimetype="text/html")
+            resp.headers["Content-Encoding"] = "gzip"
+        else:
+            resp = Response(entry.body, mimetype="text/html")
+        resp.set_etag(etag)
+        resp.headers["Vary"] = "Accept-Encoding"
+        resp.headers["Cache-Control"] = "no-cache"
+        return resp
+
+    def stats(self) -> dict:
+        return {"templates": sorted(self._entries), "renders": self.renders}
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import threading
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    같은 key로 동시에 들어온 호출을 하나로 합침.
+    - 첫 호출(leader)만 fn()을 실행하고, 진행 중에 들어온 나머지는 그 결과(또는 예외)를 공유
+    - 호출이 끝나면 key를 지우므로 결과를 캐시하지는 않음
+    - ado(): 비동기 호출용 (항상 같은 이벤트 루프에서 호출되어야 함)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._acalls = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def ado(self, key, factory):
+        """
+        factory: 코루틴을 만드는 함수 (첫 호출만 실행).
+        upstream 호출은 별도 task로 실행하고 leader / follower 모두 shield로 기다림
+        → 어느 호출자가 취소되어도 나머지는 결과를 받음 (기다리는 호출자가 모두 취소되면 task도 취소)
+        """
+        entry = self._acalls.get(key)
+        if entry is None:
+            task = asyncio.get_running_loop().create_task(factory())
+            entry = self._acalls[key] = [task, 0]
+            task.add_done_callback(lambda t: self._adone(key, entry))
+            with self._lock:
+                self.leaders += 1
+        else:
+            with self._lock:
+                self.shared += 1
+
+        entry[1] += 1
+        try:
+            return await asyncio.shield(entry[0])
+        except asyncio.CancelledError:
+            entry[1] -= 1
+            if entry[1] == 0 and not entry[0].done():
+                # 기다리는 호출자가 없음 → upstream 호출 취소, 이후 호출은 새로 시작
+                self._adone(key, entry)
+                entry[0].cancel()
+            raise
+
+    def _adone(self, key, entry):
+        if self._acalls.get(key) is entry:
+            del self._acalls[key]
+        task = entry[0]
+        if task.done() and not task.cancelled():
+            task.exception()  # 기다리는 호출자가 없어도 경고가 나지 않도록 소비
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls) + len(self._acalls),
+                "leaders": self.leaders,
+                "shared": self.shared,
+            }
+
+
+def request_key(method: str, url: str, params=None, body=None) -> tuple:
+    """method + URL + (정렬된) params/body로 동일 요청 판별용 key 생성"""
+    return (
+        method,
+        url,
+        json.dumps(params, sort_keys=True, ensure_ascii=False) if params else "",
+        json.dumps(body, sort_keys=True, ensure_ascii=False) if body else "",
+    )
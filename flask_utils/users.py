@@ -0,0 +1,145 @@
+import os
+import hmac
+import hashlib
+import secrets
+import threading
+import time
+from typing import Optional, Dict
+
+from .client import notion_client
+from .log import get_logger
+from .notion import DATABASE_ID, _get_plain_text
+from .scheduler import PRIORITY_BACKGROUND
+
+_log = get_logger("users")
+
+# 인덱스가 이 시간(초)보다 오래되면 다음 로그인 때 백그라운드에서 증분 갱신
+USER_INDEX_REFRESH = float(os.getenv("USER_INDEX_REFRESH", "60"))
+USER_INDEX_PBKDF2_ITERATIONS = int(os.getenv("USER_INDEX_PBKDF2_ITERATIONS", "20000"))
+
+
+def _digest(password: str, salt: bytes) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, USER_INDEX_PBKDF2_ITERATIONS)
+
+
+class UserIndex:
+    """
+    사용자 DB를 ID → 사용자 정보로 메모리에 색인.
+    - 비밀번호는 평문 대신 (salt, PBKDF2 digest)만 보관
+    - 최초 1회 전체 로드, 이후 last_edited_time 기준 증분 갱신 (모두 백그라운드 스레드)
+    - /login 은 갱신을 기다리지 않고 현재 스냅샷으로 검증, 색인에 없는 ID만 Notion 조회
+    """
+
+    def __init__(self, db_id: str = DATABASE_ID, client=notion_client):
+        self.db_id = db_id
+        self.client = client
+        self._by_id: Dict[str, dict] = {}
+        self._id_by_page: Dict[str, str] = {}
+        self._checkpoint = None
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def add(self, page: dict):
+        """Notion 사용자 row(page) 하나를 색인에 반영"""
+        props = page.get("properties", {})
+        user_id = _get_plain_text(props.get("ID", {}))
+        page_id = page.get("id")
+
+        entry = None
+        if user_id and not page.get("archived"):
+            salt = secrets.token_bytes(16)
+            entry = {
+                "page_id": page_id,
+                "user_name": _get_plain_text(props.get("user_name", {})),
+                "user_role": _get_plain_text(props.get("user_role", {})),
+                "salt": salt,
+                "digest": _digest(_get_plain_text(props.get("PW", {})), salt),
+            }
+
+        with self._lock:
+            # ID가 바뀌었거나 archive된 row는 이전 키 제거
+            old_id = self._id_by_page.pop(page_id, None)
+            if old_id is not None:
+                self._by_id.pop(old_id, None)
+            if entry is not None:
+                self._by_id[user_id] = entry
+                self._id_by_page[page_id] = user_id
+
+    def refresh(self):
+        """checkpoint 이후 수정된 사용자 row만 조회 (checkpoint가 없으면 전체)"""
+        query = {
+            "page_size": 100,
+            "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+        }
+        if self._checkpoint:
+            query["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": self._checkpoint},
+            }
+
+        latest = self._checkpoint
+        while True:
+            resp = self.client.post(f"databases/{self.db_id}/query", json=query, priority=PRIORITY_BACKGROUND)
+            if resp.status_code != 200:
+                raise RuntimeError(f"user index query failed ({resp.status_code}): {resp.text}")
+            data = resp.json()
+            for page in data.get("results", []):
+                self.add(page)
+                latest = max(latest or "", page.get("last_edited_time") or "") or None
+            if not data.get("has_more"):
+                break
+            query["start_cursor"] = data.get("next_cursor")
+
+        self._checkpoint = latest
+        self._refreshed_at = time.monotonic()
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() - self._refreshed_at < USER_INDEX_REFRESH
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            # 실패하면 다음 주기까지 재시도하지 않음 (그동안 색인에 없는 ID는 Notion 조회)
+            self._refreshed_at = time.monotonic()
+            _log.warning("사용자 인덱스 갱신 실패", error=str(e))
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def ensure_fresh(self):
+        """
+        USER_INDEX_REFRESH가 지났으면 백그라운드 갱신을 시작하고 바로 반환.
+        (전체 로드 / PBKDF2 해시 계산 동안 로그인은 이전 스냅샷으로 처리, 갱신은 한 번에 하나만)
+        """
+        if self._is_fresh():
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh_in_background, name="user-index", daemon=True).start()
+
+    def knows(self, user_id: str) -> bool:
+        """색인에 있는 ID인지 (있으면 비밀번호가 틀려도 Notion을 다시 조회하지 않음)"""
+        with self._lock:
+            return user_id in self._by_id
+
+    def authenticate(self, user_id: str, user_pw: str) -> Optional[dict]:
+        """로컬 검증 성공 시 사용자 정보, 아니면 None (색인에 없거나 비밀번호 불일치)"""
+        with self._lock:
+            entry = self._by_id.get(user_id)
+        if entry is None:
+            return None
+        if not hmac.compare_digest(entry["digest"], _digest(user_pw, entry["salt"])):
+            return None
+        return {
+            "page_id": entry["page_id"],
+            "user_name": entry["user_name"],
+            "ID": user_id,
+            "user_role": entry["user_role"],
+        }
+
+
+user_index = UserIndex()
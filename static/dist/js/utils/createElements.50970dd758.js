@@ -0,0 +1,13 @@
+export function createElement(tag, className, id) {
+    const element = document.createElement(tag);
+
+    if (className) {
+        element.className = className;
+    }
+    
+    if (id) {
+        element.id = id;
+    }
+
+    return element;
+}
\ No newline at end of file
@@ -248,7 +248,8 @@ function loadAnonDetail(item, res) {
     const divider = createElement("div", "anonDivider");
     contentWrap.appendChild(divider);
 
-    const cDb = res.comment_dbs[0];
+    // 새 글은 댓글 DB가 백그라운드에서 생성되는 중일 수 있음 (comment_db_pending)
+    const cDb = res.comment_dbs[0] || { db_id: null, items: [] };
     const likeRow = cDb.items.find(
         (it) => safe(it, "properties.subWriter.title.0.plain_text") === "contentLikeCount"
     );
@@ -266,6 +267,7 @@ function loadAnonDetail(item, res) {
     toggleBg(postLikeBtn, postLikes.includes(userName));
 
     postLikeBtn.addEventListener("click", () => {
+        if (!likeRow) return;
         const liked = postLikes.includes(userName);
 
         if (liked) postLikes = postLikes.filter((u) => u !== userName);
@@ -334,6 +336,10 @@ function loadAnonDetail(item, res) {
     send.addEventListener("click", () => {
         const text = input.value.trim();
         if (!text) return;
+        if (!cDb.db_id) {
+            alert("댓글 준비 중입니다. 잠시 후 다시 시도해주세요.");
+            return;
+        }
 
         const temp = {
             id: "temp-" + Date.now(),
@@ -476,6 +482,9 @@ function createWriteUI() {
     const btnLine = createElement("div", "anonWriteBtnLine");
     writeWrap.append(btnLine);
 
+    // 같은 글의 재전송(더블 클릭 / 실패 후 재시도)은 서버에서 한 번만 생성되도록 고정 키 사용
+    const idempotencyKey = crypto.randomUUID ? crypto.randomUUID() : `${Date.now()}-${Math.random()}`;
+
     const submitBtn = createElement("div", "anonWriteSubmitBtn");
     submitBtn.addEventListener("click", async () => {
         const title = titleInput.value.trim();
@@ -489,7 +498,8 @@ function createWriteUI() {
         const res = await createAnonPost({
             title,
             body,
-            writer: userName
+            writer: userName,
+            idempotencyKey,
         });
     
         if (res.success) {
@@ -3,8 +3,6 @@ import { clearMainWrap } from "../utils/checkDuplication.js";
 import { createDayCount } from "../utils/createDayCount.js";
 import { createLoginUpper } from "../login/login.js";
 
-import { getNotificationDict } from "/static/js/notion/notification.js";
-import { getAnonDict } from "/static/js/notion/anon.js";
 import { navigate } from "../index.js";
 
 var sampleGameInfo = {
@@ -35,8 +33,9 @@ export async function createMain() {
     itemsToGrid('addGames');
     itemsToGrid('checkGames');
 
-    await infoToGrid('notification');
-    await infoToGrid('anon');
+    const dashboard = await fetchDashboard();
+    infoToGrid('notification', dashboard.notification);
+    infoToGrid('anon', dashboard.anon);
 }
 
 function createGrid() {
@@ -108,70 +107,24 @@ function createGridItem(id, label, imgSrc) {
     return root;
 }
 
-function parseCommunityDB(DB_items) {
-    const final_info = [];
-    for (let i = 0; i < DB_items.length; i++) {
-        const obj = DB_items[i];
-        final_info.push({
-            title: obj.title,
-            writer: obj.writer,
-            date: obj.properties?.date?.date?.start ?? ''
-        });
-    }
-    return final_info;
-}
+async function fetchDashboard() {
+    // ✅ 공지/익명 게시판 상위 3개를 한 번의 요청으로
+    //    (서버가 ETag를 내려주므로 재방문/새 탭은 브라우저 HTTP 캐시가 304로 재검증)
+    try {
+        const res = await fetch("/dashboard?limit=3");
+        const data = await res.json().catch(() => ({}));
 
-async function fetchNotificationInfo() {
-    const cacheKey = "notification_cache";
-  
-    // ✅ 세션 스토리지에 캐시가 있으면 즉시 반환
-    const cached = sessionStorage.getItem(cacheKey);
-    if (cached) {
-      console.log("[cache] 공지게시판 데이터 from sessionStorage");
-      return JSON.parse(cached);
-    }
-  
-    // ✅ 없으면 API 호출
-    console.log("[fetch] 공지게시판 데이터 from Notion API");
-    const allData = await getNotificationDict({
-      page_size: 3,
-      sorts: [{ timestamp: "last_edited_time", direction: "descending" }],
-    });
-  
-    const parsedData = parseCommunityDB(allData.items);
-  
-    // ✅ 캐시 저장
-    sessionStorage.setItem(cacheKey, JSON.stringify(parsedData));
-  
-    return parsedData;
-}
-
-async function fetchAnonInfo() {
-    const cacheKey = "anon_cache";
-  
-    // ✅ 캐시 있으면 바로 반환
-    const cached = sessionStorage.getItem(cacheKey);
-    if (cached) {
-      console.log("[cache] 익명게시판 데이터 from sessionStorage");
-      return JSON.parse(cached);
+        if (!res.ok || !data.success) {
+            throw new Error(`[dashboard] 요청 실패: ${data?.reason || `HTTP ${res.status}`}`);
+        }
+        return data;
+    } catch (err) {
+        console.error("[main.js] fetchDashboard 실패:", err);
+        return { notification: [], anon: [] };
     }
-  
-    // ✅ 없으면 fetch
-    console.log("[fetch] 익명게시판 데이터 from Notion API");
-    const allData = await getAnonDict({
-      page_size: 3,
-      sorts: [{ timestamp: "last_edited_time", direction: "descending" }],
-    });
-  
-    const parsedData = parseCommunityDB(allData.items);
-  
-    // ✅ 캐시 저장
-    sessionStorage.setItem(cacheKey, JSON.stringify(parsedData));
-  
-    return parsedData;
 }
 
-async function infoToGrid(type) {
+function infoToGrid(type, data = []) {
     const target = document.getElementById(`${type}_content`);
     // target.scrollTop = target.scrollHeight;
     if (!target) {
@@ -179,20 +132,6 @@ async function infoToGrid(type) {
         return;
     }
 
-    let data = [];
-    switch (type) {
-        case 'notification':
-            data = await fetchNotificationInfo();
-            break;
-        case 'anon':
-            data = await fetchAnonInfo();
-            break;
-        
-        default:
-            console.log('[main.js] infoToGrid: Unknown type', type);
-            return;
-    }
-
     data.forEach((item, i) => {
         const contentRow = createElement('div', 'gridContentRow', `${type}_contentRow_${i}`);
 
@@ -6,11 +6,14 @@
  * @returns {Promise<{success:boolean, has_more:boolean, next_cursor:string|null, items:Array}>}
  */
 async function _fetchAnonDB(query = {}) {
-    const res = await fetch("/getAnonDB", {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(query),
-    });
+    // GET + 쿼리스트링 → 서버 ETag로 브라우저 / CDN 캐시 재검증 (sorts, filter는 JSON 문자열)
+    const params = new URLSearchParams();
+    for (const [key, value] of Object.entries(query)) {
+      if (value === undefined || value === null) continue;
+      params.set(key, typeof value === "object" ? JSON.stringify(value) : String(value));
+    }
+
+    const res = await fetch(`/getAnonDB?${params}`);
   
     const data = await res.json().catch(() => ({}));
   
@@ -21,6 +24,53 @@ async function _fetchAnonDB(query = {}) {
     }
     return data;
   }
+
+  /**
+   * /streamAnonDB NDJSON 스트림을 읽어 item 배열로 반환
+   *  - 서버가 커서를 끝까지 따라가므로 요청은 1번
+   *  - item이 도착할 때마다 onItem(item) 호출 → 전체 로드 전에 렌더링 시작 가능
+   * @param {Object} query page_size, sorts, filter
+   * @param {Function} [onItem]
+   */
+  async function _streamAnonDB(query = {}, onItem) {
+    const res = await fetch("/streamAnonDB", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(query),
+    });
+    if (!res.ok || !res.body) {
+      throw new Error(`[streamAnonDB] 요청 실패: HTTP ${res.status}`);
+    }
+
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    const items = [];
+    let buffer = "";
+
+    while (true) {
+      const { value, done } = await reader.read();
+      buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+
+      let newline;
+      while ((newline = buffer.indexOf("\n")) >= 0) {
+        const line = buffer.slice(0, newline).trim();
+        buffer = buffer.slice(newline + 1);
+        if (!line) continue;
+
+        const row = JSON.parse(line);
+        if (row.success === false) {
+          const detail = row.detail ? ` | ${JSON.stringify(row.detail)}` : "";
+          throw new Error(`[streamAnonDB] 요청 실패: ${row.reason}${detail}`);
+        }
+        if (row.done) return items;
+
+        items.push(row);
+        if (onItem) onItem(row);
+      }
+      if (done) break;
+    }
+    throw new Error("[streamAnonDB] 스트림이 중간에 끊김");
+  }
   
   /**
    * 공지 데이터를 가져와 dict로 정리해서 반환
@@ -140,6 +190,7 @@ async function _fetchAnonDB(query = {}) {
  * @param {number}  [options.page_size=20]
  * @param {Array}   [options.sorts]       Notion sorts 형식
  * @param {Object}  [options.filter]      Notion filter 형식
+ * @param {Function} [options.onItem]      all=true일 때 item이 도착할 때마다 호출
  */
 export async function getAnonDict(options = {}) {
   const {
@@ -147,23 +198,27 @@ export async function getAnonDict(options = {}) {
     page_size = 20,
     sorts,
     filter,
+    onItem,
   } = options;
 
   let items = [];
-  let nextCursor = undefined;
 
-  do {
+  if (all) {
+    // 전체 조회는 서버 NDJSON 스트림 1회로 (커서는 서버가 따라가고, 도착하는 대로 onItem 호출)
+    items = await _streamAnonDB({
+      ...(sorts ? { sorts } : {}),
+      ...(filter ? { filter } : {}),
+    }, onItem);
+  } else {
     const payload = {
       page_size,
       ...(sorts ? { sorts } : {}),
       ...(filter ? { filter } : {}),
-      ...(nextCursor ? { start_cursor: nextCursor } : {}),
     };
 
     const data = await _fetchAnonDB(payload);
-    items = items.concat(data.items || []);
-    nextCursor = all && data.has_more ? data.next_cursor : undefined;
-  } while (all && nextCursor);
+    items = data.items || [];
+  }
 
   // 정규화: byId, byDate dict 구성
   const byId = Object.fromEntries(items.map((it) => [it.id, it]));
@@ -325,11 +380,14 @@ try {
 }
 }
 
-export async function createAnonPost({ title, body, writer }) {
+export async function createAnonPost({ title, body, writer, idempotencyKey }) {
 try {
     const res = await fetch("/createAnon", {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: {
+            "Content-Type": "application/json",
+            ...(idempotencyKey ? { "Idempotency-Key": idempotencyKey } : {}),
+        },
         body: JSON.stringify({ title, body, writer }),
     });
 
@@ -0,0 +1,68 @@
+import os
+import threading
+
+import pytest
+from werkzeug.serving import make_server
+
+from bench.fake_notion import FakeNotionStore, _paginate, create_fake_notion, seed_env, seed_store
+
+# flask_utils / api.index는 import 시점에 환경변수를 읽음 → 테스트 모듈 import 전에 fake Notion에 연결
+_store = seed_store(FakeNotionStore(), posts=5, comments=2, users=3, paragraphs=2)
+_fake_notion = create_fake_notion(_store)
+_server = make_server("127.0.0.1", 0, _fake_notion, threaded=True)
+threading.Thread(target=_server.serve_forever, daemon=True).start()
+os.environ.update(seed_env(f"http://127.0.0.1:{_server.server_port}/v1"))
+os.environ.update({
+    "NOTION_RATE_PER_SEC": "1000",
+    "SEARCH_REINDEX_ON_START": "0",
+    "WRITE_JOURNAL_PATH": "",
+    "USER_INDEX_PBKDF2_ITERATIONS": "1000",
+})
+
+
+class FakeResponse:
+    """requests.Response 대신 쓰는 최소 응답 (status_code / text / json()만)"""
+
+    def __init__(self, status_code=200, data=None):
+        self.status_code = status_code
+        self._data = data or {}
+        self.text = str(self._data)
+
+    def json(self):
+        return self._data
+
+
+class StoreClient:
+    """FakeNotionStore의 DB 조회(필터 / 정렬 / 커서)를 HTTP 없이 그대로 쓰는 client"""
+
+    def __init__(self, store):
+        self.store = store
+        self.queries = 0
+
+    def post(self, path, json=None, **kwargs):
+        self.queries += 1
+        db_id = path.split("/")[1]
+        return FakeResponse(200, _paginate(self.store.query(db_id, json), json))
+
+
+@pytest.fixture
+def notion_store():
+    """앱이 연결된 fake Notion의 저장소 (테스트끼리 공유 → 고유한 제목 / 내용을 쓸 것)"""
+    return _store
+
+
+@pytest.fixture
+def notion_requests():
+    """fake Notion이 받은 요청 수를 돌려주는 함수"""
+    return lambda: _fake_notion.config["stats"]["requests"]
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    import api.index
+    return api.index
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
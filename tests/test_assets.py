@@ -0,0 +1,18 @@
+import json
+import os
+import shutil
+
+from flask_utils.assets import DIST_DIR, DIST_DIRNAME, MANIFEST_PATH, STATIC_DIR, build_assets
+
+
+def test_committed_dist_matches_sources(tmp_path):
+    """static/ 수정 후 다시 빌드하지 않고 커밋하면 실패 (배포는 커밋된 static/dist를 그대로 씀)"""
+    static_copy = tmp_path / "static"
+    shutil.copytree(STATIC_DIR, static_copy, ignore=shutil.ignore_patterns(DIST_DIRNAME))
+    manifest = build_assets(str(static_copy))
+
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        assert json.load(f) == manifest, "static/dist is stale: run python -m flask_utils.assets"
+    for hashed in manifest.values():
+        for suffix in ("", ".gz"):
+            assert os.path.isfile(os.path.join(DIST_DIR, hashed + suffix)), hashed + suffix
@@ -0,0 +1,38 @@
+from flask_utils.boards import BoardRegistry
+
+
+def _registry(**kwargs):
+    return BoardRegistry([
+        {"name": "notification", "db_id": "aaaa-0001"},
+        {"name": "anon", "db_id": "bbbb-0002"},
+    ], **kwargs)
+
+
+def _invalidations(registry):
+    return {b.name: b.cache.invalidations for b in registry}
+
+
+def test_clear_caches_only_clears_owning_board():
+    registry = _registry()
+    registry.remember(registry.get("anon"), ["post-1", "comment-db-1", "row-1"])
+
+    registry.clear_caches(["comment-db-1"])
+    registry.clear_caches(["row-1"])
+    registry.clear_caches(["aaaa0001"])  # 게시판 DB id (하이픈 유무 무관)
+
+    assert _invalidations(registry) == {"notification": 1, "anon": 2}
+
+
+def test_unknown_id_clears_every_board():
+    registry = _registry()
+    registry.clear_caches(["never-seen"])
+    registry.clear_caches()
+    assert _invalidations(registry) == {"notification": 2, "anon": 2}
+
+
+def test_owner_map_is_bounded():
+    registry = _registry(owner_maxsize=2)
+    registry.remember(registry.get("anon"), ["a", "b", "c"])
+    assert registry.owner("a") is None
+    assert registry.owner("c").name == "anon"
+    assert registry.owner_count() == 2
@@ -0,0 +1,91 @@
+import time
+
+from flask_utils.counters import LIKE_ROW_WRITER, PostCounters
+from flask_utils.search import SearchIndex
+
+
+def _row(row_id, writer="a", likes=(), edited="2025-01-01T00:00:00.000Z"):
+    return {
+        "id": row_id,
+        "last_edited_time": edited,
+        "properties": {
+            "subWriter": {"title": [{"plain_text": writer}]},
+            "like": {"multi_select": [{"name": n} for n in likes]},
+        },
+    }
+
+
+def _counters():
+    counters = PostCounters()
+    counters.observe("post", [("db", [
+        _row("like-row", LIKE_ROW_WRITER, likes=["a", "b"]),
+        _row("c1", likes=["a"]),
+        _row("c2", edited="2025-01-02T00:00:00.000Z"),
+        {**_row("c3"), "archived": True},
+    ])])
+    return counters
+
+
+def _counts(counters, page_id="post"):
+    return counters.merge([{"id": page_id}])[0]["counts"]
+
+
+def test_observe_splits_post_likes_from_comments():
+    assert _counts(_counters()) == {
+        "comments": 2, "likes": 2, "comment_likes": 1, "last_activity": "2025-01-02T00:00:00.000Z",
+    }
+    assert _counts(_counters(), "unknown") is None
+
+
+def test_write_routes_adjust_counts():
+    counters = _counters()
+    counters.comment_added("db", _row("c4"))
+    counters.comment_added("db", _row("c4"))  # 같은 row 중복 반영 X
+    counters.likes_changed("c4", 3)
+    counters.likes_changed("like-row", 1)
+    counts = _counts(counters)
+    assert (counts["comments"], counts["likes"], counts["comment_likes"]) == (3, 1, 4)
+
+    counters.row_archived("c4")
+    counters.row_archived("c4")
+    counts = _counts(counters)
+    assert (counts["comments"], counts["likes"], counts["comment_likes"]) == (2, 1, 1)
+
+
+def test_first_post_like_links_a_new_like_row():
+    counters = PostCounters()
+    counters.observe("post", [("db", [_row("c1")])])
+    counters.likes_changed("new-like-row", 1, comment_db_id="db")
+    counters.likes_changed("elsewhere", 1, comment_db_id="other-db")
+    assert _counts(counters)["likes"] == 1
+
+
+def test_deleted_post_and_retain_drop_counts():
+    counters = _counters()
+    counters.observe("other", [("db2", [_row("x1")])])
+    counters.row_archived("post")
+    assert _counts(counters) is None
+    counters.comment_added("db", _row("late"))  # 삭제된 게시글의 댓글 DB는 무시
+
+    counters.retain({"unrelated"})
+    assert _counts(counters, "other") is None
+    assert counters.stats()["posts"] == 0 and counters.stats()["rows"] == 0
+
+
+def test_list_counts_fill_in_without_a_detail_view(app_module, client, monkeypatch):
+    # 서버리스(SEARCH_REINDEX_ON_START=0): 재색인이 아직 시작되지 않은 인스턴스
+    index, counters = SearchIndex(), PostCounters()
+    index.on_reindexed = counters.retain
+    monkeypatch.setattr(app_module, "search_index", index)
+    monkeypatch.setattr(app_module, "post_counters", counters)
+
+    assert client.post("/getNotificationDB", json={}).status_code == 200
+    deadline = time.monotonic() + 10
+    while index.reindexes == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    items = client.post("/getNotificationDB", json={}).get_json()["items"]
+    assert items and all(it["counts"] is not None for it in items)
+    # 시드: 게시글마다 댓글 2개, 두 번째 댓글에 좋아요 1개
+    assert {it["counts"]["comments"] for it in items} == {2}
+    assert {it["counts"]["comment_likes"] for it in items} == {1}
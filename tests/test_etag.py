@@ -0,0 +1,62 @@
+import pytest
+
+from flask_utils.etag import listing_etag, page_detail_etag
+
+
+def _listing(**changes):
+    item = {"id": "p1", "last_edited_time": "2025-01-01T00:00:00.000Z", "counts": None, **changes}
+    return {"has_more": False, "next_cursor": None, "items": [item]}
+
+
+def _detail(likes=()):
+    row = {"id": "c1", "last_edited_time": "2025-01-01T00:00:00.000Z",
+           "properties": {"like": {"multi_select": [{"name": n} for n in likes]}}}
+    return {"page": {"id": "p1", "last_edited_time": "2025-01-01T00:00:00.000Z"},
+            "comment_dbs": [{"db_id": "db1", "items": [row]}], "blocks_truncated": False}
+
+
+def test_listing_etag_follows_edits_counts_and_projection():
+    base = listing_etag(_listing())
+    assert listing_etag(_listing()) == base
+    assert listing_etag(_listing(last_edited_time="2025-01-02T00:00:00.000Z")) != base
+    assert listing_etag(_listing(counts={"comments": 1})) != base
+    assert listing_etag(_listing(), ("lean",)) != base
+
+
+def test_detail_etag_includes_likes_not_yet_in_last_edited_time():
+    # write-behind 토글은 Notion 반영 전이라 last_edited_time이 그대로여도 응답이 달라짐
+    assert page_detail_etag(_detail()) == page_detail_etag(_detail())
+    assert page_detail_etag(_detail(likes=["a"])) != page_detail_etag(_detail())
+
+
+@pytest.fixture
+def anon_post(app_module, client, monkeypatch):
+    # 재색인이 counts를 채우는 도중이면 같은 목록의 ETag가 바뀜 → 이 테스트에서는 시작하지 않음
+    monkeypatch.setattr(app_module, "_start_reindex", lambda: None)
+    items = client.post("/getAnonDB", json={"page_size": 100}).get_json()["items"]
+    return next(it for it in items if it["title"] == "익명 게시글 0")
+
+
+def test_list_revalidates_with_304_until_a_new_post(client, anon_post):
+    first = client.get("/getAnonDB?page_size=5")
+    assert first.status_code == 200 and first.headers["ETag"]
+
+    again = client.get("/getAnonDB?page_size=5", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304 and again.data == b""
+
+    client.post("/createAnon", json={"title": "ETag 테스트 글", "writer": "회장단"})
+    changed = client.get("/getAnonDB?page_size=5", headers={"If-None-Match": first.headers["ETag"]})
+    assert changed.status_code == 200 and changed.headers["ETag"] != first.headers["ETag"]
+
+
+def test_page_detail_revalidates_with_304_until_a_new_comment(client, anon_post):
+    url = f"/getAnonPage/{anon_post['id']}"
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    db_id = first.get_json()["comment_dbs"][0]["db_id"]
+    assert client.post("/addComment", json={"comment_db_id": db_id, "writer": "t", "content": "etag"}).status_code == 200
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
@@ -0,0 +1,44 @@
+from bench.fake_notion import FakeNotionStore
+from conftest import StoreClient
+from flask_utils import feed as feed_module
+from flask_utils.feed import ChangeFeed
+
+
+def _board(store, posts):
+    db = store.create_database(None, [{"text": {"content": "board"}}], {"title": {"title": {}}})
+    for i in range(posts):
+        store.create_page(db["id"], {"title": {"title": [{"text": {"content": f"글 {i}"}}]}})
+    return db["id"]
+
+
+def test_changes_beyond_first_page_are_not_skipped():
+    store = FakeNotionStore()
+    db_id = _board(store, 5)
+    client = StoreClient(store)
+    feed = ChangeFeed(client=client)
+
+    assert feed._changed(db_id) == []
+    new_ids = [store.create_page(db_id, {"title": {"title": [{"text": {"content": f"새 글 {i}"}}]}})["id"]
+               for i in range(250)]
+
+    changed = feed._changed(db_id)
+    assert [p["id"] for p, created in changed] == new_ids
+    assert all(created for _, created in changed)
+    assert feed._changed(db_id) == []
+
+
+def test_checkpoint_only_advances_past_pages_read(monkeypatch):
+    monkeypatch.setattr(feed_module, "FEED_QUERY_MAX_PAGES", 1)
+    store = FakeNotionStore()
+    db_id = _board(store, 1)
+    feed = ChangeFeed(client=StoreClient(store))
+
+    feed._changed(db_id)
+    new_ids = [store.create_page(db_id, {"title": {"title": [{"text": {"content": f"새 글 {i}"}}]}})["id"]
+               for i in range(150)]
+
+    first = [p["id"] for p, _ in feed._changed(db_id)]
+    second = [p["id"] for p, _ in feed._changed(db_id)]
+    # 첫 주기는 1장(100개)만 읽음 → 나머지는 다음 주기에 빠짐없이
+    assert 0 < len(first) <= 100
+    assert first + second == new_ids
@@ -0,0 +1,51 @@
+from bench.fake_notion import ANON_DB
+from flask_utils.idempotency import IdempotencyStore
+
+POST = {"title": "멱등성 테스트 글", "body": "본문", "writer": "회장단"}
+
+
+def _rows(store, title):
+    return [p for p in store.query(ANON_DB, {}) if p["properties"]["title"]["title"][0]["plain_text"] == title]
+
+
+def test_recover_runs_only_on_a_cache_miss():
+    store = IdempotencyStore()
+    calls = []
+    create = lambda: (calls.append("create") or {"id": 1}, 200)
+    recover = lambda: calls.append("recover")
+
+    assert store.run("k", create, recover=recover) == ({"id": 1}, 200, False)
+    assert store.run("k", create, recover=recover) == ({"id": 1}, 200, True)
+    assert calls == ["recover", "create"]
+
+
+def test_failed_recover_is_not_kept():
+    store = IdempotencyStore()
+    assert store.run("k", lambda: ({}, 200), recover=lambda: ({}, 503)) == ({}, 503, False)
+    assert store.run("k", lambda: ({"id": 1}, 200), recover=lambda: None) == ({"id": 1}, 200, False)
+
+
+def test_same_key_after_restart_returns_the_first_post(app_module, client, notion_store, monkeypatch):
+    headers = {"Idempotency-Key": "restart-1"}
+    monkeypatch.setattr(app_module, "idempotency_store", IdempotencyStore())
+    first = client.post("/createAnon", json=POST, headers=headers)
+
+    # 재시작 / 다른 인스턴스: 메모리의 결과 없음
+    monkeypatch.setattr(app_module, "idempotency_store", IdempotencyStore())
+    second = client.post("/createAnon", json=POST, headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.get_json()["page_id"] == first.get_json()["page_id"]
+    assert len(_rows(notion_store, POST["title"])) == 1
+
+
+def test_other_key_with_same_content_creates_a_new_post(app_module, client, notion_store, monkeypatch):
+    post = {**POST, "title": "같은 내용 다른 key"}
+    monkeypatch.setattr(app_module, "idempotency_store", IdempotencyStore())
+    first = client.post("/createAnon", json=post, headers={"Idempotency-Key": "a"})
+    second = client.post("/createAnon", json=post, headers={"Idempotency-Key": "b"})
+
+    assert "Idempotent-Replayed" not in second.headers
+    assert first.get_json()["page_id"] != second.get_json()["page_id"]
+    assert len(_rows(notion_store, post["title"])) == 2
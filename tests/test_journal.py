@@ -0,0 +1,99 @@
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from conftest import FakeResponse
+from flask_utils import journal as journal_module
+from flask_utils.journal import WriteJournal
+from flask_utils.provision import COMMENT_DB_SCHEMA
+
+
+class FlakyCreateClient:
+    """POST pages는 row를 만든 뒤 gateway_timeouts번까지 504를 돌려주는 Notion (요청은 도달했지만 응답 유실)"""
+
+    def __init__(self, gateway_timeouts=1):
+        self.gateway_timeouts = gateway_timeouts
+        self.rows = []
+        self.creates = 0
+        self.queries = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, path, json=None, **kwargs):
+        with self._lock:
+            self.creates += 1
+            row = {
+                "id": str(uuid.uuid4()),
+                "created_time": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+                "parent": json["parent"],
+                "properties": {
+                    name: {"type": kind, kind: [{"plain_text": t["text"]["content"]} for t in value[kind]]}
+                    for name, value in json["properties"].items()
+                    for kind in value
+                },
+            }
+            self.rows.append(row)
+            if self.gateway_timeouts:
+                self.gateway_timeouts -= 1
+                return FakeResponse(504, {"message": "gateway timeout"})
+            return FakeResponse(200, row)
+
+    def post(self, path, json=None, **kwargs):
+        with self._lock:
+            self.queries += 1
+            since = json["filter"]["created_time"]["on_or_after"]
+            return FakeResponse(200, {"results": [r for r in self.rows if r["created_time"] >= since], "has_more": False})
+
+
+def _comment(writer, content):
+    """/addComment가 만드는 payload와 같은 모양 (속성 이름은 댓글 DB 스키마 그대로)"""
+    title, text, like = COMMENT_DB_SCHEMA
+    return {
+        "parent": {"database_id": "comments"},
+        "properties": {
+            title: {"title": [{"text": {"content": writer}}]},
+            text: {"rich_text": [{"text": {"content": content}}]},
+            like: {"multi_select": []},
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def fast_retry(monkeypatch):
+    monkeypatch.setattr(journal_module, "WRITE_JOURNAL_RETRY_BASE", 0.01)
+
+
+def _wait_done(journal, n, timeout=5):
+    deadline = time.monotonic() + timeout
+    while journal.stats()["applied"] + journal.stats()["failed"] < n and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_ambiguous_create_is_not_posted_twice(tmp_path):
+    client = FlakyCreateClient(gateway_timeouts=1)
+    journal = WriteJournal(str(tmp_path / "journal.sqlite3"), client=client)
+    applied = []
+    journal.on_applied = lambda entry, result: applied.append(result["id"])
+
+    journal.append("add_comment", "comments", "POST", "pages", _comment("a", "hello"))
+    _wait_done(journal, 1)
+
+    assert client.creates == 1 and client.queries == 1
+    assert applied == [client.rows[0]["id"]]
+
+
+def test_identical_writes_are_not_matched_to_each_others_rows(tmp_path):
+    client = FlakyCreateClient(gateway_timeouts=0)
+    journal = WriteJournal(str(tmp_path / "journal.sqlite3"), client=client)
+    journal.append("add_comment", "comments", "POST", "pages", _comment("a", "ㅋㅋ"))
+    _wait_done(journal, 1)
+
+    client.gateway_timeouts = 1
+    journal.append("add_comment", "comments", "POST", "pages", _comment("a", "ㅋㅋ"))
+    _wait_done(journal, 2)
+
+    assert client.creates == 2
+    assert len({r["id"] for r in client.rows}) == 2
+    assert journal.stats()["applied"] == 2
@@ -0,0 +1,98 @@
+import threading
+
+from conftest import FakeResponse
+from flask_utils.likes import LikeAggregator
+
+
+class FakeLikeClient:
+    """좋아요 row 1개짜리 Notion (patch_statuses 순서대로 PATCH 실패를 주입)"""
+
+    def __init__(self, names=(), patch_statuses=()):
+        self.names = list(names)
+        self.patch_statuses = list(patch_statuses)
+        self.patches = 0
+        self._lock = threading.Lock()
+
+    def _page(self):
+        return {"id": "row", "parent": {"database_id": "db"},
+                "properties": {"like": {"multi_select": [{"name": n} for n in self.names]}}}
+
+    def get(self, path, **kwargs):
+        with self._lock:
+            return FakeResponse(200, self._page())
+
+    def patch(self, path, json=None, **kwargs):
+        with self._lock:
+            self.patches += 1
+            if self.patch_statuses:
+                return FakeResponse(self.patch_statuses.pop(0), {"message": "error"})
+            self.names = [x["name"] for x in json["properties"]["like"]["multi_select"]]
+            return FakeResponse(200, self._page())
+
+
+def test_sync_toggle_is_default_and_patches_immediately():
+    client = FakeLikeClient(names=["a"])
+    likes = LikeAggregator(client=client, write_behind=False)
+
+    assert likes.toggle("row", "b") == (["a", "b"], None)
+    assert client.names == ["a", "b"]
+    assert likes.toggle("row", "a") == (["b"], None)
+    assert client.names == ["b"]
+    assert likes.current("row") is None
+
+
+def test_sync_toggle_returns_failed_response():
+    client = FakeLikeClient(patch_statuses=[404])
+    names, failed = LikeAggregator(client=client, write_behind=False).toggle("row", "a")
+    assert names is None and failed.status_code == 404
+
+
+def test_flush_keeps_likes_written_elsewhere():
+    client = FakeLikeClient(names=["a"])
+    likes = LikeAggregator(client=client, write_behind=True, delay=60)
+
+    assert likes.toggle("row", "b") == (["a", "b"], None)
+    # 다른 인스턴스 / Notion UI에서 c가 좋아요, a가 취소
+    client.names = ["c"]
+    likes.flush_all()
+
+    assert client.names == ["c", "b"]
+    assert client.patches == 1
+
+
+def test_toggles_collapse_to_net_change():
+    client = FakeLikeClient(names=["a"])
+    likes = LikeAggregator(client=client, write_behind=True, delay=60)
+
+    likes.toggle("row", "b")
+    likes.toggle("row", "b")
+    likes.toggle("row", "a")
+    likes.flush_all()
+
+    assert client.names == []
+    assert client.patches == 1
+
+
+def test_non_retryable_error_drops_pending_toggles():
+    client = FakeLikeClient(names=["a"], patch_statuses=[400])
+    likes = LikeAggregator(client=client, write_behind=True, delay=60)
+
+    likes.toggle("row", "b")
+    likes.flush_all()
+
+    assert client.patches == 1
+    assert likes.stats()["dropped"] == 1
+    assert likes.current("row") is None
+
+
+def test_retryable_error_stops_after_max_attempts():
+    client = FakeLikeClient(names=["a"], patch_statuses=[503] * 10)
+    likes = LikeAggregator(client=client, write_behind=True, delay=60, max_attempts=3)
+
+    likes.toggle("row", "b")
+    for _ in range(5):
+        likes.flush_all()
+
+    assert client.patches == 3
+    assert likes.stats()["dropped"] == 1
+    assert client.names == ["a"]
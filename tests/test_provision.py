@@ -0,0 +1,43 @@
+import threading
+import time
+
+from conftest import FakeResponse
+from flask_utils.provision import CommentDbProvisioner
+
+
+class FakeProvisionClient:
+    """child_database가 없는 게시글에 댓글 DB를 만들어 주는 Notion"""
+
+    def __init__(self):
+        self.created = []
+        self._lock = threading.Lock()
+
+    def get(self, path, **kwargs):
+        return FakeResponse(200, {"results": []})
+
+    def post(self, path, json=None, **kwargs):
+        with self._lock:
+            self.created.append(json["parent"]["page_id"])
+            return FakeResponse(200, {"id": f"db-{len(self.created)}"})
+
+
+def test_failing_on_ready_does_not_stop_the_provisioner():
+    ready = []
+
+    def on_ready(page_id, db_id):
+        if page_id == "post-1":
+            raise RuntimeError("cache invalidation failed")
+        ready.append((page_id, db_id))
+
+    client = FakeProvisionClient()
+    provisioner = CommentDbProvisioner(client=client, on_ready=on_ready)
+    provisioner.enqueue("post-1")
+    provisioner.enqueue("post-2")
+
+    deadline = time.monotonic() + 5
+    while not ready and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert client.created == ["post-1", "post-2"]
+    assert ready == [("post-2", "db-2")]
+    assert provisioner.stats() == {"pending": 0, "created": 2, "failed": 0}
@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+from flask import Flask, jsonify
+from werkzeug.serving import make_server
+
+from flask_utils import client as client_module
+from flask_utils.client import NotionClient
+from flask_utils.scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, NotionScheduler
+
+
+def test_burst_then_rate_limited():
+    scheduler = NotionScheduler(rate=20, burst=2)
+    started = time.monotonic()
+    for _ in range(6):
+        scheduler.acquire()
+    # burst 2개는 바로, 나머지 4개는 20/s → 약 0.2초
+    assert 0.15 <= time.monotonic() - started < 1.0
+    assert scheduler.stats()["acquired"] == 6
+
+
+def test_interactive_waiter_goes_before_background():
+    scheduler = NotionScheduler(rate=5, burst=1)
+    scheduler.acquire()  # 토큰 소진
+    order = []
+
+    def worker(priority, name):
+        scheduler.acquire(priority)
+        order.append(name)
+
+    background = [threading.Thread(target=worker, args=(PRIORITY_BACKGROUND, f"bg{i}")) for i in range(2)]
+    for t in background:
+        t.start()
+    while scheduler.stats()["queue_depth"].get("background") != 2:
+        time.sleep(0.005)
+    interactive = threading.Thread(target=worker, args=(PRIORITY_INTERACTIVE, "ui"))
+    interactive.start()
+    for t in background + [interactive]:
+        t.join()
+
+    assert order[0] == "ui"
+
+
+def test_pause_holds_every_lane():
+    scheduler = NotionScheduler(rate=100, burst=10)
+    scheduler.pause(0.3)
+    assert not scheduler.try_acquire()
+    started = time.monotonic()
+    scheduler.acquire(PRIORITY_INTERACTIVE)
+    assert time.monotonic() - started >= 0.29
+    assert scheduler.stats()["throttled_429"] == 1
+
+
+@pytest.fixture
+def scripted_notion():
+    """요청마다 statuses를 앞에서부터 하나씩 돌려주는 서버 (비면 200)"""
+    app = Flask("scripted_notion")
+    state = {"statuses": [], "hits": 0}
+
+    @app.route("/v1/<path:path>", methods=["GET", "POST", "PATCH"])
+    def respond(path):
+        state["hits"] += 1
+        status = state["statuses"].pop(0) if state["statuses"] else 200
+        resp = jsonify({"object": "error" if status != 200 else "page", "status": status})
+        if status == 429:
+            resp.headers["Retry-After"] = "0.3"
+        return resp, status
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield state, f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+
+
+def _client(base_url):
+    return NotionClient(api_key="test", base_url=base_url, scheduler=NotionScheduler(rate=100, burst=10))
+
+
+def test_429_waits_for_retry_after_then_retries(scripted_notion, monkeypatch):
+    monkeypatch.setattr(client_module, "NOTION_BACKOFF_BASE", 0.01)
+    state, base_url = scripted_notion
+    state["statuses"] = [429]
+    client = _client(base_url)
+
+    started = time.monotonic()
+    resp = client.patch("pages/p1", json={"properties": {}})  # 쓰기도 429는 재시도
+
+    assert resp.status_code == 200 and state["hits"] == 2
+    assert time.monotonic() - started >= 0.3
+    stats = client.scheduler.stats()
+    assert stats["throttled_429"] == 1 and stats["retries"] == {"429": 1}
+
+
+def test_transient_5xx_is_retried_only_for_reads(scripted_notion, monkeypatch):
+    monkeypatch.setattr(client_module, "NOTION_BACKOFF_BASE", 0.01)
+    state, base_url = scripted_notion
+    client = _client(base_url)
+
+    state["statuses"] = [503]
+    assert client.get("pages/p1").status_code == 200
+    assert state["hits"] == 2
+
+    # 쓰기는 도달했을 수 있으므로 그대로 반환
+    state["statuses"], state["hits"] = [503], 0
+    assert client.post("pages", json={}).status_code == 503
+    assert state["hits"] == 1
@@ -0,0 +1,46 @@
+from flask_utils.search import SearchIndex, ngram_tokens, normalize_text
+
+
+def test_normalize_folds_width_and_case():
+    assert normalize_text("ＡＢＣ Flask") == "abc flask"
+    assert normalize_text(None) == ""
+
+
+def test_ngrams_are_per_word_unigrams_and_bigrams():
+    assert ngram_tokens("동아리 모집") == ["동", "아", "리", "동아", "아리", "모", "집", "모집"]
+    assert ngram_tokens("") == []
+
+
+def _index():
+    index = SearchIndex()
+    index.sync_post({"id": "p1", "board": "notification", "title": "동아리 회원 모집", "body": "신입 환영"},
+                    [{"id": "c1", "text": "저도 모집에 지원할게요"}])
+    index.sync_post({"id": "p2", "board": "anon", "title": "시험 기간", "body": "회원 모집은 다음 주에"}, [])
+    return index
+
+
+def test_korean_substring_matches_regardless_of_particles():
+    # 댓글의 "모집에"(조사 붙음)도 일치
+    index = _index()
+    assert {r["id"] for r in index.search("모집")["results"]} == {"p1", "p2", "c1"}
+    # n-gram 후보여도 검색어 단어가 실제로 들어 있지 않으면 제외
+    assert index.search("동아리회원")["total"] == 0
+    assert [r["id"] for r in index.search("동아리 회원")["results"]] == ["p1"]
+
+
+def test_title_match_ranks_above_body_match():
+    results = _index().search("회원 모집", kind="post")["results"]
+    assert [r["id"] for r in results] == ["p1", "p2"]
+    assert results[0]["field"] == "title"
+    snippet = results[0]["snippet"]
+    assert [snippet[s:e] for s, e in results[0]["highlights"]] == ["회원", "모집"]
+
+
+def test_filters_and_incremental_updates():
+    index = _index()
+    assert [r["id"] for r in index.search("모집", board="anon")["results"]] == ["p2"]
+    assert [r["id"] for r in index.search("모집", kind="comment")["results"]] == ["c1"]
+
+    index.remove("p1")  # 게시글 삭제 → 댓글도 제거
+    assert {r["id"] for r in index.search("모집")["results"]} == {"p2"}
+    assert index.search("")["total"] == 0
@@ -0,0 +1,169 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from werkzeug.serving import make_server
+
+from bench.fake_notion import FakeNotionStore, create_fake_notion
+from flask_utils.client import NotionClient
+from flask_utils.singleflight import SingleFlight
+
+N = 16
+
+
+class SlowFetcher:
+    """호출 수를 세는 느린 upstream"""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return {"value": 42}
+
+    async def acall(self):
+        with self._lock:
+            self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"value": 42}
+
+
+def test_concurrent_threads_share_one_call():
+    sf, fetch = SingleFlight(), SlowFetcher()
+    barrier = threading.Barrier(N)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(sf.do("key", fetch))
+
+    threads = [threading.Thread(target=worker) for _ in range(N)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert fetch.calls == 1
+    assert results == [{"value": 42}] * N
+    assert sf.stats() == {"in_flight": 0, "leaders": 1, "shared": N - 1}
+
+
+def test_thread_error_is_shared_and_not_cached():
+    sf = SingleFlight()
+    barrier = threading.Barrier(N)
+    calls, errors = [], []
+
+    def boom():
+        calls.append(1)
+        time.sleep(0.1)
+        raise RuntimeError("upstream failed")
+
+    def worker():
+        barrier.wait()
+        try:
+            sf.do("key", boom)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(N)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1 and len(errors) == N
+    assert sf.do("key", lambda: "fresh") == "fresh"
+
+
+def test_concurrent_tasks_share_one_call():
+    sf, fetch = SingleFlight(), SlowFetcher()
+
+    async def main():
+        return await asyncio.gather(*[sf.ado("key", fetch.acall) for _ in range(N)])
+
+    results = asyncio.run(main())
+    assert fetch.calls == 1
+    assert results == [{"value": 42}] * N
+    assert sf.stats()["in_flight"] == 0
+
+
+def test_leader_cancel_does_not_fail_followers():
+    sf, fetch = SingleFlight(), SlowFetcher()
+
+    async def main():
+        leader = asyncio.ensure_future(sf.ado("key", fetch.acall))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(sf.ado("key", fetch.acall)) for _ in range(N - 1)]
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    assert asyncio.run(main()) == [{"value": 42}] * (N - 1)
+    assert fetch.calls == 1
+
+
+def test_all_waiters_cancelled_cancels_upstream():
+    sf, fetch = SingleFlight(), SlowFetcher()
+
+    async def main():
+        tasks = [asyncio.ensure_future(sf.ado("key", fetch.acall)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert sf.stats()["in_flight"] == 0
+        # 취소된 호출을 이어받지 않고 새로 시작
+        return await sf.ado("key", fetch.acall)
+
+    assert asyncio.run(main()) == {"value": 42}
+    assert fetch.calls == 2
+
+
+@pytest.fixture
+def fake_notion():
+    store = FakeNotionStore()
+    db = store.create_database(None, [{"text": {"content": "board"}}], {"title": {"title": {}}})
+    page = store.create_page(db["id"], {"title": {"title": [{"text": {"content": "글"}}]}})
+    app = create_fake_notion(store, latency=0.2)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield app, f"http://127.0.0.1:{server.server_port}/v1", page["id"]
+    server.shutdown()
+
+
+def test_client_concurrent_reads_make_one_upstream_call(fake_notion):
+    app, base_url, page_id = fake_notion
+    client = NotionClient(api_key="test", base_url=base_url)
+    barrier = threading.Barrier(N)
+    statuses = []
+
+    def worker():
+        barrier.wait()
+        statuses.append(client.get(f"pages/{page_id}").status_code)
+
+    threads = [threading.Thread(target=worker) for _ in range(N)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert statuses == [200] * N
+    assert app.config["stats"]["requests"] == 1
+
+
+def test_client_concurrent_async_reads_make_one_upstream_call(fake_notion):
+    app, base_url, page_id = fake_notion
+    client = NotionClient(api_key="test", base_url=base_url)
+
+    async def main():
+        return await asyncio.gather(*[client.aget(f"pages/{page_id}") for _ in range(N)])
+
+    assert [r.status_code for r in asyncio.run(main())] == [200] * N
+    assert app.config["stats"]["requests"] == 1
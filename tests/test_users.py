@@ -0,0 +1,58 @@
+from bench.fake_notion import USERS_DB, FakeNotionStore, seed_store
+from conftest import StoreClient
+from flask_utils.users import UserIndex
+
+
+def _text(value):
+    return {"rich_text": [{"text": {"content": value}}]}
+
+
+def _index(users=3):
+    store = seed_store(FakeNotionStore(), posts=0, comments=0, users=users)
+    index = UserIndex(db_id=USERS_DB, client=StoreClient(store))
+    index.refresh()
+    return store, index
+
+
+def _page(store, user_id):
+    return next(p for p in store.pages.values() if p["properties"]["ID"]["rich_text"][0]["plain_text"] == user_id)
+
+
+def test_authenticate_checks_the_password_locally():
+    _, index = _index()
+    user = index.authenticate("user1", "pw1")
+    assert user["ID"] == "user1" and user["user_name"] == "사용자1" and user["user_role"] == "member"
+
+    assert index.authenticate("user1", "pw2") is None
+    assert index.knows("user1")  # 비밀번호가 틀려도 Notion을 다시 조회하지 않음
+    assert index.authenticate("nobody", "pw1") is None
+    assert not index.knows("nobody")
+
+
+def test_plain_passwords_are_not_kept():
+    _, index = _index()
+    entry = index._by_id["user0"]
+    assert "pw0" not in entry.values()
+    assert b"pw0" not in entry["digest"]
+    # 사용자마다 salt가 달라 같은 비밀번호도 digest가 다름
+    assert len({e["salt"] for e in index._by_id.values()}) == 3
+
+
+def test_refresh_picks_up_changed_users():
+    store, index = _index()
+    store.update_page(_page(store, "user0")["id"], {"properties": {"PW": _text("new-pw")}})
+    store.update_page(_page(store, "user1")["id"], {"properties": {"ID": _text("renamed")}})
+    queries = index.client.queries
+    index.refresh()
+
+    assert index.client.queries == queries + 1  # checkpoint 이후 수정된 row만 1번 조회
+    assert index.authenticate("user0", "new-pw") is not None
+    assert index.authenticate("user0", "pw0") is None
+    assert not index.knows("user1") and index.authenticate("renamed", "pw1") is not None
+
+
+def test_archived_row_is_removed():
+    store, index = _index()
+    page = store.update_page(_page(store, "user2")["id"], {"archived": True})
+    index.add(page)
+    assert not index.knows("user2")